@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+
+import heapq
+from bisect import bisect_left, bisect_right, insort
+
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is optional; without it batches are allocated row by row through the fit indexes
+    np = None
+
+# Batches with more blocks per row than this go through the fit indexes, whose
+# O(log n) lookups beat an O(n) vectorized scan per request on wide rows
+BATCH_VECTOR_BLOCKS = 4096
+
+class SortedBuckets:
+    """Sorted multiset of keys stored as a list of short sorted buckets.
+
+    Finding, inserting and removing a key costs two binary searches plus a
+    memmove inside one bucket of at most BUCKET_SIZE keys, instead of a memmove
+    across the whole collection as with a single sorted list.
+    """
+    __slots__ = ('buckets', 'maxes')
+
+    BUCKET_SIZE = 512
+
+    def __init__(self, keys=()):
+        keys = sorted(keys)
+        half = self.BUCKET_SIZE // 2
+        self.buckets = [keys[k:k + half] for k in range(0, len(keys), half)]
+        self.maxes = [bucket[-1] for bucket in self.buckets]
+
+    def __len__(self):
+        return sum(len(bucket) for bucket in self.buckets)
+
+    def insert(self, key):
+        """Add a key, splitting its bucket when it grows past BUCKET_SIZE"""
+        if not self.buckets:
+            self.buckets.append([key])
+            self.maxes.append(key)
+            return
+        b = min(bisect_left(self.maxes, key), len(self.buckets) - 1)
+        bucket = self.buckets[b]
+        insort(bucket, key)
+        self.maxes[b] = bucket[-1]
+        if len(bucket) > self.BUCKET_SIZE:
+            half = len(bucket) // 2
+            self.buckets[b:b + 1] = [bucket[:half], bucket[half:]]
+            self.maxes[b:b + 1] = [bucket[half - 1], bucket[-1]]
+
+    def ceiling(self, key):
+        """Smallest key >= key, or None"""
+        b = bisect_left(self.maxes, key)
+        if b == len(self.buckets):
+            return None
+        bucket = self.buckets[b]
+        return bucket[bisect_left(bucket, key)]
+
+    def pop_ceiling(self, key):
+        """Remove and return the smallest key >= key, or None if there is none"""
+        b = bisect_left(self.maxes, key)
+        if b == len(self.buckets):
+            return None
+        bucket = self.buckets[b]
+        found = bucket.pop(bisect_left(bucket, key))
+        if bucket:
+            self.maxes[b] = bucket[-1]
+        else:
+            del self.buckets[b]
+            del self.maxes[b]
+        return found
+
+    def remove(self, key):
+        """Remove one occurrence of a key that is known to be present"""
+        b = bisect_left(self.maxes, key)
+        bucket = self.buckets[b]
+        del bucket[bisect_left(bucket, key)]
+        if bucket:
+            self.maxes[b] = bucket[-1]
+        else:
+            del self.buckets[b]
+            del self.maxes[b]
+
+    def floor(self, key):
+        """Largest key <= key, or None"""
+        b = bisect_right(self.maxes, key)
+        if b < len(self.buckets) and self.buckets[b][0] <= key:
+            bucket = self.buckets[b]
+        elif b > 0:
+            bucket = self.buckets[b - 1]
+        else:
+            return None
+        return bucket[bisect_right(bucket, key) - 1]
+
+    def last(self):
+        """Largest key, or None when empty"""
+        return self.maxes[-1] if self.maxes else None
+
+    def __iter__(self):
+        for bucket in self.buckets:
+            yield from bucket
+
+
+class BestFitIndex:
+    """Free blocks kept sorted by (size, block number) for O(log n) best fit lookups.
+
+    Allocating from a block shrinks it in place in the block_size list it was
+    built from, exactly like the linear best_fit scan, so the leftover space
+    stays available to later requests.
+    """
+    __slots__ = ('block_size', 'by_size')
+
+    def __init__(self, block_size):
+        self.block_size = block_size
+        self.by_size = SortedBuckets((size, j) for j, size in enumerate(block_size))
+
+    def allocate(self, request):
+        """Take request units from the smallest block that fits (lowest block number on ties), or return -1"""
+        found = self.by_size.pop_ceiling((request, -1))
+        if found is None:
+            return -1
+        size, j = found
+        self.block_size[j] = size - request
+        self.by_size.insert((size - request, j))
+        return j
+
+
+class WorstFitIndex:
+    """Free blocks in a max-heap on size for O(log n) worst fit lookups.
+
+    Ties go to the lowest block number, as in the linear worst_fit scan.
+    """
+    __slots__ = ('block_size', 'heap')
+
+    def __init__(self, block_size):
+        self.block_size = block_size
+        self.heap = [(-size, j) for j, size in enumerate(block_size)]
+        heapq.heapify(self.heap)
+
+    def allocate(self, request):
+        """Take request units from the largest block (lowest block number on ties), or return -1"""
+        if not self.heap or -self.heap[0][0] < request:
+            return -1
+        size, j = -self.heap[0][0], self.heap[0][1]
+        self.block_size[j] = size - request
+        heapq.heapreplace(self.heap, (request - size, j))
+        return j
+
+
+class CapacityTree:
+    """Segment tree of maximum block capacity over block numbers.
+
+    Answers "lowest block number >= start with capacity >= k" and updates
+    one block's capacity in O(log n).
+    """
+    __slots__ = ('leaves', 'tree')
+
+    def __init__(self, capacities):
+        leaves = 1
+        while leaves < len(capacities):
+            leaves *= 2
+        self.leaves = leaves
+        # Padding leaves hold -1 so they never satisfy a request; a list indexes
+        # faster than an array here since no ints are boxed on each access
+        self.tree = [-1] * (2 * leaves)
+        self.tree[leaves:leaves + len(capacities)] = capacities
+        for node in range(leaves - 1, 0, -1):
+            self.tree[node] = max(self.tree[2 * node], self.tree[2 * node + 1])
+
+    def update(self, j, capacity):
+        tree = self.tree
+        node = j + self.leaves
+        tree[node] = capacity
+        while node > 1:
+            left = node & ~1
+            best = tree[left] if tree[left] > tree[left + 1] else tree[left + 1]
+            node >>= 1
+            if tree[node] == best:
+                # Maxima further up cannot change either
+                break
+            tree[node] = best
+
+    def leftmost_at_least(self, k, start=0):
+        """Lowest block number >= start whose capacity is at least k, or -1"""
+        tree, leaves = self.tree, self.leaves
+        if start >= leaves:
+            return -1
+        node = start + leaves
+        if tree[node] < k:
+            # Climb until a right sibling covers a block that fits
+            while True:
+                if node == 1:
+                    return -1
+                if node % 2 == 0 and tree[node + 1] >= k:
+                    node += 1
+                    break
+                node //= 2
+            # Descend to the leftmost such block
+            while node < leaves:
+                node = 2 * node if tree[2 * node] >= k else 2 * node + 1
+        return node - leaves
+
+
+class FirstFitIndex:
+    """First fit: the lowest numbered block that fits, found on a CapacityTree"""
+    __slots__ = ('block_size', 'tree')
+
+    def __init__(self, block_size):
+        self.block_size = block_size
+        self.tree = CapacityTree(block_size)
+
+    def allocate(self, request):
+        """Take request units from the first block that fits, or return -1"""
+        j = self.tree.leftmost_at_least(request)
+        if j >= 0:
+            self.block_size[j] -= request
+            self.tree.update(j, self.block_size[j])
+        return j
+
+
+class NextFitIndex:
+    """Next fit: first fit that resumes from the block of the previous allocation.
+
+    The search runs to the last block and then wraps around to the first,
+    so it visits every block once, as in the linear next fit scan.
+    """
+    __slots__ = ('block_size', 'tree', 'position')
+
+    def __init__(self, block_size):
+        self.block_size = block_size
+        self.tree = CapacityTree(block_size)
+        self.position = 0
+
+    def allocate(self, request):
+        """Take request units from the next block that fits, or return -1"""
+        j = self.tree.leftmost_at_least(request, self.position)
+        if j < 0:
+            j = self.tree.leftmost_at_least(request)
+        if j >= 0:
+            self.block_size[j] -= request
+            self.tree.update(j, self.block_size[j])
+            self.position = j
+        return j
+
+
+# Every placement policy behind the same allocate(request) -> block number interface
+FIT_POLICIES = {
+    'first': FirstFitIndex,
+    'next': NextFitIndex,
+    'best': BestFitIndex,
+    'worst': WorstFitIndex
+}
+
+def allocate_processes(index, process_size):
+    """Allocate each process in turn through a free block index; -1 marks a process that did not fit"""
+    return [index.allocate(request) for request in process_size]
+
+def fit_allocate(policy, block_size, process_size):
+    """Allocate processes to blocks with the named policy, shrinking block_size in place"""
+    if policy not in FIT_POLICIES:
+        raise ValueError(f"Unknown fit policy '{policy}'")
+    return allocate_processes(FIT_POLICIES[policy](block_size), process_size)
+
+def print_allocation(title, process_size, allocation):
+    print(f"\n=== {title} ALLOCATION ===")
+    print("Process No.\tProcess Size\tBlock No.")
+    for i in range(len(process_size)):
+        block = allocation[i] + 1 if allocation[i] != -1 else "Not Allocated"
+        print(f"{i+1}\t\t{process_size[i]}\t\t{block}")
+
+def vector_fit_step(policy, blocks, requests, position, columns, rows):
+    """Block chosen by each row for its request under the policy, or -1, using whole-array operations"""
+    fits = blocks >= requests[:, None]
+    if policy == 'best':
+        # Blocks that do not fit are pushed past every real size before taking the minimum
+        chosen = np.where(fits, blocks, np.iinfo(np.int64).max).argmin(axis=1)
+    elif policy == 'worst':
+        chosen = blocks.argmax(axis=1)
+    elif policy == 'first':
+        chosen = fits.argmax(axis=1)
+    else:
+        ahead = fits & (columns >= position[:, None])
+        chosen = np.where(ahead.any(axis=1), ahead.argmax(axis=1), fits.argmax(axis=1))
+    return np.where(fits[rows, chosen], chosen, -1)
+
+def batch_allocate(policy, block_size, process_size, show=False):
+    """Allocate a batch of processes and return (allocation, remaining block sizes).
+
+    block_size and process_size are either single rows, as taken by
+    fit_allocate, or 2-D with one independent scenario per row, which is how
+    what-if studies run many workloads in one call. Each row is allocated in
+    process order with exactly the choices fit_allocate makes; block_size is
+    left untouched. With NumPy, every step handles all scenarios at once with
+    array operations and the results are NumPy arrays; without it, or for
+    rows wider than BATCH_VECTOR_BLOCKS, rows go through the fit indexes and
+    the results are lists. Nothing is printed unless show is set.
+    """
+    if policy not in FIT_POLICIES:
+        raise ValueError(f"Unknown fit policy '{policy}'")
+    single = len(process_size) == 0 or not hasattr(process_size[0], '__len__')
+    block_rows = [block_size] if single else block_size
+    process_rows = [process_size] if single else process_size
+    if len(block_rows) != len(process_rows):
+        raise ValueError("block_size and process_size must have the same number of rows")
+
+    if np is not None and len(block_rows) and 0 < len(block_rows[0]) <= BATCH_VECTOR_BLOCKS:
+        blocks = np.array(block_rows, dtype=np.int64)
+        requests = np.array(process_rows, dtype=np.int64).reshape(len(blocks), -1)
+        allocation = np.full(requests.shape, -1, dtype=np.int64)
+        rows = np.arange(len(blocks))
+        columns = np.arange(blocks.shape[1])
+        position = np.zeros(len(blocks), dtype=np.int64)
+        # Blocks only shrink, so a request larger than every starting block never fits
+        possible = requests <= blocks.max(axis=1)[:, None]
+        for k in np.flatnonzero(possible.any(axis=0)):
+            chosen = vector_fit_step(policy, blocks, requests[:, k], position, columns, rows)
+            placed = chosen >= 0
+            blocks[rows[placed], chosen[placed]] -= requests[placed, k]
+            allocation[:, k] = chosen
+            position = np.where(placed, chosen, position)
+        remaining = blocks
+    else:
+        allocation, remaining = [], []
+        for blocks, requests in zip(block_rows, process_rows):
+            blocks = list(blocks)
+            allocation.append(fit_allocate(policy, blocks, requests))
+            remaining.append(blocks)
+
+    if show:
+        for requests, chosen in zip(process_rows, allocation):
+            print_allocation(f"BATCH {policy.upper()} FIT", requests, chosen)
+    if single:
+        return allocation[0], remaining[0]
+    return allocation, remaining
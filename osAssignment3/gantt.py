@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+
+# Pid recorded for time a CPU spends with nothing to run
+IDLE = -1
+
+# Longer charts are downsampled to this many slices when displayed
+GANTT_MAX_SEGMENTS = 100
+
+class GanttChart:
+    """Run-length encoded Gantt chart held in parallel integer arrays.
+
+    Slices must be appended in time order. A slice that continues the
+    previous one (same pid, starting where it ended) extends it instead of
+    adding a new entry, so a process that keeps the CPU across several
+    quanta costs one entry.
+    """
+    __slots__ = ('pid', 'start', 'end')
+
+    def __init__(self):
+        self.pid = array('q')
+        self.start = array('q')
+        self.end = array('q')
+
+    def __len__(self):
+        return len(self.pid)
+
+    def __iter__(self):
+        """Slices as (label, start, end) tuples"""
+        for pid, start, end in zip(self.pid, self.start, self.end):
+            yield slice_label(pid), start, end
+
+    def append(self, pid, start, end):
+        """Record that pid ran from start to end, merging with the previous slice if it continues it"""
+        if self.pid and self.pid[-1] == pid and self.end[-1] == start:
+            self.end[-1] = end
+        else:
+            self.pid.append(pid)
+            self.start.append(start)
+            self.end.append(end)
+
+    def last_end(self):
+        """End time of the last slice, 0 for an empty chart"""
+        return self.end[-1] if self.end else 0
+
+    def slice_range(self, window_start, window_end):
+        """Positions [first, last) of the slices overlapping [window_start, window_end)"""
+        return bisect_right(self.end, window_start), bisect_left(self.start, window_end)
+
+    def window(self, window_start, window_end):
+        """New chart with only the slices overlapping [window_start, window_end), clipped to it"""
+        first, last = self.slice_range(window_start, window_end)
+        chart = GanttChart()
+        for k in range(first, last):
+            chart.append(self.pid[k], max(self.start[k], window_start), min(self.end[k], window_end))
+        return chart
+
+    def pid_at(self, time):
+        """Pid running at the given time, IDLE if none"""
+        k = bisect_right(self.end, time)
+        return self.pid[k] if k < len(self.pid) and self.start[k] <= time else IDLE
+
+    def downsample(self, window_start, window_end, max_segments):
+        """At most max_segments equal-width buckets over the window, each labelled with the
+        pid running at its midpoint; returns (chart, bucket width).
+
+        Each bucket costs one binary search, so the work depends on
+        max_segments rather than on the length of the chart.
+        """
+        width = max(1, -(-(window_end - window_start) // max_segments))
+        chart = GanttChart()
+        for bucket_start in range(window_start, window_end, width):
+            bucket_end = min(bucket_start + width, window_end)
+            chart.append(self.pid_at((bucket_start + bucket_end - 1) // 2), bucket_start, bucket_end)
+        return chart, width
+
+    def nbytes(self):
+        """Memory held by the slice arrays"""
+        return sum(column.itemsize * len(column) for column in (self.pid, self.start, self.end))
+
+
+def slice_label(pid):
+    return "Idle" if pid == IDLE else f"P{pid}"
+
+def gantt_view(chart, window_start=None, window_end=None, max_segments=GANTT_MAX_SEGMENTS):
+    """The part of a chart to display, its start time and a note describing it (empty when showing everything)"""
+    full = window_start is None and window_end is None
+    window_start = 0 if window_start is None else window_start
+    window_end = chart.last_end() if window_end is None else window_end
+    first, last = chart.slice_range(window_start, window_end)
+
+    if max_segments and last - first > max_segments:
+        view, width = chart.downsample(window_start, window_end, max_segments)
+        note = (f"(time {window_start} to {window_end}: {last - first} slices downsampled, "
+                f"each showing the process running at the middle of {width} time units)")
+    elif full:
+        view, note = chart, ""
+    else:
+        view, note = chart.window(window_start, window_end), f"(time {window_start} to {window_end})"
+    return view, window_start, note
+
+def render_gantt(chart, window_start=None, window_end=None, max_segments=GANTT_MAX_SEGMENTS):
+    """Gantt chart as text: process labels, then the timeline of slice end times"""
+    view, origin, note = gantt_view(chart, window_start, window_end, max_segments)
+    parts = ["\nGANTT CHART:\n", "-" * 50, "\n"]
+    if note:
+        parts += [note, "\n"]
+    parts += [f" {label} " for label, _, _ in view]
+    parts += ["\n", str(origin)]
+    parts += [f"---{end}" for end in view.end]
+    parts.append("\n")
+    return "".join(parts)
+
+def render_gantt_spans(chart, window_start=None, window_end=None, max_segments=GANTT_MAX_SEGMENTS):
+    """Gantt chart as text on one line of 'P1: [0-3]' spans"""
+    view, _, note = gantt_view(chart, window_start, window_end, max_segments)
+    parts = [note, "\n"] if note else []
+    parts += [f"{label}: [{start}-{end}] " for label, start, end in view]
+    parts.append("\n")
+    return "".join(parts)
+
+def write_gantt(text, stream=None):
+    """Write a rendered chart with a single call"""
+    (stream or sys.stdout).write(text)
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+
+from bisect import bisect_left
+
+class BuddyAllocator:
+    """Binary buddy allocator over memory_size units split down to min_block.
+
+    Each order k holds free blocks of min_block * 2**k units in a free set,
+    with a bitmap recording which blocks of that order are free so a block's
+    buddy can be checked in O(1). Allocation splits and release merges one
+    order at a time, so both are O(log n).
+    """
+    __slots__ = ('memory_size', 'min_block', 'max_order', 'free_sets', 'free_bits',
+                 'allocated', 'free_memory', 'internal_fragmentation')
+
+    def __init__(self, memory_size, min_block=1):
+        max_order = 0
+        while min_block << max_order < memory_size:
+            max_order += 1
+        if min_block < 1 or min_block << max_order != memory_size:
+            raise ValueError("memory_size must be min_block times a power of two")
+        self.memory_size = memory_size
+        self.min_block = min_block
+        self.max_order = max_order
+        self.free_sets = [set() for _ in range(max_order + 1)]
+        self.free_bits = [bytearray(1 << (max_order - order)) for order in range(max_order + 1)]
+        # Start address -> (order, requested size) of every allocated block
+        self.allocated = {}
+        self.free_memory = memory_size
+        self.internal_fragmentation = 0
+        self.mark_free(max_order, 0)
+
+    def block_size(self, order):
+        return self.min_block << order
+
+    def order_for(self, request):
+        """Smallest order whose blocks hold request units"""
+        order = 0
+        while self.block_size(order) < request:
+            order += 1
+        return order
+
+    def mark_free(self, order, block):
+        self.free_sets[order].add(block)
+        self.free_bits[order][block] = 1
+
+    def mark_used(self, order, block):
+        self.free_sets[order].discard(block)
+        self.free_bits[order][block] = 0
+
+    def allocate(self, request):
+        """Allocate a block for request units and return its start address, or -1"""
+        if request < 1 or request > self.memory_size:
+            return -1
+        order = self.order_for(request)
+        found = next((k for k in range(order, self.max_order + 1) if self.free_sets[k]), None)
+        if found is None:
+            return -1
+
+        block = self.free_sets[found].pop()
+        self.free_bits[found][block] = 0
+        # Split down to the requested order, keeping the left half and freeing the right
+        while found > order:
+            found -= 1
+            block *= 2
+            self.mark_free(found, block + 1)
+
+        start = block * self.block_size(order)
+        self.allocated[start] = (order, request)
+        self.free_memory -= self.block_size(order)
+        self.internal_fragmentation += self.block_size(order) - request
+        return start
+
+    def free(self, start, size=None):
+        """Release the block at start, merging it with its buddy while the buddy is free"""
+        order, request = self.allocated.pop(start)
+        self.free_memory += self.block_size(order)
+        self.internal_fragmentation -= self.block_size(order) - request
+
+        block = start // self.block_size(order)
+        while order < self.max_order and self.free_bits[order][block ^ 1]:
+            self.mark_used(order, block ^ 1)
+            block //= 2
+            order += 1
+        self.mark_free(order, block)
+
+    def largest_hole(self):
+        """Size of the largest free block"""
+        for order in range(self.max_order, -1, -1):
+            if self.free_sets[order]:
+                return self.block_size(order)
+        return 0
+
+    def hole_count(self):
+        return sum(len(free) for free in self.free_sets)
+
+    def external_fragmentation(self):
+        """Share of free memory outside the largest free block, as a percentage"""
+        if self.free_memory == 0:
+            return 0.0
+        return (1 - self.largest_hole() / self.free_memory) * 100
+
+
+class SlabCache:
+    """Objects of one size class packed into slabs of slab_size units"""
+    __slots__ = ('object_size', 'per_slab', 'slabs', 'partial', 'in_use')
+
+    def __init__(self, object_size, slab_size):
+        self.object_size = object_size
+        self.per_slab = slab_size // object_size
+        # Slab start address -> stack of free slot numbers
+        self.slabs = {}
+        # Slabs with at least one free slot
+        self.partial = set()
+        self.in_use = 0
+
+
+class SlabAllocator:
+    """Slab allocator for fixed size classes, taking whole slabs from a buddy allocator.
+
+    A request is rounded up to the smallest size class that holds it and
+    placed in a free slot of a partially used slab of that class, so
+    allocation and release are O(1) apart from growing or returning a slab.
+    Empty slabs go back to the buddy allocator immediately.
+    """
+    __slots__ = ('slab_size', 'size_classes', 'caches', 'pages', 'allocated', 'requested')
+
+    def __init__(self, memory_size, slab_size=4096, size_classes=(16, 32, 64, 128, 256, 512, 1024, 2048)):
+        if any(size > slab_size for size in size_classes):
+            raise ValueError("every size class must fit in one slab")
+        self.slab_size = slab_size
+        self.size_classes = sorted(size_classes)
+        self.caches = {size: SlabCache(size, slab_size) for size in self.size_classes}
+        self.pages = BuddyAllocator(memory_size, slab_size)
+        # Object address -> (size class, requested size)
+        self.allocated = {}
+        self.requested = 0
+
+    def allocate(self, request):
+        """Allocate an object of request units and return its address, or -1"""
+        position = bisect_left(self.size_classes, request)
+        if request < 1 or position == len(self.size_classes):
+            return -1
+        cache = self.caches[self.size_classes[position]]
+
+        if cache.partial:
+            slab = next(iter(cache.partial))
+        else:
+            slab = self.pages.allocate(self.slab_size)
+            if slab < 0:
+                return -1
+            cache.slabs[slab] = list(range(cache.per_slab - 1, -1, -1))
+            cache.partial.add(slab)
+
+        free_slots = cache.slabs[slab]
+        slot = free_slots.pop()
+        if not free_slots:
+            cache.partial.discard(slab)
+        cache.in_use += 1
+
+        address = slab + slot * cache.object_size
+        self.allocated[address] = (cache.object_size, request)
+        self.requested += request
+        return address
+
+    def free(self, address, size=None):
+        """Release an object, returning its slab to the buddy allocator once the slab is empty"""
+        object_size, request = self.allocated.pop(address)
+        cache = self.caches[object_size]
+        slab = address - (address % self.slab_size)
+        free_slots = cache.slabs[slab]
+        free_slots.append((address - slab) // object_size)
+        cache.in_use -= 1
+        self.requested -= request
+
+        if len(free_slots) == cache.per_slab:
+            del cache.slabs[slab]
+            cache.partial.discard(slab)
+            self.pages.free(slab)
+        else:
+            cache.partial.add(slab)
+
+    def slab_memory(self):
+        """Memory held by slabs"""
+        return sum(len(cache.slabs) for cache in self.caches.values()) * self.slab_size
+
+    def internal_fragmentation(self):
+        """Memory inside allocated objects beyond what was requested, plus the unusable tail of each slab"""
+        rounding = sum(cache.in_use * cache.object_size for cache in self.caches.values()) - self.requested
+        tails = sum(len(cache.slabs) * (self.slab_size - cache.per_slab * cache.object_size)
+                    for cache in self.caches.values())
+        return rounding + tails
+
+    def external_fragmentation(self):
+        """Free object slots held in slabs, usable only by their own size class"""
+        return sum((len(cache.slabs) * cache.per_slab - cache.in_use) * cache.object_size
+                   for cache in self.caches.values())
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+
+import argparse
+import csv
+import heapq
+import random
+
+from allocator import SortedBuckets
+from kernel_allocators import BuddyAllocator
+
+ALLOCATION_POLICIES = ['best', 'worst', 'buddy']
+
+class DynamicAllocator:
+    """Variable partition memory with allocation, release and coalescing of holes.
+
+    Holes are indexed twice: by start address, to find the neighbours a
+    released block merges with, and by (size, start), to place requests. Both
+    lookups are O(log n) in the number of holes.
+    """
+    __slots__ = ('memory_size', 'policy', 'holes', 'by_address', 'by_size', 'free_memory')
+
+    def __init__(self, memory_size, policy='best'):
+        if policy not in ('best', 'worst'):
+            raise ValueError(f"Unknown allocation policy '{policy}'")
+        self.memory_size = memory_size
+        self.policy = policy
+        self.holes = {}
+        self.by_address = SortedBuckets()
+        self.by_size = SortedBuckets()
+        self.free_memory = 0
+        self.add_hole(0, memory_size)
+
+    def add_hole(self, start, size):
+        self.holes[start] = size
+        self.by_address.insert(start)
+        self.by_size.insert((size, start))
+        self.free_memory += size
+
+    def remove_hole(self, start):
+        size = self.holes.pop(start)
+        self.by_address.remove(start)
+        self.by_size.remove((size, start))
+        self.free_memory -= size
+        return size
+
+    def allocate(self, request):
+        """Place a request and return its start address, or -1 if no hole is large enough.
+
+        Best fit takes the smallest hole that fits, worst fit the largest;
+        ties go to the lowest address. The request is carved from the start
+        of the hole.
+        """
+        if self.policy == 'best':
+            found = self.by_size.ceiling((request, -1))
+            if found is None:
+                return -1
+        else:
+            largest = self.by_size.last()
+            if largest is None or largest[0] < request:
+                return -1
+            # Lowest address among the largest holes
+            found = self.by_size.ceiling((largest[0], -1))
+
+        size, start = found
+        self.remove_hole(start)
+        if size > request:
+            self.add_hole(start + request, size - request)
+        return start
+
+    def free(self, start, size):
+        """Release an allocated block, merging it with a free neighbour on either side"""
+        previous = self.by_address.floor(start - 1)
+        if previous is not None and previous + self.holes[previous] == start:
+            size += self.remove_hole(previous)
+            start = previous
+        if start + size in self.holes:
+            size += self.remove_hole(start + size)
+        self.add_hole(start, size)
+
+    def largest_hole(self):
+        largest = self.by_size.last()
+        return largest[0] if largest else 0
+
+    def hole_count(self):
+        return len(self.holes)
+
+    def external_fragmentation(self):
+        """Share of free memory outside the largest hole, as a percentage"""
+        if self.free_memory == 0:
+            return 0.0
+        return (1 - self.largest_hole() / self.free_memory) * 100
+
+
+def generate_allocation_trace(count, mean_size=32, mean_lifetime=50, seed=None):
+    """Synthetic trace of count allocations with exponential sizes and lifetimes.
+
+    Events are ('alloc', id, size) and ('free', id, 0); every allocation is
+    freed once its lifetime, measured in later allocations, has passed.
+    """
+    rng = random.Random(seed)
+    expiring = []
+    trace = []
+    for block_id in range(count):
+        while expiring and expiring[0][0] <= block_id:
+            _, expired = heapq.heappop(expiring)
+            trace.append(('free', expired, 0))
+        trace.append(('alloc', block_id, max(1, round(rng.expovariate(1 / mean_size)))))
+        heapq.heappush(expiring, (block_id + 1 + int(rng.expovariate(1 / mean_lifetime)), block_id))
+    while expiring:
+        trace.append(('free', heapq.heappop(expiring)[1], 0))
+    return trace
+
+def load_allocation_trace(path):
+    """Read a CSV trace of 'alloc,id,size' and 'free,id' rows"""
+    trace = []
+    with open(path, newline='') as f:
+        for line_number, row in enumerate(csv.reader(f), 1):
+            if not row or row[0].strip().lower() in ('', 'op', 'operation'):
+                continue
+            op = row[0].strip().lower()
+            if op not in ('alloc', 'free'):
+                raise ValueError(f"line {line_number}: unknown operation '{row[0]}'")
+            fields = 3 if op == 'alloc' else 2
+            if len(row) < fields or not all(field.strip() for field in row[1:fields]):
+                expected = 'alloc,id,size' if op == 'alloc' else 'free,id'
+                raise ValueError(f"line {line_number}: expected '{expected}', got '{','.join(row)}'")
+            try:
+                size = int(row[2]) if op == 'alloc' else 0
+            except ValueError:
+                raise ValueError(f"line {line_number}: size is not an integer: '{row[2]}'")
+            trace.append((op, row[1].strip(), size))
+    return trace
+
+def simulate_allocation(trace, memory_size, policy='best', sample_every=1000):
+    """Replay an alloc/free trace and return (snapshots, summary).
+
+    A snapshot is taken every sample_every events and after the last one,
+    recording memory in use, the largest hole, external fragmentation and the
+    allocation failure rate so far. Freeing a block whose allocation failed
+    is ignored. The 'buddy' policy needs memory_size to be a power of two.
+    """
+    if policy == 'buddy':
+        allocator = BuddyAllocator(memory_size)
+    else:
+        allocator = DynamicAllocator(memory_size, policy)
+    placed = {}
+    requests = failures = 0
+    peak_fragmentation = 0.0
+    snapshots = []
+
+    def snapshot(event):
+        snapshots.append({
+            'event': event,
+            'used': memory_size - allocator.free_memory,
+            'holes': allocator.hole_count(),
+            'largest_hole': allocator.largest_hole(),
+            'external_fragmentation': allocator.external_fragmentation(),
+            'failure_rate': failures / requests * 100 if requests else 0.0
+        })
+
+    for event, (op, block_id, size) in enumerate(trace, 1):
+        if op == 'alloc':
+            requests += 1
+            start = allocator.allocate(size)
+            if start < 0:
+                failures += 1
+            else:
+                placed[block_id] = (start, size)
+        elif block_id in placed:
+            allocator.free(*placed.pop(block_id))
+
+        fragmentation = allocator.external_fragmentation()
+        if fragmentation > peak_fragmentation:
+            peak_fragmentation = fragmentation
+        if event % sample_every == 0:
+            snapshot(event)
+    if not snapshots or snapshots[-1]['event'] != len(trace):
+        snapshot(len(trace))
+
+    summary = {
+        'policy': policy,
+        'memory_size': memory_size,
+        'events': len(trace),
+        'requests': requests,
+        'failures': failures,
+        'failure_rate': failures / requests * 100 if requests else 0.0,
+        'peak_external_fragmentation': peak_fragmentation
+    }
+    return snapshots, summary
+
+def print_allocation_timeline(snapshots, summary):
+    """Display fragmentation over time and the overall summary"""
+    print(f"\n{'='*74}")
+    title = "BUDDY SYSTEM" if summary['policy'] == 'buddy' else f"{summary['policy'].upper()} FIT"
+    print(f"DYNAMIC ALLOCATION - {title} (Memory: {summary['memory_size']})")
+    print(f"{'='*74}")
+    print(f"{'Event':>10}{'Used':>12}{'Holes':>8}{'Largest Hole':>14}{'Ext. Frag %':>13}{'Failure %':>12}")
+    print("-" * 74)
+    for s in snapshots:
+        print(f"{s['event']:>10}{s['used']:>12}{s['holes']:>8}{s['largest_hole']:>14}"
+              f"{s['external_fragmentation']:>13.2f}{s['failure_rate']:>12.2f}")
+    print("-" * 74)
+    print(f"Requests: {summary['requests']}, Failed: {summary['failures']} "
+          f"({summary['failure_rate']:.2f}%)")
+    print(f"Peak External Fragmentation: {summary['peak_external_fragmentation']:.2f}%")
+
+def main():
+    """Main function for the dynamic allocation simulator"""
+    parser = argparse.ArgumentParser(description="Replay alloc/free traces against a coalescing allocator")
+    parser.add_argument('--trace', help="CSV trace of 'alloc,id,size' and 'free,id' rows (default: synthetic)")
+    parser.add_argument('--memory', type=int, default=65536,
+                        help="memory size (default: 65536)")
+    parser.add_argument('--policies', nargs='+', choices=ALLOCATION_POLICIES, default=ALLOCATION_POLICIES,
+                        help="placement policies to compare (default: all)")
+    parser.add_argument('--allocations', type=int, default=100_000,
+                        help="synthetic allocations (default: 100000)")
+    parser.add_argument('--mean-size', type=float, default=32,
+                        help="synthetic mean request size (default: 32)")
+    parser.add_argument('--mean-lifetime', type=float, default=1500,
+                        help="synthetic mean lifetime, in allocations (default: 1500)")
+    parser.add_argument('--seed', type=int, default=1,
+                        help="synthetic trace seed (default: 1)")
+    parser.add_argument('--sample-every', type=int, default=20_000,
+                        help="events between timeline rows (default: 20000)")
+    args = parser.parse_args()
+
+    if args.memory < 1 or args.sample_every < 1:
+        parser.error("--memory and --sample-every must be at least 1")
+    if 'buddy' in args.policies and args.memory & (args.memory - 1):
+        parser.error("--memory must be a power of two for the buddy policy")
+
+    if args.trace:
+        trace = load_allocation_trace(args.trace)
+    else:
+        trace = generate_allocation_trace(args.allocations, args.mean_size, args.mean_lifetime, args.seed)
+
+    for policy in args.policies:
+        print_allocation_timeline(*simulate_allocation(trace, args.memory, policy, args.sample_every))
+
+if __name__ == "__main__":
+    main()
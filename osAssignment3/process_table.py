@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+
+from array import array
+
+class ProcessTable:
+    """Columnar process table shared by the scheduling simulators.
+
+    Each attribute is a typed array, so a process costs a few machine words
+    (8 bytes per column) instead of a dict with string keys.
+    """
+    __slots__ = ('pid', 'arrival', 'burst', 'priority')
+
+    def __init__(self, pids=(), arrivals=(), bursts=(), priorities=()):
+        self.pid = array('q', pids)
+        self.arrival = array('q', arrivals)
+        self.burst = array('q', bursts)
+        self.priority = array('q', priorities)
+        if not (len(self.pid) == len(self.arrival) == len(self.burst) == len(self.priority)):
+            raise ValueError("process table columns must all have the same length")
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Build a table from (pid, arrival, burst, priority) tuples"""
+        table = cls()
+        for pid, arrival, burst, priority in rows:
+            table.append(pid, arrival, burst, priority)
+        return table
+
+    def __len__(self):
+        return len(self.pid)
+
+    def append(self, pid, arrival, burst, priority=0):
+        """Add one process to the end of the table"""
+        self.pid.append(pid)
+        self.arrival.append(arrival)
+        self.burst.append(burst)
+        self.priority.append(priority)
+
+    def extend(self, other):
+        """Append every process of another table"""
+        self.pid.extend(other.pid)
+        self.arrival.extend(other.arrival)
+        self.burst.extend(other.burst)
+        self.priority.extend(other.priority)
+
+    def take(self, indices):
+        """Return a new table holding the given rows in the given order"""
+        table = ProcessTable()
+        pid, arrival, burst, priority = self.pid, self.arrival, self.burst, self.priority
+        table.pid = array('q', (pid[i] for i in indices))
+        table.arrival = array('q', (arrival[i] for i in indices))
+        table.burst = array('q', (burst[i] for i in indices))
+        table.priority = array('q', (priority[i] for i in indices))
+        return table
+
+    def arrival_order(self):
+        """Row indices sorted by arrival time, ties kept in table order, as an array"""
+        arrival = self.arrival
+        if all(arrival[k] <= arrival[k + 1] for k in range(len(arrival) - 1)):
+            # Traces and generated workloads are usually in arrival order already
+            return array('q', range(len(arrival)))
+        return array('q', sorted(range(len(arrival)), key=arrival.__getitem__))
+
+    def row(self, i):
+        """One process as a dict, for display"""
+        return {
+            'pid': self.pid[i],
+            'arrival_time': self.arrival[i],
+            'burst_time': self.burst[i],
+            'priority': self.priority[i]
+        }
+
+    def nbytes(self):
+        """Memory held by the column buffers"""
+        return sum(column.itemsize * len(column)
+                   for column in (self.pid, self.arrival, self.burst, self.priority))
+
+
+class ScheduleResult:
+    """Completion and first-run times produced by a scheduling run over a process table.
+
+    Waiting and turnaround times follow from completion, arrival and burst
+    (no process here blocks on I/O), so they are not stored.
+    """
+    __slots__ = ('table', 'completion', 'start')
+
+    def __init__(self, table, completion=None, start=None):
+        self.table = table
+        self.completion = completion if completion is not None else array('q', bytes(8 * len(table)))
+        self.start = start if start is not None else array('q', bytes(8 * len(table)))
+
+    def __len__(self):
+        return len(self.table)
+
+    def turnaround(self):
+        """Turnaround time of every process, in table order"""
+        arrival = self.table.arrival
+        return array('q', (c - a for c, a in zip(self.completion, arrival)))
+
+    def waiting(self):
+        """Waiting time of every process, in table order"""
+        arrival, burst = self.table.arrival, self.table.burst
+        return array('q', (c - a - b for c, a, b in zip(self.completion, arrival, burst)))
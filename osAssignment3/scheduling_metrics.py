@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+
+import math
+
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is optional; without it the same metrics are computed with plain Python
+    np = None
+
+PERCENTILES = (50, 95, 99)
+
+def nearest_rank(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted sequence"""
+    if len(sorted_values) == 0:
+        return 0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+def jain_index(values):
+    """Jain's fairness index: 1.0 when every value is equal, 1/n when one value holds everything"""
+    n = len(values)
+    total = sum(values)
+    squares = sum(x * x for x in values)
+    return (total * total) / (n * squares) if squares else 1.0
+
+def schedule_metrics(result, cores=1):
+    """Summary statistics of a ScheduleResult, computed column-wise over its arrays.
+
+    Fairness is Jain's index over each process's slowdown (turnaround / burst),
+    so long jobs are not counted as treated unfairly just for being long.
+    CPU utilisation is averaged over the given number of cores. An empty
+    table gives zeros for every statistic, so callers need no special case.
+    """
+    table = result.table
+    n = len(table)
+
+    if n == 0:
+        total_waiting = total_turnaround = total_response = max_waiting = makespan = busy_time = 0
+        fairness = 1.0
+        percentiles = {pct: 0 for pct in PERCENTILES}
+    elif np is not None:
+        completion = np.frombuffer(result.completion, dtype=np.int64)
+        start = np.frombuffer(result.start, dtype=np.int64)
+        arrival = np.frombuffer(table.arrival, dtype=np.int64)
+        burst = np.frombuffer(table.burst, dtype=np.int64)
+
+        turnaround = completion - arrival
+        waiting = turnaround - burst
+        response = start - arrival
+        sorted_waiting = np.sort(waiting)
+        slowdown = turnaround[burst > 0] / burst[burst > 0]
+
+        total_waiting = int(waiting.sum())
+        total_turnaround = int(turnaround.sum())
+        total_response = int(response.sum())
+        max_waiting = int(sorted_waiting[-1])
+        makespan = int(completion.max() - arrival.min())
+        busy_time = int(burst.sum())
+        slowdown_sum = float(slowdown.sum())
+        slowdown_squares = float((slowdown * slowdown).sum())
+        fairness = (slowdown_sum * slowdown_sum) / (len(slowdown) * slowdown_squares) if slowdown_squares else 1.0
+        percentiles = {pct: int(nearest_rank(sorted_waiting, pct)) for pct in PERCENTILES}
+    else:
+        completion, start = result.completion, result.start
+        arrival, burst = table.arrival, table.burst
+
+        turnaround = [c - a for c, a in zip(completion, arrival)]
+        waiting = [t - b for t, b in zip(turnaround, burst)]
+        sorted_waiting = sorted(waiting)
+
+        total_waiting = sum(waiting)
+        total_turnaround = sum(turnaround)
+        total_response = sum(s - a for s, a in zip(start, arrival))
+        max_waiting = sorted_waiting[-1]
+        makespan = max(completion) - min(arrival)
+        busy_time = sum(burst)
+        fairness = jain_index([t / b for t, b in zip(turnaround, burst) if b > 0])
+        percentiles = {pct: nearest_rank(sorted_waiting, pct) for pct in PERCENTILES}
+
+    metrics = {
+        'processes': n,
+        'avg_waiting': total_waiting / n if n else 0.0,
+        'avg_turnaround': total_turnaround / n if n else 0.0,
+        'avg_response': total_response / n if n else 0.0,
+        'max_waiting': max_waiting,
+        'makespan': makespan,
+        'throughput': n / makespan if makespan else 0.0,
+        'cpu_utilization': busy_time / (makespan * cores) * 100 if makespan else 0.0,
+        'fairness': fairness
+    }
+    for pct, value in percentiles.items():
+        metrics[f'p{pct}_waiting'] = value
+    return metrics
+
+def print_metrics(metrics):
+    """Display the extended statistics of one scheduling run"""
+    print(f"Average Response Time: {metrics['avg_response']:.2f}")
+    print(f"Waiting Time p50/p95/p99/max: {metrics['p50_waiting']}/{metrics['p95_waiting']}/"
+          f"{metrics['p99_waiting']}/{metrics['max_waiting']}")
+    print(f"Throughput: {metrics['throughput']:.4f} processes/unit time")
+    print(f"CPU Utilization: {metrics['cpu_utilization']:.2f}%")
+    print(f"Fairness (Jain's index): {metrics['fairness']:.4f}")
@@ -1,88 +1,91 @@
 
+from array import array
+
+from gantt import GanttChart, render_gantt_spans, write_gantt
+from process_table import ProcessTable, ScheduleResult
+from scheduling_metrics import print_metrics, schedule_metrics
+
 def priority_scheduling():
     """Priority Scheduling Algorithm"""
     print("=== Priority Scheduling ===")
 
-    processes = [
-        (1, 10, 3),  
-        (2, 5, 1),
-        (3, 8, 2)
-    ]
+    # (pid, arrival, burst, priority); every process arrives at time 0
+    processes = ProcessTable.from_rows([
+        (1, 0, 10, 3),
+        (2, 0, 5, 1),
+        (3, 0, 8, 2)
+    ])
 
-    processes.sort(key=lambda x: x[2])
-    wt = 0
-    total_wt = 0
-    total_tt = 0
+    processes = processes.take(sorted(range(len(processes)), key=processes.priority.__getitem__))
+    result = ScheduleResult(processes)
     
     print("\nPriority Scheduling Results:")
     print("PID\tBurst Time\tPriority\tWaiting Time\tTurnaround Time")
     
-    gantt_chart = []
+    gantt_chart = GanttChart()
     current_time = 0
     
-    for pid, bt, pr in processes:
-        tat = wt + bt
+    for i in range(len(processes)):
+        pid, bt, pr = processes.pid[i], processes.burst[i], processes.priority[i]
+        result.start[i] = current_time
+        result.completion[i] = current_time + bt
+        wt, tat = current_time, current_time + bt
         print(f"P{pid}\t{bt}\t\t{pr}\t\t{wt}\t\t{tat}")
-        gantt_chart.append((f"P{pid}", current_time, current_time + bt))
+        gantt_chart.append(pid, current_time, current_time + bt)
         current_time += bt
-        
-        total_wt += wt
-        total_tt += tat
-        wt += bt
-    print(f"\nAverage Waiting Time: {total_wt / len(processes):.2f}")
-    print(f"Average Turnaround Time: {total_tt / len(processes):.2f}")
+    
+    metrics = schedule_metrics(result)
+    print(f"\nAverage Waiting Time: {metrics['avg_waiting']:.2f}")
+    print(f"Average Turnaround Time: {metrics['avg_turnaround']:.2f}")
+    print_metrics(metrics)
     print("\nGantt Chart:")
-    for process, start, end in gantt_chart:
-        print(f"{process}: [{start}-{end}]", end=" ")
-    print()
+    write_gantt(render_gantt_spans(gantt_chart))
 
 def round_robin_scheduling():
     """Round Robin Scheduling Algorithm"""
     print("\n=== Round Robin Scheduling ===")
-    processes = [
-        [1, 10, 0],  
-        [2, 5, 0],
-        [3, 8, 0]
-    ]
+    processes = ProcessTable.from_rows([
+        (1, 0, 10, 0),
+        (2, 0, 5, 0),
+        (3, 0, 8, 0)
+    ])
     time_quantum = 3
     n = len(processes)
-    remaining_bt = [process[1] for process in processes]
-    wt = [0] * n
-    tat = [0] * n
+    pids, bursts = processes.pid, processes.burst
+    remaining_bt = array('q', bursts)
+    result = ScheduleResult(processes)
     current_time = 0
     completed = 0
-    gantt_chart = []
+    gantt_chart = GanttChart()
     while completed < n:
         for i in range(n):
             if remaining_bt[i] > 0:
+                if remaining_bt[i] == bursts[i]:
+                    result.start[i] = current_time
                 if remaining_bt[i] > time_quantum:
-                    gantt_chart.append((f"P{processes[i][0]}", current_time, current_time + time_quantum))
+                    gantt_chart.append(pids[i], current_time, current_time + time_quantum)
                     current_time += time_quantum
                     remaining_bt[i] -= time_quantum
                 else:
-                    gantt_chart.append((f"P{processes[i][0]}", current_time, current_time + remaining_bt[i]))
+                    gantt_chart.append(pids[i], current_time, current_time + remaining_bt[i])
                     current_time += remaining_bt[i]
-                    wt[i] = current_time - processes[i][1]
+                    result.completion[i] = current_time
                     remaining_bt[i] = 0
                     completed += 1
-    for i in range(n):
-        tat[i] = processes[i][1] + wt[i]
+    wt = result.waiting()
+    tat = result.turnaround()
     print("\nRound Robin Scheduling Results:")
     print("PID\tBurst Time\tWaiting Time\tTurnaround Time")
-    total_wt = 0
-    total_tat = 0
     
     for i in range(n):
-        print(f"P{processes[i][0]}\t{processes[i][1]}\t\t{wt[i]}\t\t{tat[i]}")
-        total_wt += wt[i]
-        total_tat += tat[i]
+        print(f"P{pids[i]}\t{bursts[i]}\t\t{wt[i]}\t\t{tat[i]}")
     
-    print(f"\nAverage Waiting Time: {total_wt / n:.2f}")
-    print(f"Average Turnaround Time: {total_tat / n:.2f}")
+    metrics = schedule_metrics(result)
+    print(f"\nAverage Waiting Time: {metrics['avg_waiting']:.2f}")
+    print(f"Average Turnaround Time: {metrics['avg_turnaround']:.2f}")
+    print_metrics(metrics)
     print("\nGantt Chart:")
-    for process, start, end in gantt_chart:
-        print(f"{process}: [{start}-{end}]", end=" ")
-    print()
+    write_gantt(render_gantt_spans(gantt_chart))
 
 def main():
     """Main function for CPU scheduling"""
@@ -1,43 +1,28 @@
-def best_fit(block_size, process_size):
-    allocation = [-1] * len(process_size)
+from allocator import fit_allocate, print_allocation
 
-    for i in range(len(process_size)):
-        best_index = -1
-        for j in range(len(block_size)):
-            if block_size[j] >= process_size[i]:
-                if best_index == -1 or block_size[j] < block_size[best_index]:
-                    best_index = j
 
-        if best_index != -1:
-            allocation[i] = best_index
-            block_size[best_index] -= process_size[i]
+def first_fit(block_size, process_size):
+    # Lowest numbered block that fits, found on a segment tree of block capacities
+    allocation = fit_allocate('first', block_size, process_size)
+    print_allocation("FIRST FIT", process_size, allocation)
 
-    print("\n=== BEST FIT ALLOCATION ===")
-    print("Process No.\tProcess Size\tBlock No.")
-    for i in range(len(process_size)):
-        block = allocation[i] + 1 if allocation[i] != -1 else "Not Allocated"
-        print(f"{i+1}\t\t{process_size[i]}\t\t{block}")
 
+def next_fit(block_size, process_size):
+    # Like first fit, but the search resumes at the block used last and wraps around
+    allocation = fit_allocate('next', block_size, process_size)
+    print_allocation("NEXT FIT", process_size, allocation)
 
-def worst_fit(block_size, process_size):
-    allocation = [-1] * len(process_size)
 
-    for i in range(len(process_size)):
-        worst_index = -1
-        for j in range(len(block_size)):
-            if block_size[j] >= process_size[i]:
-                if worst_index == -1 or block_size[j] > block_size[worst_index]:
-                    worst_index = j
+def best_fit(block_size, process_size):
+    # Smallest block that fits, found by binary search over blocks sorted by size
+    allocation = fit_allocate('best', block_size, process_size)
+    print_allocation("BEST FIT", process_size, allocation)
 
-        if worst_index != -1:
-            allocation[i] = worst_index
-            block_size[worst_index] -= process_size[i]
 
-    print("\n=== WORST FIT ALLOCATION ===")
-    print("Process No.\tProcess Size\tBlock No.")
-    for i in range(len(process_size)):
-        block = allocation[i] + 1 if allocation[i] != -1 else "Not Allocated"
-        print(f"{i+1}\t\t{process_size[i]}\t\t{block}")
+def worst_fit(block_size, process_size):
+    # Largest block, taken from the top of a max-heap on block size
+    allocation = fit_allocate('worst', block_size, process_size)
+    print_allocation("WORST FIT", process_size, allocation)
 
 
 if __name__ == "__main__":
@@ -49,3 +34,5 @@ if __name__ == "__main__":
 
     best_fit(block_size.copy(), process_size)
     worst_fit(block_size.copy(), process_size)
+    first_fit(block_size.copy(), process_size)
+    next_fit(block_size.copy(), process_size)
@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
 
+from kernel_allocators import BuddyAllocator, SlabAllocator
+from memory_simulator import DynamicAllocator
+
 def MFT():
     """Multiprogramming with Fixed number of Tasks (Fixed Partitions)"""
     print("\n" + "="*50)
@@ -73,6 +76,149 @@ def MVT():
     print(f"Memory Available: {available_memory}")
     print(f"Utilization: {(total_used / mem_size) * 100:.2f}%")
 
+def MVT_with_release():
+    """MVT where processes finish and release memory, with holes coalesced"""
+    print("\n" + "="*50)
+    print("MVT with Release and Coalescing (Best Fit)")
+    print("="*50)
+    
+    # Sample data for demonstration: (operation, process, size)
+    mem_size = 100
+    events = [
+        ('alloc', 1, 40), ('alloc', 2, 25), ('alloc', 3, 30),
+        ('free', 2, 0), ('alloc', 4, 15), ('free', 1, 0),
+        ('alloc', 5, 50), ('free', 3, 0), ('alloc', 6, 60)
+    ]
+    
+    memory = DynamicAllocator(mem_size, 'best')
+    placed = {}
+    requests = failures = 0
+    
+    print(f"Initial Available Memory: {mem_size}")
+    print(f"\nProcess Allocation and Release:")
+    for op, pid, psize in events:
+        if op == 'alloc':
+            requests += 1
+            start = memory.allocate(psize)
+            if start >= 0:
+                placed[pid] = (start, psize)
+                print(f"✓ Process {pid} (Size: {psize}) allocated at {start}-{start + psize - 1}")
+            else:
+                failures += 1
+                print(f"✗ Process {pid} (Size: {psize}) cannot be allocated")
+                print(f"  Required: {psize}, Available: {memory.free_memory}, Largest hole: {memory.largest_hole()}")
+        elif pid in placed:
+            start, psize = placed.pop(pid)
+            memory.free(start, psize)
+            print(f"↺ Process {pid} (Size: {psize}) released {start}-{start + psize - 1}")
+        print(f"  Holes: {sorted(memory.holes.items())}")
+    
+    # Display summary
+    print(f"\nMemory Management Summary:")
+    total_used = mem_size - memory.free_memory
+    print(f"Total Memory: {mem_size}")
+    print(f"Memory Used: {total_used}")
+    print(f"Memory Available: {memory.free_memory}")
+    print(f"Largest Hole: {memory.largest_hole()}")
+    print(f"External Fragmentation: {memory.external_fragmentation():.2f}%")
+    print(f"Allocation Failures: {failures}/{requests}")
+
+def buddy_system():
+    """Buddy system: power-of-two blocks split on allocation and merged with their buddy on release"""
+    print("\n" + "="*50)
+    print("Buddy System Allocation")
+    print("="*50)
+    
+    # Sample data for demonstration: (operation, process, size)
+    mem_size = 128
+    events = [
+        ('alloc', 1, 20), ('alloc', 2, 35), ('alloc', 3, 10),
+        ('alloc', 4, 60), ('free', 1, 0), ('free', 3, 0),
+        ('alloc', 5, 30), ('free', 2, 0), ('alloc', 6, 64)
+    ]
+    
+    memory = BuddyAllocator(mem_size, min_block=8)
+    placed = {}
+    requests = failures = 0
+    
+    print(f"Total Memory: {mem_size}, Smallest Block: {memory.min_block}")
+    print(f"\nProcess Allocation and Release:")
+    for op, pid, psize in events:
+        if op == 'alloc':
+            requests += 1
+            start = memory.allocate(psize)
+            if start >= 0:
+                placed[pid] = (start, psize)
+                block = memory.block_size(memory.order_for(psize))
+                print(f"✓ Process {pid} (Size: {psize}) allocated block {start}-{start + block - 1} "
+                      f"(Block: {block}, Wasted: {block - psize})")
+            else:
+                failures += 1
+                print(f"✗ Process {pid} (Size: {psize}) cannot be allocated")
+                print(f"  Required: {psize}, Available: {memory.free_memory}, Largest block: {memory.largest_hole()}")
+        elif pid in placed:
+            start, psize = placed.pop(pid)
+            memory.free(start)
+            print(f"↺ Process {pid} (Size: {psize}) released block at {start}")
+    
+    # Display summary
+    print(f"\nMemory Management Summary:")
+    total_used = mem_size - memory.free_memory
+    print(f"Total Memory: {mem_size}")
+    print(f"Memory Used: {total_used}")
+    print(f"Memory Available: {memory.free_memory}")
+    print(f"Total Internal Fragmentation: {memory.internal_fragmentation}")
+    print(f"External Fragmentation: {memory.external_fragmentation():.2f}%")
+    print(f"Allocation Failures: {failures}/{requests}")
+
+def slab_allocator():
+    """Slab allocation: objects of fixed size classes packed into slabs taken from a buddy allocator"""
+    print("\n" + "="*50)
+    print("Slab Allocation")
+    print("="*50)
+    
+    # Sample data for demonstration: (operation, object, size)
+    mem_size = 1024
+    slab_size = 128
+    size_classes = (16, 32, 64)
+    events = [
+        ('alloc', 1, 12), ('alloc', 2, 30), ('alloc', 3, 16),
+        ('alloc', 4, 60), ('alloc', 5, 24), ('free', 3, 0),
+        ('alloc', 6, 9), ('free', 2, 0), ('free', 5, 0),
+        ('alloc', 7, 100)
+    ]
+    
+    memory = SlabAllocator(mem_size, slab_size, size_classes)
+    placed = {}
+    requests = failures = 0
+    
+    print(f"Total Memory: {mem_size}, Slab Size: {slab_size}, Size Classes: {list(size_classes)}")
+    print(f"\nObject Allocation and Release:")
+    for op, oid, osize in events:
+        if op == 'alloc':
+            requests += 1
+            address = memory.allocate(osize)
+            if address >= 0:
+                placed[oid] = address
+                object_class = memory.allocated[address][0]
+                print(f"✓ Object {oid} (Size: {osize}) allocated at {address} in the {object_class}-unit cache")
+            else:
+                failures += 1
+                print(f"✗ Object {oid} (Size: {osize}) cannot be allocated (Largest class: {size_classes[-1]})")
+        elif oid in placed:
+            address = placed.pop(oid)
+            memory.free(address)
+            print(f"↺ Object {oid} released from {address}")
+    
+    # Display summary
+    print(f"\nMemory Management Summary:")
+    print(f"Total Memory: {mem_size}")
+    print(f"Memory in Slabs: {memory.slab_memory()}")
+    print(f"Memory Available: {memory.pages.free_memory}")
+    print(f"Total Internal Fragmentation: {memory.internal_fragmentation()}")
+    print(f"External Fragmentation (free slots in slabs): {memory.external_fragmentation()}")
+    print(f"Allocation Failures: {failures}/{requests}")
+
 def main():
     """Main function for memory management"""
     print("Memory Management Techniques - Demonstration")
@@ -80,6 +226,9 @@ def main():
     
     MFT()
     MVT()
+    MVT_with_release()
+    buddy_system()
+    slab_allocator()
 
 if __name__ == "__main__":
     main()
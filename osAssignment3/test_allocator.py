@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+
+import random
+from bisect import bisect_left, bisect_right
+
+import pytest
+
+import allocator
+from allocator import SortedBuckets, fit_allocate
+from kernel_allocators import BuddyAllocator, SlabAllocator
+from memory_simulator import DynamicAllocator, load_allocation_trace
+
+@pytest.fixture(params=[4, SortedBuckets.BUCKET_SIZE])
+def bucket_size(request, monkeypatch):
+    """Run a test with tiny buckets, so splits and emptied buckets happen often, and with the default"""
+    monkeypatch.setattr(allocator.SortedBuckets, 'BUCKET_SIZE', request.param)
+    return request.param
+
+def random_case(seed, blocks, processes):
+    rng = random.Random(seed)
+    return ([rng.randint(1, 60) for _ in range(blocks)],
+            [rng.randint(1, 70) for _ in range(processes)])
+
+def linear_fit(policy, block_size, process_size):
+    """The original scan over every block for every process, shrinking blocks in place"""
+    allocation = [-1] * len(process_size)
+    for i, request in enumerate(process_size):
+        chosen = -1
+        for j in range(len(block_size)):
+            if block_size[j] >= request:
+                if (chosen == -1
+                        or (policy == 'best' and block_size[j] < block_size[chosen])
+                        or (policy == 'worst' and block_size[j] > block_size[chosen])):
+                    chosen = j
+        if chosen != -1:
+            allocation[i] = chosen
+            block_size[chosen] -= request
+    return allocation
+
+@pytest.mark.parametrize('seed', range(10))
+def test_sorted_buckets_match_a_sorted_list(bucket_size, seed):
+    rng = random.Random(seed)
+    buckets = SortedBuckets(rng.randint(0, 100) for _ in range(50))
+    reference = sorted(buckets)
+    for _ in range(500):
+        key = rng.randint(-5, 105)
+        if rng.random() < 0.5:
+            buckets.insert(key)
+            reference.insert(bisect_left(reference, key), key)
+        elif reference and rng.random() < 0.5:
+            present = rng.choice(reference)
+            buckets.remove(present)
+            reference.remove(present)
+        else:
+            position = bisect_left(reference, key)
+            expected = reference.pop(position) if position < len(reference) else None
+            assert buckets.pop_ceiling(key) == expected
+
+        position = bisect_left(reference, key)
+        assert buckets.ceiling(key) == (reference[position] if position < len(reference) else None)
+        position = bisect_right(reference, key)
+        assert buckets.floor(key) == (reference[position - 1] if position else None)
+        assert buckets.last() == (reference[-1] if reference else None)
+        assert len(buckets) == len(reference)
+    assert list(buckets) == reference
+
+@pytest.mark.parametrize('policy', ['best', 'worst'])
+@pytest.mark.parametrize('seed', range(20))
+@pytest.mark.parametrize('blocks, processes', [(1, 5), (10, 30), (300, 600)])
+def test_indexed_fit_matches_linear_scan(bucket_size, policy, seed, blocks, processes):
+    block_size, process_size = random_case(seed, blocks, processes)
+    expected_blocks = list(block_size)
+    expected = linear_fit(policy, expected_blocks, process_size)
+    assert fit_allocate(policy, block_size, process_size) == expected
+    assert block_size == expected_blocks
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError):
+        fit_allocate('exact', [10], [5])
+
+def linear_first_next_fit(policy, block_size, process_size):
+    """Scan blocks in order from 0 (first fit) or from the block of the last allocation, wrapping (next fit)"""
+    allocation = [-1] * len(process_size)
+    position = 0
+    n = len(block_size)
+    for i, request in enumerate(process_size):
+        start = position if policy == 'next' else 0
+        for step in range(n):
+            j = (start + step) % n
+            if block_size[j] >= request:
+                allocation[i] = j
+                block_size[j] -= request
+                position = j
+                break
+    return allocation
+
+@pytest.mark.parametrize('policy', ['first', 'next'])
+@pytest.mark.parametrize('seed', range(20))
+@pytest.mark.parametrize('blocks, processes', [(1, 5), (10, 30), (300, 600), (513, 200)])
+def test_tree_fit_matches_linear_scan(policy, seed, blocks, processes):
+    block_size, process_size = random_case(seed, blocks, processes)
+    expected_blocks = list(block_size)
+    expected = linear_first_next_fit(policy, expected_blocks, process_size)
+    assert fit_allocate(policy, block_size, process_size) == expected
+    assert block_size == expected_blocks
+
+@pytest.mark.parametrize('seed', range(10))
+def test_capacity_tree_leftmost_at_least(seed):
+    rng = random.Random(seed)
+    capacities = [rng.randint(0, 30) for _ in range(37)]
+    tree = allocator.CapacityTree(capacities)
+    for _ in range(300):
+        if rng.random() < 0.4:
+            j = rng.randrange(len(capacities))
+            capacities[j] = rng.randint(0, 30)
+            tree.update(j, capacities[j])
+        k, start = rng.randint(0, 31), rng.randint(0, 40)
+        expected = next((j for j in range(start, len(capacities)) if capacities[j] >= k), -1)
+        assert tree.leftmost_at_least(k, start) == expected
+
+def free_runs(used):
+    """Maximal runs of free units as {start: size}, which is what coalesced holes must be"""
+    runs = {}
+    start = None
+    for address, taken in enumerate(list(used) + [1]):
+        if not taken and start is None:
+            start = address
+        elif taken and start is not None:
+            runs[start] = address - start
+            start = None
+    return runs
+
+@pytest.mark.parametrize('policy', ['best', 'worst'])
+@pytest.mark.parametrize('seed', range(20))
+def test_dynamic_allocator_coalesces_holes(policy, seed):
+    rng = random.Random(seed)
+    memory_size = 500
+    memory = DynamicAllocator(memory_size, policy)
+    used = bytearray(memory_size)
+    blocks = {}
+    for _ in range(400):
+        if blocks and rng.random() < 0.45:
+            start = rng.choice(list(blocks))
+            size = blocks.pop(start)
+            memory.free(start, size)
+            used[start:start + size] = bytes(size)
+        else:
+            request = rng.randint(1, 60)
+            holes = free_runs(used)
+            fitting = [(size, start) for start, size in holes.items() if size >= request]
+            if policy == 'best':
+                expected = min(fitting, default=(None, -1))[1]
+            else:
+                expected = min(fitting, key=lambda hole: (-hole[0], hole[1]), default=(None, -1))[1]
+            start = memory.allocate(request)
+            assert start == expected
+            if start >= 0:
+                blocks[start] = request
+                used[start:start + request] = b'\1' * request
+        holes = free_runs(used)
+        assert memory.holes == holes
+        assert memory.free_memory == used.count(0)
+        assert memory.largest_hole() == max(holes.values(), default=0)
+
+def test_freeing_everything_leaves_one_hole():
+    memory = DynamicAllocator(100)
+    starts = [memory.allocate(size) for size in (10, 20, 30, 40)]
+    for start, size in sorted(zip(starts, (10, 20, 30, 40)), key=lambda block: block[0] % 3):
+        memory.free(start, size)
+    assert memory.holes == {0: 100}
+    assert memory.external_fragmentation() == 0.0
+
+@pytest.mark.parametrize('text', ['alloc,a\n', 'alloc,a,\n', 'alloc,,5\n', 'free\n', 'alloc,a,big\n'])
+def test_malformed_trace_rows_name_their_line(tmp_path, text):
+    path = tmp_path / 'trace.csv'
+    path.write_text('op,id,size\nalloc,x,4\n' + text)
+    with pytest.raises(ValueError, match='line 3'):
+        load_allocation_trace(str(path))
+
+def buddy_free_blocks(buddy):
+    """Free blocks as (start, size) address ranges"""
+    return sorted((block * buddy.block_size(order), buddy.block_size(order))
+                  for order, free in enumerate(buddy.free_sets) for block in free)
+
+def assert_buddy_consistent(buddy):
+    free = buddy_free_blocks(buddy)
+    used = sorted((start, buddy.block_size(order)) for start, (order, _) in buddy.allocated.items())
+    # Free and allocated blocks are aligned to their size and tile memory exactly
+    spans = sorted(free + used)
+    assert all(start % size == 0 for start, size in spans)
+    assert [start for start, _ in spans] == [0] + [start + size for start, size in spans[:-1]]
+    assert spans[-1][0] + spans[-1][1] == buddy.memory_size
+    # Fully merged: no free block has a free buddy
+    for order, blocks in enumerate(buddy.free_sets):
+        for block in blocks:
+            assert order == buddy.max_order or block ^ 1 not in blocks
+        assert [block for block, bit in enumerate(buddy.free_bits[order]) if bit] == sorted(blocks)
+    assert buddy.free_memory == sum(size for _, size in free)
+    assert buddy.internal_fragmentation == sum(buddy.block_size(order) - request
+                                               for order, request in buddy.allocated.values())
+
+@pytest.mark.parametrize('seed', range(20))
+@pytest.mark.parametrize('memory_size, min_block', [(1024, 1), (4096, 16)])
+def test_buddy_split_and_merge_keep_blocks_consistent(seed, memory_size, min_block):
+    rng = random.Random(seed)
+    buddy = BuddyAllocator(memory_size, min_block)
+    for _ in range(300):
+        if buddy.allocated and rng.random() < 0.45:
+            buddy.free(rng.choice(list(buddy.allocated)))
+        else:
+            request = rng.randint(1, memory_size // 4)
+            order = buddy.order_for(request)
+            fits = any(buddy.free_sets[k] for k in range(order, buddy.max_order + 1))
+            start = buddy.allocate(request)
+            assert (start >= 0) == fits
+            if start >= 0:
+                assert buddy.block_size(order) >= request > buddy.block_size(order) // 2 or order == 0
+        assert_buddy_consistent(buddy)
+
+    for start in list(buddy.allocated):
+        buddy.free(start)
+    assert buddy.free_sets[buddy.max_order] == {0} and buddy.hole_count() == 1
+
+def test_buddy_rejects_sizes_that_are_not_a_power_of_two():
+    with pytest.raises(ValueError):
+        BuddyAllocator(1000)
+    assert BuddyAllocator(64).allocate(65) == -1
+
+@pytest.mark.parametrize('seed', range(20))
+def test_slab_allocator_reuses_slots_and_returns_empty_slabs(seed):
+    rng = random.Random(seed)
+    slab = SlabAllocator(64 * 1024, 1024, (16, 48, 100, 1024))
+    live = {}
+    for _ in range(600):
+        if live and rng.random() < 0.45:
+            address = rng.choice(list(live))
+            object_size = live.pop(address)
+            slab.free(address)
+            # While the class has a slab with a free slot, a request reuses it instead of taking a new slab
+            cache = slab.caches[object_size]
+            if cache.partial and rng.random() < 0.5:
+                slab_memory = slab.slab_memory()
+                again = slab.allocate(object_size)
+                assert again not in live and slab.slab_memory() == slab_memory
+                assert again - again % slab.slab_size in cache.slabs
+                live[again] = object_size
+        else:
+            request = rng.randint(1, 1100)
+            address = slab.allocate(request)
+            if request > 1024:
+                assert address == -1
+            elif address >= 0:
+                object_size = min(size for size in slab.size_classes if size >= request)
+                live[address] = object_size
+                # Objects never straddle a slab and never overlap
+                assert address % slab.slab_size + object_size <= slab.slab_size
+
+        objects = sorted((address, size) for address, size in live.items())
+        assert all(a + size <= b for (a, size), (b, _) in zip(objects, objects[1:]))
+        # Every slab held is in use, and the slab pages match the buddy allocator's view
+        slabs = {address - address % slab.slab_size for address in live}
+        assert set(slab.pages.allocated) == slabs
+        assert slab.slab_memory() == len(slabs) * slab.slab_size
+        assert slab.external_fragmentation() == sum(
+            (len(cache.slabs) * cache.per_slab - cache.in_use) * size for size, cache in slab.caches.items())
+        assert_buddy_consistent(slab.pages)
+
+    for address in list(live):
+        slab.free(address)
+    assert slab.slab_memory() == 0 and slab.internal_fragmentation() == 0
+
+def expected_batch(policy, block_rows, process_rows):
+    """Each scenario allocated on its own by fit_allocate"""
+    allocation, remaining = [], []
+    for blocks, requests in zip(block_rows, process_rows):
+        blocks = list(blocks)
+        allocation.append(fit_allocate(policy, blocks, requests))
+        remaining.append(blocks)
+    return allocation, remaining
+
+def random_batch(seed, scenarios, blocks, processes):
+    cases = [random_case(seed * 1000 + row, blocks, processes) for row in range(scenarios)]
+    return [case[0] for case in cases], [case[1] for case in cases]
+
+@pytest.mark.parametrize('policy', list(allocator.FIT_POLICIES))
+@pytest.mark.parametrize('seed', range(10))
+@pytest.mark.parametrize('scenarios, blocks, processes', [(1, 1, 5), (7, 10, 30), (40, 50, 80)])
+def test_vectorized_batch_matches_fit_allocate(policy, seed, scenarios, blocks, processes):
+    np = pytest.importorskip('numpy')
+    block_rows, process_rows = random_batch(seed, scenarios, blocks, processes)
+    original = [list(row) for row in block_rows]
+    allocation, remaining = allocator.batch_allocate(policy, np.array(block_rows), process_rows)
+    expected_allocation, expected_remaining = expected_batch(policy, block_rows, process_rows)
+    assert allocation.tolist() == expected_allocation
+    assert remaining.tolist() == expected_remaining
+    assert block_rows == original
+
+@pytest.mark.parametrize('policy', list(allocator.FIT_POLICIES))
+@pytest.mark.parametrize('seed', range(5))
+def test_batch_without_vectorizing_matches_fit_allocate(monkeypatch, policy, seed):
+    # Rows go through the fit indexes without NumPy, and with NumPy when they are too wide
+    monkeypatch.setattr(allocator, 'BATCH_VECTOR_BLOCKS', 5)
+    block_rows, process_rows = random_batch(seed, 6, 10, 30)
+    for numpy_module in [None, allocator.np]:
+        monkeypatch.setattr(allocator, 'np', numpy_module)
+        allocation, remaining = allocator.batch_allocate(policy, block_rows, process_rows)
+        assert (allocation, remaining) == expected_batch(policy, block_rows, process_rows)
+
+def test_single_row_batch_is_one_scenario():
+    block_size, process_size = random_case(3, 10, 30)
+    allocation, remaining = allocator.batch_allocate('best', block_size, process_size)
+    expected_allocation, expected_remaining = expected_batch('best', [block_size], [process_size])
+    assert list(allocation) == expected_allocation[0]
+    assert list(remaining) == expected_remaining[0]
+
+def test_batch_rows_must_pair_up():
+    with pytest.raises(ValueError):
+        allocator.batch_allocate('first', [[10], [20]], [[5]])
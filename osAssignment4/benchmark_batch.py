@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+
+import argparse
+import contextlib
+import json
+import math
+import os
+import shutil
+import tempfile
+import time
+
+from task1 import (
+    DEFAULT_JOB_POLICY,
+    create_warm_pool,
+    execute_python_file_streaming,
+    parallel_batch_execution,
+    run_job_in_subprocess,
+    sequential_batch_execution
+)
+
+# Script bodies for each synthetic job mix
+JOB_MIXES = {
+    'cpu': '''
+total = 0
+for i in range(2_000_000):
+    total += i * i % 7
+print(total)
+''',
+    'sleep': '''
+import time
+print("Simulating file operations...")
+time.sleep(0.5)
+print("done")
+''',
+    'output': '''
+for i in range(50_000):
+    print(f"line {i}: " + "x" * 60)
+''',
+    'startup': '''
+print("hello")
+'''
+}
+
+EXECUTION_MODES = ['sequential', 'threaded', 'streaming', 'warm-pool']
+
+def create_job_mix(directory, mix, count):
+    """Write count copies of a synthetic job script and return their job specs"""
+    jobs = []
+    for i in range(count):
+        filename = os.path.join(directory, f"{mix}_{i}.py")
+        with open(filename, 'w') as f:
+            f.write(JOB_MIXES[mix])
+        jobs.append({
+            'name': f"{mix}_{i}",
+            'filename': filename,
+            'description': f"{mix} job {i}",
+            'depends_on': []
+        })
+    return jobs
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+def run_mode(mode, jobs, workers):
+    """Run one job mix under one execution mode and return its measurements"""
+    pool = None
+    run_attempt = lambda job: run_job_in_subprocess(job, DEFAULT_JOB_POLICY)
+    if mode == 'warm-pool':
+        pool = create_warm_pool(workers, 100)
+        # Start the workers before timing, as a long-lived pool would be
+        pool.warm_up()
+        run_attempt = lambda job: pool.run(job['filename'])
+    elif mode == 'streaming':
+        run_attempt = lambda job: execute_python_file_streaming(job)
+    
+    finish_times = {}
+    def run_job(job):
+        result = run_attempt(job)
+        finish_times[job['name']] = time.time()
+        return result
+    
+    start_time = time.time()
+    try:
+        # The runners report every job; the benchmark only wants the numbers
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            if mode == 'sequential':
+                results = sequential_batch_execution(jobs, run_job, job_delay=0)
+            else:
+                results = parallel_batch_execution(jobs, workers, run_job)
+        # Stop the clock at the last result; pool shutdown is not part of the batch
+        makespan = time.time() - start_time
+    finally:
+        if pool is not None:
+            pool.close()
+    
+    latencies = [finish_times[job['name']] - start_time for job in jobs if job['name'] in finish_times]
+    return {
+        'jobs': len(jobs),
+        'failed': sum(1 for result in results if result['status'] != 'SUCCESS'),
+        'makespan': makespan,
+        'throughput': len(jobs) / makespan if makespan > 0 else 0.0,
+        'p50': percentile(latencies, 50),
+        'p95': percentile(latencies, 95),
+        'p99': percentile(latencies, 99)
+    }
+
+def run_benchmark(mixes, modes, jobs_per_mix, workers):
+    """Run every job mix under every execution mode"""
+    rows = []
+    work_dir = tempfile.mkdtemp(prefix='batch_bench_')
+    try:
+        for mix in mixes:
+            jobs = create_job_mix(work_dir, mix, jobs_per_mix)
+            for mode in modes:
+                print(f"Running {mix} mix in {mode} mode...")
+                row = {'mix': mix, 'mode': mode, 'workers': 1 if mode == 'sequential' else workers}
+                row.update(run_mode(mode, jobs, workers))
+                rows.append(row)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return rows
+
+def print_results_table(rows):
+    """Display benchmark results as a table"""
+    print(f"\n{'='*86}")
+    print("BATCH EXECUTION BENCHMARK RESULTS")
+    print(f"{'='*86}")
+    print(f"{'Mix':<9}{'Mode':<12}{'Workers':>8}{'Jobs':>6}{'Failed':>8}{'Makespan':>11}"
+          f"{'Jobs/s':>9}{'p50':>8}{'p95':>8}{'p99':>8}")
+    print("-" * 86)
+    for row in rows:
+        print(f"{row['mix']:<9}{row['mode']:<12}{row['workers']:>8}{row['jobs']:>6}{row['failed']:>8}"
+              f"{row['makespan']:>10.2f}s{row['throughput']:>9.2f}"
+              f"{row['p50']:>7.2f}s{row['p95']:>7.2f}s{row['p99']:>7.2f}s")
+    print("-" * 86)
+    print("Latency is measured from batch start to job completion.")
+
+def main():
+    """Main function for the batch execution benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark batch execution modes on synthetic job mixes")
+    parser.add_argument('--jobs', type=int, default=20,
+                        help="jobs per mix (default: 20)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="workers for the parallel modes (default: CPU count)")
+    parser.add_argument('--mixes', nargs='+', choices=list(JOB_MIXES), default=list(JOB_MIXES),
+                        help="job mixes to run (default: all)")
+    parser.add_argument('--modes', nargs='+', choices=EXECUTION_MODES, default=EXECUTION_MODES,
+                        help="execution modes to compare (default: all)")
+    parser.add_argument('--output', default='benchmark_results.json',
+                        help="JSON file to write results to (default: benchmark_results.json)")
+    args = parser.parse_args()
+    
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    
+    rows = run_benchmark(args.mixes, args.modes, args.jobs, args.workers)
+    print_results_table(rows)
+    
+    with open(args.output, 'w') as f:
+        json.dump({
+            'date': time.ctime(),
+            'jobs_per_mix': args.jobs,
+            'workers': args.workers,
+            'results': rows
+        }, f, indent=2)
+    print(f"\nResults saved to: {args.output}")
+
+if __name__ == "__main__":
+    main()
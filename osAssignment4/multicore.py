@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+
+import argparse
+import heapq
+import time
+from array import array
+from collections import deque
+
+from gantt import IDLE, GanttChart
+from process_table import ProcessTable, ScheduleResult
+from scheduling_metrics import schedule_metrics
+from workload import BURST_DISTRIBUTIONS, generate_workload
+
+QUEUE_MODES = ['global', 'per-core']
+BALANCE_POLICIES = ['steal', 'periodic', 'none']
+
+def take_unpinned(queue, pinned):
+    """Remove and return the newest waiting process that is not pinned to a core, or -1"""
+    for position in range(len(queue) - 1, -1, -1):
+        i = queue[position]
+        if pinned[i] < 0:
+            del queue[position]
+            return i
+    return -1
+
+def multicore_schedule(table, cores, time_quantum, mode='per-core', balance='steal',
+                       balance_interval=10, affinity=None):
+    """Simulate Round Robin on several cores and return (result, gantt_charts, busy_time, migrations).
+
+    mode 'global' shares one run queue between all cores; 'per-core' gives each
+    core its own queue and places a new process on the least loaded core.
+    Per-core queues are kept even either by work stealing (an idle core takes
+    the newest waiting process from the longest queue) or by periodic
+    balancing every balance_interval time units. affinity maps a pid to the
+    only core it may run on. The simulation only does work at arrivals, slice
+    ends and balancing ticks; one core with either mode is plain Round Robin.
+    """
+    if cores < 1 or time_quantum < 1:
+        raise ValueError("cores and time_quantum must be at least 1")
+    if mode not in QUEUE_MODES:
+        raise ValueError(f"Unknown queue mode '{mode}'")
+    if balance not in BALANCE_POLICIES:
+        raise ValueError(f"Unknown balancing policy '{balance}'")
+
+    result = ScheduleResult(table)
+    pid, arrival, burst = table.pid, table.arrival, table.burst
+    completion, start = result.completion, result.start
+    remaining = array('q', burst)
+    n = len(table)
+
+    # Core each process is pinned to (-1 for none) and the core it last ran on
+    pinned = array('q', [-1]) * n
+    if affinity:
+        index_of = {pid[i]: i for i in range(n)}
+        for process, core in affinity.items():
+            if process in index_of:
+                if not 0 <= core < cores:
+                    raise ValueError(f"P{process} is pinned to core {core}, which does not exist")
+                pinned[index_of[process]] = core
+    last_core = array('q', [-1]) * n
+    has_affinity = any(core >= 0 for core in pinned)
+
+    queues = [deque()] if mode == 'global' else [deque() for _ in range(cores)]
+    running = [-1] * cores
+    idle = set(range(cores))
+    gantt_charts = [GanttChart() for _ in range(cores)]
+    busy_time = [0] * cores
+    migrations = 0
+    waiting = 0
+
+    # Per-core load (waiting plus running) with a lazily updated min-heap on (load, core)
+    # for placing new processes, and the cores that gained work since the last dispatch
+    load = [0] * cores
+    load_heap = [(0, core) for core in range(cores)]
+    cores_with_work = set()
+
+    # Slice ends as a min-heap on (end time, core)
+    slice_ends = []
+    next_balance = balance_interval if mode == 'per-core' and balance == 'periodic' else None
+
+    arrival_order = table.arrival_order()
+    cursor = 0
+    completed = 0
+    current_time = 0
+
+    def queue_of(core):
+        return queues[0] if mode == 'global' else queues[core]
+
+    def change_load(core, delta):
+        load[core] += delta
+        heapq.heappush(load_heap, (load[core], core))
+
+    def enqueue(core, i):
+        nonlocal waiting
+        queue_of(core).append(i)
+        waiting += 1
+        cores_with_work.add(core)
+
+    def place(i):
+        """Queue a new process: its pinned core, else the core with the least work"""
+        if mode == 'global':
+            enqueue(0, i)
+            return
+        core = pinned[i]
+        if core < 0:
+            while load_heap[0][0] != load[load_heap[0][1]]:
+                heapq.heappop(load_heap)
+            core = load_heap[0][1]
+        enqueue(core, i)
+        change_load(core, 1)
+
+    def next_for(core):
+        """Remove and return the next process this core may run, or -1"""
+        nonlocal waiting
+        queue = queue_of(core)
+        if not queue:
+            return -1
+        if mode == 'global' and has_affinity:
+            for position, i in enumerate(queue):
+                if pinned[i] < 0 or pinned[i] == core:
+                    del queue[position]
+                    waiting -= 1
+                    return i
+            return -1
+        waiting -= 1
+        return queue.popleft()
+
+    def dispatch(core, i):
+        """Start a slice of process i on core at current_time"""
+        nonlocal migrations
+        if last_core[i] >= 0 and last_core[i] != core:
+            migrations += 1
+        last_core[i] = core
+        if remaining[i] == burst[i]:
+            # First time on a CPU, which is what response time measures
+            start[i] = current_time
+        end_time = current_time + min(time_quantum, remaining[i])
+
+        # Per-core Gantt chart, with idle gaps shown
+        chart = gantt_charts[core]
+        if chart.last_end() < current_time:
+            chart.append(IDLE, chart.last_end(), current_time)
+        chart.append(pid[i], current_time, end_time)
+
+        running[core] = i
+        idle.discard(core)
+        busy_time[core] += end_time - current_time
+        heapq.heappush(slice_ends, (end_time, core))
+
+    def migrate(source, target):
+        """Move the newest unpinned waiting process from one core's queue to another's, if any"""
+        nonlocal waiting
+        i = take_unpinned(queues[source], pinned)
+        if i >= 0:
+            waiting -= 1
+            change_load(source, -1)
+            change_load(target, 1)
+        return i
+
+    def rebalance():
+        """Move waiting processes from the longest to the shortest queue until they differ by at most one"""
+        while True:
+            longest = max(range(cores), key=lambda c: len(queues[c]))
+            shortest = min(range(cores), key=lambda c: len(queues[c]))
+            if len(queues[longest]) - len(queues[shortest]) <= 1:
+                return
+            i = migrate(longest, shortest)
+            if i < 0:
+                return
+            enqueue(shortest, i)
+
+    while completed < n:
+        # Slices ending now, in core order
+        requeue = []
+        while slice_ends and slice_ends[0][0] == current_time:
+            _, core = heapq.heappop(slice_ends)
+            i = running[core]
+            running[core] = -1
+            idle.add(core)
+            cores_with_work.add(core)
+            remaining[i] -= min(time_quantum, remaining[i])
+            if remaining[i] > 0:
+                requeue.append((core, i))
+            else:
+                completion[i] = current_time
+                completed += 1
+                if mode == 'per-core':
+                    change_load(core, -1)
+
+        # New arrivals are queued ahead of preempted processes, as in single-core Round Robin.
+        # While every core is busy (a balancing tick mid-slice) they wait for the next slice end
+        arrived = []
+        while idle and cursor < n and arrival[arrival_order[cursor]] <= current_time:
+            arrived.append(arrival_order[cursor])
+            cursor += 1
+        for i in sorted(arrived):
+            place(i)
+        for core, i in requeue:
+            enqueue(core, i)
+
+        if next_balance is not None and current_time >= next_balance:
+            rebalance()
+            while next_balance <= current_time:
+                next_balance += balance_interval
+
+        # Idle cores take work from their own queue, then (with stealing) from the longest other queue
+        if mode == 'global':
+            for core in sorted(idle):
+                if not waiting:
+                    break
+                i = next_for(core)
+                if i >= 0:
+                    dispatch(core, i)
+        else:
+            for core in sorted(cores_with_work):
+                if running[core] < 0:
+                    i = next_for(core)
+                    if i >= 0:
+                        dispatch(core, i)
+            if balance == 'steal' and waiting:
+                for core in sorted(idle):
+                    victim = max(range(cores), key=lambda c: len(queues[c]))
+                    if not queues[victim]:
+                        # Nothing waiting anywhere
+                        break
+                    i = migrate(victim, core)
+                    if i >= 0:
+                        dispatch(core, i)
+        cores_with_work.clear()
+
+        # Advance to the next event; while every core is busy, arrivals wait for the next slice end
+        candidates = []
+        if slice_ends:
+            candidates.append(slice_ends[0][0])
+        if cursor < n and idle:
+            candidates.append(arrival[arrival_order[cursor]])
+        if next_balance is not None and waiting:
+            candidates.append(next_balance)
+        if not candidates:
+            if completed < n:
+                raise ValueError("some processes are pinned to cores that never become free")
+            break
+        current_time = min(candidates)
+
+    return result, gantt_charts, busy_time, migrations
+
+def core_utilization(result, busy_time):
+    """Percentage of the schedule's makespan each core spent running processes"""
+    table = result.table
+    if len(table) == 0:
+        return [0.0] * len(busy_time)
+    makespan = max(result.completion) - min(table.arrival)
+    return [busy / makespan * 100 if makespan else 0.0 for busy in busy_time]
+
+def scaling_study(table, core_counts, time_quantum, mode, balance, balance_interval):
+    """Simulate the same workload on each core count and return one metrics row per count"""
+    rows = []
+    for cores in core_counts:
+        start_time = time.perf_counter()
+        result, _, busy_time, migrations = multicore_schedule(table, cores, time_quantum, mode,
+                                                              balance, balance_interval)
+        row = {'cores': cores, 'migrations': migrations,
+               'simulation_time': time.perf_counter() - start_time}
+        row.update(schedule_metrics(result, cores))
+        rows.append(row)
+    return rows
+
+def print_scaling_table(rows):
+    """Display how latency and utilisation change with the number of cores"""
+    print(f"\n{'='*88}")
+    print("MULTI-CORE SCALING")
+    print(f"{'='*88}")
+    print(f"{'Cores':>6}{'Avg WT':>10}{'Avg TAT':>10}{'Resp':>10}{'p95 WT':>9}{'p99 WT':>9}"
+          f"{'CPU %':>9}{'Migrations':>12}{'Sim':>9}")
+    print("-" * 88)
+    for row in rows:
+        print(f"{row['cores']:>6}{row['avg_waiting']:>10.2f}{row['avg_turnaround']:>10.2f}"
+              f"{row['avg_response']:>10.2f}{row['p95_waiting']:>9}{row['p99_waiting']:>9}"
+              f"{row['cpu_utilization']:>9.2f}{row['migrations']:>12}{row['simulation_time']:>8.2f}s")
+    print("-" * 88)
+
+def main():
+    """Main function for the multi-core scaling study"""
+    parser = argparse.ArgumentParser(description="Simulate one workload on increasing numbers of cores")
+    parser.add_argument('--cores', nargs='+', type=int, default=[8, 16, 32, 64],
+                        help="core counts to simulate (default: 8 16 32 64)")
+    parser.add_argument('--quantum', type=int, default=4,
+                        help="Round Robin time quantum (default: 4)")
+    parser.add_argument('--mode', choices=QUEUE_MODES, default='per-core',
+                        help="shared run queue or one queue per core (default: per-core)")
+    parser.add_argument('--balance', choices=BALANCE_POLICIES, default='steal',
+                        help="how per-core queues are kept even (default: steal)")
+    parser.add_argument('--balance-interval', type=int, default=10,
+                        help="time units between periodic balancing runs (default: 10)")
+    parser.add_argument('--processes', type=int, default=100_000,
+                        help="synthetic processes to generate (default: 100000)")
+    parser.add_argument('--arrival-rate', type=float, default=1.2,
+                        help="arrivals per time unit (default: 1.2)")
+    parser.add_argument('--distribution', choices=BURST_DISTRIBUTIONS, default='exponential',
+                        help="burst time distribution (default: exponential)")
+    parser.add_argument('--mean-burst', type=float, default=5.0,
+                        help="mean burst time (default: 5)")
+    parser.add_argument('--seed', type=int, default=1,
+                        help="workload seed (default: 1)")
+    args = parser.parse_args()
+
+    if any(cores < 1 for cores in args.cores) or args.quantum < 1 or args.balance_interval < 1:
+        parser.error("--cores, --quantum and --balance-interval must be at least 1")
+
+    table = ProcessTable()
+    for chunk in generate_workload(args.processes, args.arrival_rate, args.distribution,
+                                   args.mean_burst, seed=args.seed):
+        table.extend(chunk)
+    print(f"Workload: {len(table)} processes, {args.distribution} bursts (mean {args.mean_burst}), "
+          f"{args.arrival_rate} arrivals per time unit")
+    print(f"Round Robin quantum {args.quantum}, {args.mode} queues, balancing: {args.balance}")
+
+    rows = scaling_study(table, args.cores, args.quantum, args.mode, args.balance, args.balance_interval)
+    print_scaling_table(rows)
+
+if __name__ == "__main__":
+    main()
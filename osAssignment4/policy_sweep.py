@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import os
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+from process_table import ProcessTable
+from scheduling_metrics import schedule_metrics
+from task5 import MLFQ_BOOST_INTERVAL, MLFQ_LEVELS, CPUScheduler
+from workload import BURST_DISTRIBUTIONS, generate_workload, load_trace
+
+SWEEP_ALGORITHMS = ['FCFS', 'SJF', 'Priority', 'RR', 'SRTF', 'PreemptivePriority', 'MLFQ']
+
+# Algorithms that take a time quantum (the top-level quantum for MLFQ); the others run once per workload
+QUANTUM_ALGORITHMS = {'RR', 'MLFQ'}
+
+COLUMNS = ('pid', 'arrival', 'burst', 'priority')
+
+# Workloads a worker has already copied out of shared memory, by segment name
+attached_workloads = {}
+
+def share_workload(table):
+    """Copy a process table into a new shared memory segment, one column after another"""
+    n = len(table)
+    segment = shared_memory.SharedMemory(create=True, size=max(1, 8 * n * len(COLUMNS)))
+    for k, name in enumerate(COLUMNS):
+        segment.buf[8 * n * k:8 * n * (k + 1)] = memoryview(getattr(table, name)).cast('B')
+    return segment
+
+def attach_workload(segment_name, n):
+    """Read a shared workload once per worker process and keep it for later tasks"""
+    table = attached_workloads.get(segment_name)
+    if table is None:
+        segment = shared_memory.SharedMemory(name=segment_name)
+        try:
+            table = ProcessTable()
+            for k, name in enumerate(COLUMNS):
+                column = array('q')
+                column.frombytes(segment.buf[8 * n * k:8 * n * (k + 1)])
+                setattr(table, name, column)
+        finally:
+            segment.close()
+        attached_workloads[segment_name] = table
+    return table
+
+def run_policy(scheduler, algorithm, quantum):
+    """Run one algorithm quietly on the scheduler's processes and return its ScheduleResult"""
+    if algorithm == 'FCFS':
+        result, _ = scheduler.fcfs_schedule()
+    elif algorithm == 'SJF':
+        result, _ = scheduler.non_preemptive_schedule(scheduler.processes.burst)
+    elif algorithm == 'Priority':
+        result, _ = scheduler.non_preemptive_schedule(scheduler.processes.priority)
+    elif algorithm == 'RR':
+        result, _ = scheduler.round_robin_schedule(quantum)
+    elif algorithm == 'SRTF':
+        result, _ = scheduler.preemptive_schedule()
+    elif algorithm == 'PreemptivePriority':
+        result, _ = scheduler.preemptive_schedule(scheduler.processes.priority)
+    elif algorithm == 'MLFQ':
+        quanta = [quantum * 2 ** k for k in range(MLFQ_LEVELS)]
+        result, _, _ = scheduler.mlfq_schedule(quanta, MLFQ_BOOST_INTERVAL)
+    else:
+        raise ValueError(f"Unknown algorithm '{algorithm}'")
+    return result
+
+def run_sweep_task(workload, segment_name, n, algorithm, quantum):
+    """Simulate one grid point in a worker process and return its results row"""
+    scheduler = CPUScheduler()
+    scheduler.processes = attach_workload(segment_name, n)
+
+    start_time = time.perf_counter()
+    result = run_policy(scheduler, algorithm, quantum)
+    simulation_time = time.perf_counter() - start_time
+
+    row = {'workload': workload, 'algorithm': algorithm, 'quantum': quantum}
+    row.update(schedule_metrics(result))
+    row['simulation_time'] = simulation_time
+    return row
+
+def sweep_grid(workloads, algorithms, quanta):
+    """Every (workload, algorithm, quantum) point of the sweep, quantum None where it does not apply"""
+    grid = []
+    for workload in workloads:
+        for algorithm in algorithms:
+            for quantum in (quanta if algorithm in QUANTUM_ALGORITHMS else [None]):
+                grid.append((workload, algorithm, quantum))
+    return grid
+
+def policy_sweep(workloads, algorithms=SWEEP_ALGORITHMS, quanta=(2,), max_workers=None):
+    """Run the algorithm x quantum x workload grid across a process pool.
+
+    workloads maps a label to a ProcessTable. Each workload is placed in shared
+    memory once and workers attach to it by name, so a task only pickles its
+    grid coordinates. Rows come back in grid order.
+    """
+    segments = {}
+    try:
+        for label, table in workloads.items():
+            segments[label] = share_workload(table)
+
+        grid = sweep_grid(workloads, algorithms, quanta)
+        rows = [None] * len(grid)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(run_sweep_task, workload, segments[workload].name,
+                                len(workloads[workload]), algorithm, quantum): position
+                for position, (workload, algorithm, quantum) in enumerate(grid)
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                row = rows[futures[future]] = future.result()
+                quantum = f" q={row['quantum']}" if row['quantum'] is not None else ""
+                print(f"[{done}/{len(grid)}] {row['workload']}: {row['algorithm']}{quantum} "
+                      f"({row['simulation_time']:.2f}s)")
+        return rows
+    finally:
+        for segment in segments.values():
+            segment.close()
+            segment.unlink()
+
+def best_rows(rows, metric='avg_waiting'):
+    """Lowest-metric row for each workload"""
+    best = {}
+    for row in rows:
+        current = best.get(row['workload'])
+        if current is None or row[metric] < current[metric]:
+            best[row['workload']] = row
+    return best
+
+def print_sweep_table(rows):
+    """Display sweep results as a table, then the best policy per workload"""
+    print(f"\n{'='*106}")
+    print("SCHEDULING POLICY SWEEP RESULTS")
+    print(f"{'='*106}")
+    print(f"{'Workload':<18}{'Algorithm':<20}{'Quantum':>8}{'Avg WT':>10}{'Avg TAT':>10}{'Resp':>10}"
+          f"{'p95 WT':>9}{'Max WT':>9}{'Fairness':>9}{'Sim':>9}")
+    print("-" * 106)
+    for row in rows:
+        quantum = row['quantum'] if row['quantum'] is not None else '-'
+        print(f"{row['workload']:<18}{row['algorithm']:<20}{quantum:>8}{row['avg_waiting']:>10.2f}"
+              f"{row['avg_turnaround']:>10.2f}{row['avg_response']:>10.2f}{row['p95_waiting']:>9}"
+              f"{row['max_waiting']:>9}{row['fairness']:>9.4f}{row['simulation_time']:>8.2f}s")
+    print("-" * 106)
+
+    for workload, row in best_rows(rows).items():
+        quantum = f" (quantum {row['quantum']})" if row['quantum'] is not None else ""
+        print(f"Best for {workload}: {row['algorithm']}{quantum}, Avg WT {row['avg_waiting']:.2f}")
+
+    for workload, row in best_rows([row for row in rows if row['quantum'] is not None]).items():
+        print(f"Best quantum for {workload}: {row['quantum']} "
+              f"(Avg WT {row['avg_waiting']:.2f}, Resp {row['avg_response']:.2f})")
+
+def build_workloads(traces, count, distributions, arrival_rate, mean_burst, seed):
+    """Load the trace files and generate one synthetic workload per burst distribution"""
+    workloads = {}
+    for path in traces:
+        workloads[os.path.basename(path)] = load_trace(path)
+    for distribution in distributions:
+        table = ProcessTable()
+        for chunk in generate_workload(count, arrival_rate, distribution, mean_burst, seed=seed):
+            table.extend(chunk)
+        workloads[distribution] = table
+    return workloads
+
+def main():
+    """Main function for the scheduling policy sweep"""
+    parser = argparse.ArgumentParser(description="Sweep scheduling algorithms and time quanta over workloads in parallel")
+    parser.add_argument('--algorithms', nargs='+', choices=SWEEP_ALGORITHMS, default=SWEEP_ALGORITHMS,
+                        help="algorithms to run (default: all)")
+    parser.add_argument('--quanta', nargs='+', type=int, default=[1, 2, 4, 8, 16],
+                        help="time quanta for quantum-based algorithms (default: 1 2 4 8 16)")
+    parser.add_argument('--trace', nargs='*', default=[],
+                        help="CSV, JSONL or JSON trace files to include as workloads")
+    parser.add_argument('--generate', type=int, default=10_000,
+                        help="processes per synthetic workload, 0 for none (default: 10000)")
+    parser.add_argument('--distributions', nargs='+', choices=BURST_DISTRIBUTIONS, default=BURST_DISTRIBUTIONS,
+                        help="burst distributions of the synthetic workloads (default: all)")
+    parser.add_argument('--arrival-rate', type=float, default=0.18,
+                        help="synthetic arrivals per time unit (default: 0.18)")
+    parser.add_argument('--mean-burst', type=float, default=5.0,
+                        help="synthetic mean burst time (default: 5)")
+    parser.add_argument('--seed', type=int, default=1,
+                        help="seed for the synthetic workloads (default: 1)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument('--output', default='sweep_results.json',
+                        help="JSON file to write results to (default: sweep_results.json)")
+    args = parser.parse_args()
+
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if any(quantum < 1 for quantum in args.quanta):
+        parser.error("--quanta must all be at least 1")
+
+    distributions = args.distributions if args.generate > 0 else []
+    workloads = build_workloads(args.trace, args.generate, distributions,
+                                args.arrival_rate, args.mean_burst, args.seed)
+    if not workloads:
+        parser.error("no workloads: pass --trace files or a positive --generate count")
+
+    start_time = time.time()
+    rows = policy_sweep(workloads, args.algorithms, args.quanta, args.workers)
+    print_sweep_table(rows)
+    print(f"\nSwept {len(rows)} configurations in {time.time() - start_time:.2f}s using {args.workers} workers")
+
+    with open(args.output, 'w') as f:
+        json.dump({
+            'date': time.ctime(),
+            'workers': args.workers,
+            'workloads': {label: len(table) for label, table in workloads.items()},
+            'results': rows
+        }, f, indent=2)
+    print(f"Results saved to: {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -1,52 +1,701 @@
 #!/usr/bin/env python3
 
+import argparse
+import collections
+import contextlib
+import hashlib
+import heapq
+import importlib
+import io
+import json
+import random
+import runpy
+import signal
 import subprocess
+import threading
 import time
 import os
 import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
 
-def run_python_file(filename, description):
-    """Run a Python file and display results"""
-    print(f"\n{'='*60}")
-    print(f"RUNNING: {description}")
-    print(f"FILE: {filename}")
-    print(f"{'='*60}")
+try:
+    import resource
+except ImportError:
+    # Not available on Windows; resource accounting is simply left out there
+    resource = None
+
+def usage_from_rusage(rusage):
+    """Convert a resource.struct_rusage into the batch report's usage record"""
+    # ru_maxrss is kilobytes on Linux but bytes on macOS
+    max_rss_kb = rusage.ru_maxrss // 1024 if sys.platform == 'darwin' else rusage.ru_maxrss
+    return {
+        'user_cpu': rusage.ru_utime,
+        'system_cpu': rusage.ru_stime,
+        'max_rss_kb': max_rss_kb,
+        'voluntary_ctx': rusage.ru_nvcsw,
+        'involuntary_ctx': rusage.ru_nivcsw,
+        'block_in': rusage.ru_inblock,
+        'block_out': rusage.ru_oublock
+    }
+
+def wait_with_usage(process, before_reap=None):
+    """Reap a child process and return its exit code and resource usage"""
+    if hasattr(os, 'waitid') and before_reap is not None:
+        # Wait for exit without reaping, so nothing can signal a recycled PID
+        os.waitid(os.P_PID, process.pid, os.WEXITED | os.WNOWAIT)
+    if before_reap is not None:
+        before_reap()
+    
+    if not hasattr(os, 'wait4'):
+        return process.wait(), None
+    
+    # wait4 reaps the child itself, so hand the exit code back to Popen as well
+    _, status, rusage = os.wait4(process.pid, 0)
+    process.returncode = os.waitstatus_to_exitcode(status)
+    return process.returncode, usage_from_rusage(rusage)
+
+# Seconds between reads of a running job's peak RSS
+RSS_SAMPLE_INTERVAL = 0.01
+
+def read_peak_rss_kb(pid):
+    """VmHWM of a live process in KB from /proc, or None if it can't be read"""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return None
+
+def start_rss_sampler(process):
+    """Track a job's own peak RSS by sampling VmHWM while it runs.
+    
+    ru_maxrss from wait4 is no use for this on Linux: a child keeps the
+    high-water mark it had before exec, which is this runner's RSS, so every
+    small job would report the runner's size. VmHWM belongs to the job's own
+    address space but disappears once the job exits, so the last sample is
+    kept; growth in the final RSS_SAMPLE_INTERVAL before exit can be missed.
+    """
+    peak = {'max_rss_kb': None}
+    stopped = threading.Event()
+    
+    def sample():
+        while True:
+            rss = read_peak_rss_kb(process.pid)
+            if rss is not None and (peak['max_rss_kb'] is None or rss > peak['max_rss_kb']):
+                peak['max_rss_kb'] = rss
+            if stopped.wait(RSS_SAMPLE_INTERVAL):
+                return
+    
+    sampler = threading.Thread(target=sample, daemon=True)
+    if os.path.exists('/proc/self/status'):
+        sampler.start()
+    
+    def stop():
+        stopped.set()
+        if sampler.is_alive():
+            sampler.join()
+    
+    return peak, stop
+
+def reap_job(process, stop_watchdog, rss_peak, stop_sampler):
+    """Reap a job once its watchdog and RSS sampler are stopped, preferring the sampled peak RSS"""
+    def before_reap():
+        stop_watchdog()
+        stop_sampler()
+    
+    returncode, usage = wait_with_usage(process, before_reap)
+    if usage is not None and rss_peak['max_rss_kb'] is not None:
+        usage['max_rss_kb'] = rss_peak['max_rss_kb']
+    return returncode, usage
+
+def start_watchdog(process, timeout, kill_grace):
+    """Send SIGTERM to a job that outlives its timeout, then SIGKILL after a grace period.
+    
+    Jobs are started in their own session, so the signals go to the whole
+    process group: a child the job spawned would otherwise survive and keep
+    the output pipes open, blocking the readers until it exits by itself.
+    """
+    state = {'timed_out': False, 'finished': False}
+    lock = threading.Lock()
+    
+    def send(sig):
+        with lock:
+            if not state['finished']:
+                try:
+                    if hasattr(os, 'killpg'):
+                        os.killpg(process.pid, sig)
+                    else:
+                        os.kill(process.pid, sig)
+                except ProcessLookupError:
+                    pass
+    
+    def expire():
+        state['timed_out'] = True
+        send(signal.SIGTERM)
+        kill_timer.start()
+    
+    kill_timer = threading.Timer(kill_grace, send, args=(getattr(signal, 'SIGKILL', signal.SIGTERM),))
+    term_timer = threading.Timer(timeout, expire)
+    kill_timer.daemon = term_timer.daemon = True
+    if timeout is not None:
+        term_timer.start()
+    
+    def stop():
+        with lock:
+            state['finished'] = True
+        term_timer.cancel()
+        kill_timer.cancel()
+    
+    return state, stop
+
+def execute_python_file(filename, timeout=None, kill_grace=5.0, args=()):
+    """Run a Python file and capture its output without printing anything"""
+    result = {
+        'filename': filename,
+        'returncode': None,
+        'stdout': '',
+        'stderr': '',
+        'execution_time': 0.0,
+        'error': None,
+        'usage': None,
+        'timed_out': False
+    }
     
     try:
         # Check if file exists
         if not os.path.exists(filename):
-            print(f"ERROR: File '{filename}' not found!")
-            return False
+            result['error'] = f"File '{filename}' not found!"
+            return result
         
         # Run the Python file
         start_time = time.time()
-        result = subprocess.run([
-            sys.executable, filename
-        ], capture_output=True, text=True)
+        process = subprocess.Popen([
+            sys.executable, filename, *args
+        ], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, start_new_session=True)
+        watchdog, stop_watchdog = start_watchdog(process, timeout, kill_grace)
+        rss_peak, stop_sampler = start_rss_sampler(process)
         
+        output = {}
+        readers = [
+            threading.Thread(target=lambda: output.__setitem__('stdout', process.stdout.read())),
+            threading.Thread(target=lambda: output.__setitem__('stderr', process.stderr.read()))
+        ]
+        for reader in readers:
+            reader.start()
+        for reader in readers:
+            reader.join()
+        process.stdout.close()
+        process.stderr.close()
+        
+        result['returncode'], result['usage'] = reap_job(process, stop_watchdog, rss_peak, stop_sampler)
+        result['timed_out'] = watchdog['timed_out']
         end_time = time.time()
-        execution_time = end_time - start_time
+        result['execution_time'] = end_time - start_time
+        result['stdout'] = output['stdout']
+        result['stderr'] = output['stderr']
         
-        # Display output
-        if result.stdout:
-            print("OUTPUT:")
-            print(result.stdout)
+    except Exception as e:
+        result['error'] = f"EXCEPTION: {str(e)}"
+    
+    return result
+
+# Serialises line forwarding so concurrent jobs never interleave within a line
+stream_print_lock = threading.Lock()
+
+# Longest chunk read from a job pipe at once, so one huge line can't grow memory unbounded
+STREAM_READ_LIMIT = 64 * 1024
+
+def pump_stream(pipe, prefix, tail, spill_file):
+    """Forward a job's output line by line, keeping only the tail in memory"""
+    dropped = 0
+    for line in iter(lambda: pipe.readline(STREAM_READ_LIMIT), ''):
+        with stream_print_lock:
+            sys.stdout.write(f"{prefix} {line}" if line.endswith('\n') else f"{prefix} {line}\n")
+            sys.stdout.flush()
+        if spill_file is not None:
+            spill_file.write(line)
+        if len(tail) == tail.maxlen:
+            dropped += 1
+        tail.append(line)
+    pipe.close()
+    return dropped
+
+def spill_path(spill_dir, name, stream_name, attempt=1):
+    """Spill file for one stream of one attempt; retries get their own file rather than overwriting the first"""
+    suffix = '' if attempt == 1 else f".attempt{attempt}"
+    return os.path.join(spill_dir, f"{name}.{stream_name}{suffix}.log")
+
+def execute_python_file_streaming(job, tail_lines=20, spill_dir=None, timeout=None, kill_grace=5.0, attempt=1):
+    """Run a Python file, streaming its output live and keeping a bounded tail"""
+    filename = job['filename']
+    name = job.get('name', filename)
+    result = {
+        'filename': filename,
+        'returncode': None,
+        'stdout': '',
+        'stderr': '',
+        'execution_time': 0.0,
+        'error': None,
+        'usage': None,
+        'timed_out': False,
+        'streamed': True,
+        'dropped_lines': 0,
+        'spill_files': []
+    }
+    
+    if not os.path.exists(filename):
+        result['error'] = f"File '{filename}' not found!"
+        return result
+    
+    spill_files = [None, None]
+    try:
+        if spill_dir is not None:
+            os.makedirs(spill_dir, exist_ok=True)
+            for i, stream_name in enumerate(('stdout', 'stderr')):
+                path = spill_path(spill_dir, name, stream_name, attempt)
+                spill_files[i] = open(path, 'w')
+                result['spill_files'].append(path)
         
-        if result.stderr:
-            print("ERRORS:")
-            print(result.stderr)
+        # Unbuffered child output, otherwise lines only arrive when the job exits
+        env = dict(os.environ, PYTHONUNBUFFERED='1')
+        start_time = time.time()
+        process = subprocess.Popen([
+            sys.executable, filename, *job.get('args', [])
+        ], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, env=env, start_new_session=True)
+        watchdog, stop_watchdog = start_watchdog(process, timeout, kill_grace)
+        rss_peak, stop_sampler = start_rss_sampler(process)
+        
+        stdout_tail = collections.deque(maxlen=tail_lines)
+        stderr_tail = collections.deque(maxlen=tail_lines)
+        dropped = [0, 0]
+        
+        def pump(i, pipe, prefix, tail):
+            dropped[i] = pump_stream(pipe, prefix, tail, spill_files[i])
+        
+        readers = [
+            threading.Thread(target=pump, args=(0, process.stdout, f"[{name}]", stdout_tail)),
+            threading.Thread(target=pump, args=(1, process.stderr, f"[{name}:err]", stderr_tail))
+        ]
+        for reader in readers:
+            reader.start()
+        for reader in readers:
+            reader.join()
+        
+        result['returncode'], result['usage'] = reap_job(process, stop_watchdog, rss_peak, stop_sampler)
+        result['timed_out'] = watchdog['timed_out']
+        result['execution_time'] = time.time() - start_time
+        result['stdout'] = ''.join(stdout_tail)
+        result['stderr'] = ''.join(stderr_tail)
+        result['dropped_lines'] = dropped[0] + dropped[1]
         
-        # Display execution status
-        if result.returncode == 0:
-            print(f"SUCCESS: {description} completed in {execution_time:.2f} seconds")
-            return True
-        else:
-            print(f"FAILED: {description} returned error code {result.returncode}")
-            return False
-            
     except Exception as e:
-        print(f"EXCEPTION: {str(e)}")
+        result['error'] = f"EXCEPTION: {str(e)}"
+    finally:
+        for spill_file in spill_files:
+            if spill_file is not None:
+                spill_file.close()
+    
+    return result
+
+# Modules imported once by every warm worker so jobs don't pay for them
+WARM_POOL_PRELOAD = ['math', 'random', 'json', 'collections', 'itertools', 're']
+
+def warm_worker_init(preload_modules):
+    """Pre-import common modules in a freshly started warm worker"""
+    for module_name in preload_modules:
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            pass
+
+class JobTimeout(BaseException):
+    """Raised inside a warm worker when a job exceeds its timeout"""
+
+def raise_job_timeout(signum, frame):
+    """SIGALRM handler that interrupts the job running in a warm worker"""
+    raise JobTimeout()
+
+def save_interpreter_state():
+    """Snapshot the process-wide state a job can change, so the next job on the worker starts clean"""
+    handlers = {}
+    for sig in signal.valid_signals():
+        try:
+            handler = signal.getsignal(sig)
+        except (OSError, ValueError):
+            continue
+        if handler is not None:
+            handlers[sig] = handler
+    return {
+        'argv': sys.argv,
+        'path': list(sys.path),
+        'modules': dict(sys.modules),
+        'environ': dict(os.environ),
+        'cwd': os.getcwd(),
+        'handlers': handlers
+    }
+
+def restore_interpreter_state(state):
+    """Undo a job's changes to argv, sys.path, imported modules, environment, working directory and signal handlers"""
+    sys.argv = state['argv']
+    sys.path[:] = state['path']
+    for name in [name for name in sys.modules if name not in state['modules']]:
+        del sys.modules[name]
+    sys.modules.update(state['modules'])
+    os.environ.clear()
+    os.environ.update(state['environ'])
+    os.chdir(state['cwd'])
+    for sig, handler in state['handlers'].items():
+        if signal.getsignal(sig) is not handler:
+            try:
+                signal.signal(sig, handler)
+            except (OSError, ValueError):
+                pass
+
+def execute_in_warm_worker(filename, timeout=None, args=()):
+    """Run a Python file inside an already running worker interpreter"""
+    result = {
+        'filename': filename,
+        'returncode': None,
+        'stdout': '',
+        'stderr': '',
+        'execution_time': 0.0,
+        'error': None,
+        'usage': None,
+        'timed_out': False
+    }
+    
+    if not os.path.exists(filename):
+        result['error'] = f"File '{filename}' not found!"
+        return result
+    
+    # A warm worker can't be killed without losing it, so the timeout is an alarm inside it
+    use_alarm = timeout is not None and hasattr(signal, 'setitimer')
+    
+    stdout_buffer = io.StringIO()
+    stderr_buffer = io.StringIO()
+    saved_state = save_interpreter_state()
+    returncode = 0
+    
+    usage_before = resource.getrusage(resource.RUSAGE_SELF) if resource else None
+    start_time = time.time()
+    try:
+        sys.argv = [filename, *args]
+        # As for 'python filename', the script's own directory comes first on the import path
+        sys.path.insert(0, os.path.dirname(os.path.abspath(filename)))
+        if use_alarm:
+            signal.signal(signal.SIGALRM, raise_job_timeout)
+            signal.setitimer(signal.ITIMER_REAL, timeout)
+        with contextlib.redirect_stdout(stdout_buffer), contextlib.redirect_stderr(stderr_buffer):
+            try:
+                # run_path gives every job its own fresh globals, like a new interpreter
+                runpy.run_path(filename, run_name='__main__')
+            except JobTimeout:
+                result['timed_out'] = True
+                returncode = -signal.SIGALRM
+            except SystemExit as e:
+                if e.code is None:
+                    returncode = 0
+                elif isinstance(e.code, int):
+                    returncode = e.code
+                else:
+                    print(e.code, file=sys.stderr)
+                    returncode = 1
+            except BaseException:
+                traceback.print_exc()
+                returncode = 1
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        restore_interpreter_state(saved_state)
+    
+    result['execution_time'] = time.time() - start_time
+    if resource:
+        # A warm worker is shared by many jobs, so report the change over this job;
+        # peak RSS can only be the worker's own high-water mark
+        before = usage_from_rusage(usage_before)
+        after = usage_from_rusage(resource.getrusage(resource.RUSAGE_SELF))
+        result['usage'] = {key: after[key] - before[key] for key in after}
+        result['usage']['max_rss_kb'] = after['max_rss_kb']
+    result['returncode'] = returncode
+    result['stdout'] = stdout_buffer.getvalue()
+    result['stderr'] = stderr_buffer.getvalue()
+    return result
+
+class WarmPool:
+    """Pre-warmed worker interpreters that are replaced after recycle_after jobs.
+    
+    If a job kills its worker (os._exit, a crash, the OOM killer) the
+    executor reports the pool as broken instead of waiting forever; the pool
+    is then rebuilt and every job that was running in it is recorded as
+    failed, so the retry policy decides whether it runs again.
+    """
+    
+    def __init__(self, processes, recycle_after):
+        self.processes = processes
+        self.recycle_after = recycle_after
+        self.lock = threading.Lock()
+        self.executor = self.start_executor()
+    
+    def start_executor(self):
+        return ProcessPoolExecutor(
+            max_workers=self.processes,
+            initializer=warm_worker_init,
+            initargs=(WARM_POOL_PRELOAD,),
+            max_tasks_per_child=self.recycle_after
+        )
+    
+    def warm_up(self):
+        """Start the workers now rather than on the first jobs"""
+        list(self.executor.map(abs, range(self.processes)))
+    
+    def run(self, filename, timeout=None, args=()):
+        """Run a Python file in a warm worker and return its result record"""
+        with self.lock:
+            executor = self.executor
+        try:
+            return executor.submit(execute_in_warm_worker, filename, timeout, args).result()
+        except BrokenProcessPool:
+            with self.lock:
+                # Only the first job to notice replaces the pool; the rest find it already rebuilt
+                if self.executor is executor:
+                    executor.shutdown(wait=False)
+                    self.executor = self.start_executor()
+            return {
+                'filename': filename,
+                'returncode': None,
+                'stdout': '',
+                'stderr': '',
+                'execution_time': 0.0,
+                'error': "EXCEPTION: a warm worker exited abruptly while this job was running",
+                'usage': None,
+                'timed_out': False
+            }
+    
+    def close(self):
+        with self.lock:
+            self.executor.shutdown(wait=True)
+
+def create_warm_pool(processes, recycle_after):
+    """Start a pool of pre-warmed worker interpreters that are replaced after recycle_after jobs"""
+    return WarmPool(processes, recycle_after)
+
+def report_job_result(result, description):
+    """Display the captured results of one batch job"""
+    print(f"\n{'='*60}")
+    print(f"RUNNING: {description}")
+    print(f"FILE: {result['filename']}")
+    print(f"{'='*60}")
+    
+    if result['error']:
+        if result['error'].startswith("EXCEPTION"):
+            print(result['error'])
+        else:
+            print(f"ERROR: {result['error']}")
         return False
+    
+    # Display output; streamed jobs already printed everything live, so only show the tail
+    output_label, errors_label = "OUTPUT:", "ERRORS:"
+    if result.get('streamed'):
+        output_label, errors_label = "OUTPUT (tail):", "ERRORS (tail):"
+        if result['dropped_lines']:
+            print(f"({result['dropped_lines']} earlier lines not kept in memory)")
+        for path in result['spill_files']:
+            print(f"Full output saved to: {path}")
+    
+    if result['stdout']:
+        print(output_label)
+        print(result['stdout'])
+    
+    if result['stderr']:
+        print(errors_label)
+        print(result['stderr'])
+    
+    # Display execution status
+    if result.get('resumed'):
+        print(f"RESUMED: {description} already completed before the restart "
+              f"(in {result['execution_time']:.2f} seconds)")
+        return True
+    elif result.get('cached') and result['returncode'] == 0:
+        print(f"CACHED: {description} unchanged, reused result "
+              f"(originally {result['original_time']:.2f} seconds)")
+        return True
+    elif result['returncode'] == 0:
+        print(f"SUCCESS: {description} completed in {result['execution_time']:.2f} seconds")
+        return True
+    elif result.get('timed_out'):
+        print(f"FAILED: {description} timed out after {result['execution_time']:.2f} seconds "
+              f"(error code {result['returncode']})")
+        return False
+    else:
+        print(f"FAILED: {description} returned error code {result['returncode']}")
+        return False
+
+# Defaults for every job; a job can override any of these in its 'policy' dict
+DEFAULT_JOB_POLICY = {
+    'timeout': None,        # seconds of wall time before SIGTERM, None for no limit
+    'kill_grace': 5.0,      # seconds between SIGTERM and SIGKILL
+    'max_retries': 0,       # extra attempts after the first failure
+    'backoff_base': 1.0,    # delay before the first retry, doubled for each later one
+    'backoff_max': 30.0,    # upper bound on a single retry delay
+    'jitter': 0.5           # retry delay is scaled by a random factor in [1 - jitter, 1 + jitter]
+}
+
+def job_policy(job, default_policy=DEFAULT_JOB_POLICY):
+    """Merge a job's own policy overrides onto the batch default policy"""
+    policy = dict(default_policy)
+    policy.update(job.get('policy', {}))
+    return policy
+
+def backoff_delay(policy, retry_number):
+    """Exponential backoff with jitter before the given retry (1-based)"""
+    delay = min(policy['backoff_max'], policy['backoff_base'] * 2 ** (retry_number - 1))
+    return delay * random.uniform(1 - policy['jitter'], 1 + policy['jitter'])
+
+def attempt_succeeded(result):
+    """Whether a single attempt of a job finished cleanly"""
+    return result['error'] is None and result['returncode'] == 0
+
+def run_with_policy(job, run_attempt, default_policy=DEFAULT_JOB_POLICY):
+    """Run a job under its timeout/retry policy and record every attempt"""
+    policy = job_policy(job, default_policy)
+    attempts = []
+    
+    for attempt in range(1, policy['max_retries'] + 2):
+        result = run_attempt(job, policy, attempt)
+        attempts.append({
+            'attempt': attempt,
+            'returncode': result['returncode'],
+            'execution_time': result['execution_time'],
+            'timed_out': result.get('timed_out', False),
+            'error': result['error'],
+            'ok': attempt_succeeded(result)
+        })
+        
+        if attempt_succeeded(result) or attempt > policy['max_retries']:
+            break
+        
+        delay = backoff_delay(policy, attempt)
+        with stream_print_lock:
+            print(f"RETRY: {job['name']} attempt {attempt} failed, "
+                  f"retrying in {delay:.2f}s ({attempt}/{policy['max_retries']} retries used)")
+        time.sleep(delay)
+    
+    result['attempts'] = attempts
+    return result
+
+def run_job_in_subprocess(job, policy=DEFAULT_JOB_POLICY):
+    """Run one batch job in a fresh interpreter process"""
+    return execute_python_file(job['filename'], policy['timeout'], policy['kill_grace'], job.get('args', []))
+
+# Result cache entries are small JSON files; this lock keeps eviction from racing a store
+cache_lock = threading.Lock()
+
+def hash_file(hasher, path):
+    """Feed a file's contents into a hash, marking files that don't exist"""
+    hasher.update(path.encode() + b'\0')
+    if not os.path.exists(path):
+        hasher.update(b'<missing>\0')
+        return
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            hasher.update(chunk)
+    hasher.update(b'\0')
+
+def cache_key(job):
+    """Content hash of everything that determines a job's result"""
+    hasher = hashlib.sha256()
+    hasher.update(sys.version.encode() + b'\0')
+    hasher.update(json.dumps(job.get('args', [])).encode() + b'\0')
+    hash_file(hasher, job['filename'])
+    for path in sorted(job.get('inputs', [])):
+        hash_file(hasher, path)
+    return hasher.hexdigest()
+
+def cache_lookup(cache_dir, key):
+    """Return a cached result for key, or None, marking the entry as recently used"""
+    path = os.path.join(cache_dir, f"{key}.json")
+    try:
+        with open(path) as f:
+            entry = json.load(f)
+        os.utime(path)
+    except (OSError, ValueError):
+        return None
+    return entry
+
+def evict_cache(cache_dir, max_bytes):
+    """Delete least recently used cache entries until the cache fits in max_bytes"""
+    entries = []
+    for name in os.listdir(cache_dir):
+        if name.endswith('.json'):
+            path = os.path.join(cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+    
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        total -= size
+
+def cache_store(cache_dir, key, result, max_bytes):
+    """Save a job result under key and keep the cache under its size cap"""
+    entry = {
+        'returncode': result['returncode'],
+        'stdout': result['stdout'],
+        'stderr': result['stderr'],
+        'execution_time': result['execution_time'],
+        'created': time.time()
+    }
+    with cache_lock:
+        os.makedirs(cache_dir, exist_ok=True)
+        path = os.path.join(cache_dir, f"{key}.json")
+        # Write then rename, so a crash never leaves a half-written entry behind
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(entry, f)
+        os.replace(temp_path, path)
+        evict_cache(cache_dir, max_bytes)
+
+def run_cached(job, run_job, cache_dir, max_bytes):
+    """Return a job's cached result if nothing it depends on changed, otherwise run and cache it"""
+    key = cache_key(job)
+    entry = cache_lookup(cache_dir, key)
+    if entry is not None:
+        return {
+            'filename': job['filename'],
+            'returncode': entry['returncode'],
+            'stdout': entry['stdout'],
+            'stderr': entry['stderr'],
+            'execution_time': 0.0,
+            'error': None,
+            'usage': None,
+            'timed_out': False,
+            'cached': True,
+            'original_time': entry['execution_time']
+        }
+    
+    result = run_job(job)
+    # Only successes are cached, so a failed or flaky job is always re-run. A streamed
+    # result that dropped lines holds just the tail, which must not be replayed as the full output
+    if attempt_succeeded(result) and not result.get('dropped_lines'):
+        cache_store(cache_dir, key, result, max_bytes)
+    return result
+
+def run_python_file(filename, description):
+    """Run a Python file and display results"""
+    result = execute_python_file(filename)
+    return report_job_result(result, description)
 
 def create_sample_files():
     """Create sample Python files for batch processing demo"""
@@ -107,51 +756,573 @@ print("Program 4 completed successfully!")
     
     return list(sample_files.keys())
 
-def sequential_batch_processing():
+def build_job_graph(batch_jobs):
+    """Validate job dependencies and return job indices in topological order"""
+    index_of = {}
+    for index, job in enumerate(batch_jobs):
+        if job['name'] in index_of:
+            raise ValueError(f"Duplicate job name: {job['name']}")
+        index_of[job['name']] = index
+    
+    dependents = [[] for _ in batch_jobs]
+    pending_deps = [0] * len(batch_jobs)
+    for index, job in enumerate(batch_jobs):
+        for dep in job.get('depends_on', []):
+            if dep not in index_of:
+                raise ValueError(f"Job '{job['name']}' depends on unknown job '{dep}'")
+            dependents[index_of[dep]].append(index)
+            pending_deps[index] += 1
+    
+    # Kahn's algorithm, taking ready jobs in their original batch order
+    ready = [index for index in range(len(batch_jobs)) if pending_deps[index] == 0]
+    heapq.heapify(ready)
+    order = []
+    while ready:
+        index = heapq.heappop(ready)
+        order.append(index)
+        for child in dependents[index]:
+            pending_deps[child] -= 1
+            if pending_deps[child] == 0:
+                heapq.heappush(ready, child)
+    
+    if len(order) < len(batch_jobs):
+        cycle = [batch_jobs[index]['name'] for index in range(len(batch_jobs)) if pending_deps[index] > 0]
+        raise ValueError(f"Dependency cycle detected among jobs: {', '.join(cycle)}")
+    
+    return order, dependents, index_of
+
+def skipped_result(job, failed_dep):
+    """Build the result record for a job skipped because a dependency failed"""
+    result = {
+        'filename': job['filename'],
+        'returncode': None,
+        'stdout': '',
+        'stderr': '',
+        'execution_time': 0.0,
+        'error': None,
+        'usage': None,
+        'status': 'SKIPPED',
+        'skip_reason': f"dependency '{failed_dep}' did not succeed"
+    }
+    return result
+
+def report_skipped_job(job, result):
+    """Display a job that was skipped because of a failed dependency"""
+    print(f"\n{'='*60}")
+    print(f"SKIPPED: {job['description']}")
+    print(f"FILE: {job['filename']}")
+    print(f"REASON: {result['skip_reason']}")
+    print(f"{'='*60}")
+
+def record_outcome(result, ok):
+    """Store the final status of a job on its result record"""
+    result['status'] = 'SUCCESS' if ok else 'FAILED'
+    return result
+
+def first_failed_dependency(job, results, index_of):
+    """Return the name of the first dependency that did not succeed, if any"""
+    for dep in job.get('depends_on', []):
+        if results[index_of[dep]]['status'] != 'SUCCESS':
+            return dep
+    return None
+
+class FairShareQueue:
+    """Ready queue of batch jobs: per-owner priority heaps with aging, owners picked by weighted fair share"""
+    
+    def __init__(self, owner_weights=None, aging_rate=0.1, share_factor=1.0):
+        self.owner_weights = owner_weights or {}
+        self.aging_rate = aging_rate        # priority levels gained per second spent waiting
+        self.share_factor = share_factor    # priority levels charged per weighted second of owner usage
+        self.heaps = {}
+        self.virtual_time = {}
+        self.sequence = 0
+        self.size = 0
+    
+    def __len__(self):
+        return self.size
+    
+    def weight(self, owner):
+        return self.owner_weights.get(owner, 1.0)
+    
+    def push(self, index, job, now):
+        """Add a job that became ready at time now (seconds since batch start)"""
+        owner = job.get('owner', 'default')
+        # Aged priority is priority - aging_rate * (now - ready_time); every waiting job ages at
+        # the same rate, so priority + aging_rate * ready_time orders them the same at any moment
+        key = job.get('priority', 0) + self.aging_rate * now
+        
+        if owner not in self.virtual_time:
+            # A new owner starts level with the least served active owner instead of at zero
+            active = [self.virtual_time[o] for o, heap in self.heaps.items() if heap]
+            self.virtual_time[owner] = min(active) if active else 0.0
+        
+        heapq.heappush(self.heaps.setdefault(owner, []), (key, self.sequence, index))
+        self.sequence += 1
+        self.size += 1
+    
+    def pop(self):
+        """Remove and return (index, owner) of the job that should be dispatched next"""
+        best_owner = None
+        best_score = None
+        for owner, heap in self.heaps.items():
+            if not heap:
+                continue
+            score = (heap[0][0] + self.share_factor * self.virtual_time[owner], heap[0][1])
+            if best_score is None or score < best_score:
+                best_owner, best_score = owner, score
+        
+        key, sequence, index = heapq.heappop(self.heaps[best_owner])
+        self.size -= 1
+        return index, best_owner
+    
+    def charge(self, owner, seconds):
+        """Account run time used by an owner, scaled by its share weight"""
+        self.virtual_time[owner] += seconds / self.weight(owner)
+
+class JobJournal:
+    """Append-only JSON-lines record of batch progress, fsynced in groups"""
+    
+    def __init__(self, path, resume=False, sync_every=16, sync_interval=1.0):
+        self.path = path
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.pending = 0
+        self.last_sync = time.time()
+        self.lock = threading.Lock()
+        # A fresh batch starts a fresh journal; a resumed one keeps appending to it
+        self.file = open(path, 'a' if resume else 'w')
+    
+    def record(self, event, **fields):
+        """Append one event, syncing to disk once enough events or time have built up"""
+        entry = {'event': event, 'time': time.time()}
+        entry.update(fields)
+        with self.lock:
+            self.file.write(json.dumps(entry) + "\n")
+            self.file.flush()
+            self.pending += 1
+            if self.pending >= self.sync_every or time.time() - self.last_sync >= self.sync_interval:
+                self.sync()
+    
+    def sync(self):
+        os.fsync(self.file.fileno())
+        self.pending = 0
+        self.last_sync = time.time()
+    
+    def close(self):
+        with self.lock:
+            self.sync()
+            self.file.close()
+
+def load_journal(path):
+    """Return finish records of the last unfinished batch in a journal, keyed by job name"""
+    if not os.path.exists(path):
+        return None
+    
+    completed = None
+    with open(path) as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # A crash can leave a torn last line; everything before it is still good
+                continue
+            if entry['event'] == 'batch_start':
+                completed = {}
+            elif entry['event'] == 'batch_complete':
+                completed = None
+            elif entry['event'] == 'job_finish' and completed is not None:
+                if entry['status'] == 'SUCCESS':
+                    completed[entry['job']] = entry
+                else:
+                    completed.pop(entry['job'], None)
+    return completed
+
+def resumed_result(job, entry):
+    """Build the result record for a job that already succeeded before a restart"""
+    return {
+        'filename': job['filename'],
+        'returncode': entry['returncode'],
+        'stdout': '',
+        'stderr': '',
+        'execution_time': entry['execution_time'],
+        'error': None,
+        'usage': None,
+        'timed_out': False,
+        'resumed': True
+    }
+
+def sequential_batch_execution(batch_jobs, run_job=run_job_in_subprocess, job_delay=1.0, ready_queue=None,
+                               journal=None, completed=None):
+    """Run batch jobs one at a time in dependency order, picking from the ready queue"""
+    return parallel_batch_execution(batch_jobs, 1, run_job, ready_queue, job_delay=job_delay, sequential=True,
+                                    journal=journal, completed=completed)
+
+def parallel_batch_execution(batch_jobs, max_workers=None, run_job=run_job_in_subprocess, ready_queue=None,
+                             job_delay=0.0, sequential=False, journal=None, completed=None):
+    """Run batch jobs on a bounded pool of workers as soon as their dependencies finish"""
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if ready_queue is None:
+        ready_queue = FairShareQueue()
+    
+    order, dependents, index_of = build_job_graph(batch_jobs)
+    results = [None] * len(batch_jobs)
+    pending_deps = [len(job.get('depends_on', [])) for job in batch_jobs]
+    ready_times = [None] * len(batch_jobs)
+    dispatch_times = [None] * len(batch_jobs)
+    finished = 0
+    batch_start = time.time()
+    
+    def make_ready(index):
+        ready_times[index] = time.time() - batch_start
+        ready_queue.push(index, batch_jobs[index], ready_times[index])
+    
+    def settle(index):
+        """Mark a job finished and queue dependents that just became ready"""
+        for child in dependents[index]:
+            pending_deps[child] -= 1
+            if pending_deps[child] == 0:
+                make_ready(child)
+    
+    def finish(index, result, progress):
+        """Report a finished job and record its queueing details"""
+        job = batch_jobs[index]
+        print(f"\nBATCH JOB {progress}")
+        if result.get('status') == 'SKIPPED':
+            report_skipped_job(job, result)
+        else:
+            record_outcome(result, report_job_result(result, job['description']))
+            if dispatch_times[index] is not None:
+                result['queue_delay'] = dispatch_times[index] - ready_times[index]
+        result['owner'] = job.get('owner', 'default')
+        results[index] = result
+        if journal is not None and not result.get('resumed'):
+            journal.record('job_finish', job=job['name'], status=result['status'],
+                           returncode=result['returncode'], execution_time=result['execution_time'],
+                           cached=bool(result.get('cached')))
+        settle(index)
+    
+    for index in order:
+        if pending_deps[index] == 0:
+            make_ready(index)
+    
+    # Each worker thread only waits on its own child process (or warm worker), so threads are enough
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        running = {}
+        
+        while len(ready_queue) or running:
+            while len(ready_queue) and len(running) < max_workers:
+                index, owner = ready_queue.pop()
+                job = batch_jobs[index]
+                if completed and job['name'] in completed:
+                    finished += 1
+                    finish(index, resumed_result(job, completed[job['name']]),
+                           f"{finished}/{len(batch_jobs)}" if sequential else
+                           f"{index + 1}/{len(batch_jobs)} (finished {finished}/{len(batch_jobs)})")
+                    continue
+                
+                failed_dep = first_failed_dependency(job, results, index_of)
+                if failed_dep is not None:
+                    # Skipping settles the job immediately, which may cascade
+                    finished += 1
+                    finish(index, skipped_result(job, failed_dep),
+                           f"{finished}/{len(batch_jobs)}" if sequential else
+                           f"{index + 1}/{len(batch_jobs)} (finished {finished}/{len(batch_jobs)})")
+                    continue
+                
+                # Charge the owner its estimate now, so one owner can't claim every free worker
+                estimate = job.get('estimated_time', 1.0)
+                ready_queue.charge(owner, estimate)
+                dispatch_times[index] = time.time() - batch_start
+                if journal is not None:
+                    journal.record('job_start', job=job['name'], owner=owner)
+                running[executor.submit(run_job, job)] = (index, owner, estimate)
+            
+            if not running:
+                continue
+            
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, owner, estimate = running.pop(future)
+                result = future.result()
+                ready_queue.charge(owner, result['execution_time'] - estimate)
+                finished += 1
+                finish(index, result,
+                       f"{finished}/{len(batch_jobs)}" if sequential else
+                       f"{index + 1}/{len(batch_jobs)} (finished {finished}/{len(batch_jobs)})")
+                
+                # Simulate batch processing delay between jobs
+                if job_delay and finished < len(batch_jobs):
+                    print(f"\nBatch processor preparing next job...")
+                    time.sleep(job_delay)
+    
+    return results
+
+def owner_queue_stats(results):
+    """Per-owner job count and mean/max queueing delay of dispatched jobs"""
+    delays = {}
+    for result in results:
+        if result.get('queue_delay') is not None:
+            delays.setdefault(result['owner'], []).append(result['queue_delay'])
+    return {
+        owner: (len(values), sum(values) / len(values), max(values))
+        for owner, values in sorted(delays.items())
+    }
+
+def print_owner_report(results):
+    """Display queueing delay per job owner"""
+    print(f"\nQUEUEING DELAY BY OWNER:")
+    print(f"{'Owner':<16}{'Jobs':>6}{'Mean Delay':>13}{'Max Delay':>12}")
+    print("-" * 47)
+    for owner, (count, mean_delay, max_delay) in owner_queue_stats(results).items():
+        print(f"{owner:<16}{count:>6}{mean_delay:>12.2f}s{max_delay:>11.2f}s")
+
+def write_owner_log(log_file, results):
+    """Append queueing delay per job owner to the batch log"""
+    log_file.write("\nQUEUEING DELAY BY OWNER:\n")
+    for owner, (count, mean_delay, max_delay) in owner_queue_stats(results).items():
+        log_file.write(f"{owner}: {count} jobs, mean {mean_delay:.2f}s, max {max_delay:.2f}s\n")
+
+USAGE_FIELDS = ['user_cpu', 'system_cpu', 'max_rss_kb', 'voluntary_ctx',
+                'involuntary_ctx', 'block_in', 'block_out']
+
+def usage_totals(results):
+    """Sum resource usage over every job that reported it"""
+    totals = {field: 0 for field in USAGE_FIELDS}
+    for result in results:
+        if result['usage']:
+            for field in USAGE_FIELDS:
+                if field == 'max_rss_kb':
+                    totals[field] = max(totals[field], result['usage'][field])
+                else:
+                    totals[field] += result['usage'][field]
+    return totals
+
+def top_consumers(batch_jobs, results, top_n):
+    """Return (job, usage) pairs for the jobs that used the most CPU time"""
+    measured = [(job, result['usage']) for job, result in zip(batch_jobs, results) if result['usage']]
+    measured.sort(key=lambda pair: pair[1]['user_cpu'] + pair[1]['system_cpu'], reverse=True)
+    return measured[:top_n]
+
+def print_resource_report(batch_jobs, results, top_n=3):
+    """Display per-job resource usage, batch totals and the top CPU consumers"""
+    print(f"\nRESOURCE USAGE:")
+    print(f"{'Job':<12}{'User CPU':>10}{'Sys CPU':>10}{'Peak RSS':>12}{'Vol CS':>8}{'Invol CS':>10}{'Blk In':>8}{'Blk Out':>9}")
+    print("-" * 79)
+    for job, result in zip(batch_jobs, results):
+        usage = result['usage']
+        if not usage:
+            print(f"{job['name']:<12}{'-':>10}{'-':>10}{'-':>12}{'-':>8}{'-':>10}{'-':>8}{'-':>9}")
+            continue
+        print(f"{job['name']:<12}{usage['user_cpu']:>9.3f}s{usage['system_cpu']:>9.3f}s"
+              f"{usage['max_rss_kb']:>9} KB{usage['voluntary_ctx']:>8}{usage['involuntary_ctx']:>10}"
+              f"{usage['block_in']:>8}{usage['block_out']:>9}")
+    
+    totals = usage_totals(results)
+    print("-" * 79)
+    print(f"{'TOTAL':<12}{totals['user_cpu']:>9.3f}s{totals['system_cpu']:>9.3f}s"
+          f"{totals['max_rss_kb']:>9} KB{totals['voluntary_ctx']:>8}{totals['involuntary_ctx']:>10}"
+          f"{totals['block_in']:>8}{totals['block_out']:>9}")
+    
+    print(f"\nTop {top_n} CPU consumers:")
+    for rank, (job, usage) in enumerate(top_consumers(batch_jobs, results, top_n), 1):
+        print(f"{rank}. {job['name']} - {usage['user_cpu'] + usage['system_cpu']:.3f}s CPU, "
+              f"{usage['max_rss_kb']} KB peak RSS")
+
+def rounded_record(record):
+    """Round float fields of a log record to microsecond precision"""
+    return {key: round(value, 6) if isinstance(value, float) else value for key, value in record.items()}
+
+def write_resource_log(log_file, batch_jobs, results, top_n=3):
+    """Append the machine-readable resource usage section to the batch log"""
+    log_file.write("\nRESOURCE USAGE (JSON lines):\n")
+    for job, result in zip(batch_jobs, results):
+        record = {'job': job['name'], 'filename': job['filename'], 'status': result['status'],
+                  'wall_time': round(result['execution_time'], 6)}
+        record.update(result['usage'] or {})
+        log_file.write(json.dumps(rounded_record(record)) + "\n")
+    
+    # Peak RSS in the totals line is the largest single job, not a sum
+    totals = {'job': '__total__'}
+    totals.update(usage_totals(results))
+    log_file.write(json.dumps(rounded_record(totals)) + "\n")
+    top = [job['name'] for job, usage in top_consumers(batch_jobs, results, top_n)]
+    log_file.write(json.dumps({'job': '__top_cpu__', 'jobs': top}) + "\n")
+
+def write_attempt_log(log_file, batch_jobs, results):
+    """Append every job's attempt history to the batch log"""
+    log_file.write("\nATTEMPT HISTORY:\n")
+    for job, result in zip(batch_jobs, results):
+        attempts = result.get('attempts', [])
+        if result.get('cached'):
+            log_file.write(f"{job['name']}: cached result, not executed\n")
+            continue
+        if result.get('resumed'):
+            log_file.write(f"{job['name']}: completed before restart, not executed\n")
+            continue
+        if not attempts:
+            log_file.write(f"{job['name']}: not attempted ({result['status']})\n")
+            continue
+        for entry in attempts:
+            if entry['ok']:
+                outcome = "SUCCESS"
+            elif entry['timed_out']:
+                outcome = "TIMEOUT"
+            elif entry['error']:
+                outcome = "ERROR"
+            else:
+                outcome = "FAILED"
+            log_file.write(f"{job['name']}: attempt {entry['attempt']} - {outcome} "
+                           f"(code {entry['returncode']}, {entry['execution_time']:.2f}s)\n")
+
+def critical_path(batch_jobs, results):
+    """Find the longest chain of dependent jobs by measured execution time"""
+    order, dependents, index_of = build_job_graph(batch_jobs)
+    finish = [0.0] * len(batch_jobs)
+    previous = [None] * len(batch_jobs)
+    
+    for index in order:
+        start = 0.0
+        for dep in batch_jobs[index].get('depends_on', []):
+            dep_index = index_of[dep]
+            if finish[dep_index] > start:
+                start = finish[dep_index]
+                previous[index] = dep_index
+        finish[index] = start + results[index]['execution_time']
+    
+    if not batch_jobs:
+        return 0.0, []
+    
+    end = max(range(len(batch_jobs)), key=lambda index: finish[index])
+    chain = []
+    while end is not None:
+        chain.append(batch_jobs[end]['name'])
+        end = previous[end]
+    chain.reverse()
+    
+    return max(finish), chain
+
+def sequential_batch_processing(parallel=False, max_workers=None, warm_pool=False, recycle_after=100,
+                                stream=False, tail_lines=20, spill_dir=None, top_n=3,
+                                default_policy=DEFAULT_JOB_POLICY, cache_dir=None,
+                                cache_max_bytes=64 * 1024 * 1024, owner_weights=None, aging_rate=0.1,
+                                journal_path='batch_journal.jsonl', resume=False):
     """Simulate sequential batch processing of multiple programs"""
-    print("BATCH PROCESSING SIMULATION - SEQUENTIAL EXECUTION")
+    if parallel and max_workers is None:
+        max_workers = os.cpu_count() or 1
+    
+    mode = "PARALLEL" if parallel else "SEQUENTIAL"
+    print(f"BATCH PROCESSING SIMULATION - {mode} EXECUTION")
     print("=" * 60)
     
     # Create sample programs for demonstration
     print("Setting up batch processing environment...")
     program_files = create_sample_files()
     
-    # Define batch job sequence
+    # Define batch jobs; a job only starts once everything in depends_on succeeded.
+    # Lower priority numbers run first; owners share workers by weight.
     batch_jobs = [
-        ('program1.py', 'Number Processing Task'),
-        ('program2.py', 'File Operations Task'),
-        ('program3.py', 'Mathematical Calculations Task'),
-        ('program4.py', 'String Manipulation Task')
+        {'name': 'program1', 'filename': 'program1.py',
+         'description': 'Number Processing Task', 'depends_on': [],
+         'priority': 1, 'owner': 'analytics'},
+        {'name': 'program2', 'filename': 'program2.py',
+         'description': 'File Operations Task', 'depends_on': [],
+         'priority': 3, 'owner': 'reports', 'policy': {'timeout': 30, 'max_retries': 1}},
+        {'name': 'program3', 'filename': 'program3.py',
+         'description': 'Mathematical Calculations Task', 'depends_on': ['program1'],
+         'priority': 2, 'owner': 'analytics'},
+        {'name': 'program4', 'filename': 'program4.py',
+         'description': 'String Manipulation Task', 'depends_on': ['program1'],
+         'priority': 1, 'owner': 'reports'}
     ]
     
+    try:
+        build_job_graph(batch_jobs)
+    except ValueError as e:
+        print(f"ERROR: Invalid batch definition - {e}")
+        return
+    
     # Display batch configuration
     print(f"\nBATCH CONFIGURATION:")
     print(f"Total programs in batch: {len(batch_jobs)}")
-    print(f"Execution mode: Sequential")
+    if parallel:
+        print(f"Execution mode: Parallel (max {max_workers} workers)")
+    else:
+        print(f"Execution mode: Sequential")
+    if warm_pool:
+        print(f"Interpreter: warm worker pool (recycled every {recycle_after} jobs)")
+    if stream:
+        print(f"Output: streamed live, last {tail_lines} lines kept per job")
+    timeout_text = f"{default_policy['timeout']}s" if default_policy['timeout'] else "none"
+    print(f"Default policy: timeout {timeout_text}, {default_policy['max_retries']} retries, "
+          f"backoff from {default_policy['backoff_base']}s")
+    if cache_dir:
+        print(f"Result cache: {cache_dir} (max {cache_max_bytes // (1024 * 1024)} MB)")
     print(f"Working directory: {os.getcwd()}")
+    print("Job dependencies:")
+    for job in batch_jobs:
+        deps = ', '.join(job['depends_on']) if job['depends_on'] else "none"
+        print(f"  {job['name']} <- {deps} (priority {job.get('priority', 0)}, owner {job.get('owner', 'default')})")
+    if owner_weights:
+        weights = ', '.join(f"{owner}={weight:g}" for owner, weight in sorted(owner_weights.items()))
+        print(f"Owner weights: {weights}")
+    
+    # Execute batch
+    print(f"\nSTARTING {mode} BATCH EXECUTION")
     
-    # Execute batch sequentially
-    print(f"\nSTARTING SEQUENTIAL BATCH EXECUTION")
+    pool = None
+    run_attempt = lambda job, policy, attempt: run_job_in_subprocess(job, policy)
+    if warm_pool:
+        pool = create_warm_pool(max_workers if parallel else 1, recycle_after)
+        # Pay for interpreter start and preloading now, not in the first job on each worker
+        pool.warm_up()
+        run_attempt = lambda job, policy, attempt: pool.run(job['filename'], policy['timeout'], job.get('args', []))
+    elif stream:
+        run_attempt = lambda job, policy, attempt: execute_python_file_streaming(
+            job, tail_lines, spill_dir, policy['timeout'], policy['kill_grace'], attempt)
+    run_job = lambda job: run_with_policy(job, run_attempt, default_policy)
+    if cache_dir:
+        run_policy_job = run_job
+        run_job = lambda job: run_cached(job, run_policy_job, cache_dir, cache_max_bytes)
     
-    successful_jobs = 0
-    failed_jobs = 0
+    completed = load_journal(journal_path) if resume else None
+    if resume:
+        if completed is None:
+            print(f"No unfinished batch in {journal_path}; starting from the first job")
+        else:
+            print(f"Resuming from {journal_path}: {len(completed)} jobs already completed")
+    
+    journal = JobJournal(journal_path, resume=completed is not None)
+    if completed is None:
+        journal.record('batch_start', jobs=[job['name'] for job in batch_jobs])
+    else:
+        journal.record('batch_resume', completed=sorted(completed))
+    
+    ready_queue = FairShareQueue(owner_weights, aging_rate)
     batch_start_time = time.time()
     
-    for job_number, (filename, description) in enumerate(batch_jobs, 1):
-        print(f"\nBATCH JOB {job_number}/{len(batch_jobs)}")
-        
-        if run_python_file(filename, description):
-            successful_jobs += 1
+    try:
+        if parallel:
+            results = parallel_batch_execution(batch_jobs, max_workers, run_job, ready_queue,
+                                               journal=journal, completed=completed)
         else:
-            failed_jobs += 1
-        
-        # Simulate batch processing delay between jobs
-        if job_number < len(batch_jobs):
-            print(f"\nBatch processor preparing next job...")
-            time.sleep(1)
+            results = sequential_batch_execution(batch_jobs, run_job, ready_queue=ready_queue,
+                                                 journal=journal, completed=completed)
+        journal.record('batch_complete')
+    finally:
+        journal.close()
+        if pool is not None:
+            pool.close()
+    
+    successful_jobs = sum(1 for result in results if result['status'] == 'SUCCESS')
+    failed_jobs = sum(1 for result in results if result['status'] == 'FAILED')
+    skipped_jobs = sum(1 for result in results if result['status'] == 'SKIPPED')
+    cached_jobs = sum(1 for result in results if result.get('cached'))
+    resumed_jobs = sum(1 for result in results if result.get('resumed'))
     
     # Batch completion summary
     total_time = time.time() - batch_start_time
+    path_length, path_chain = critical_path(batch_jobs, results)
     
     print(f"\n{'='*60}")
     print("BATCH PROCESSING COMPLETE - SUMMARY REPORT")
@@ -159,10 +1330,18 @@ def sequential_batch_processing():
     print(f"Batch Start Time: {time.ctime(batch_start_time)}")
     print(f"Batch End Time: {time.ctime()}")
     print(f"Total Execution Time: {total_time:.2f} seconds")
+    print(f"Critical Path Length: {path_length:.2f} seconds ({' -> '.join(path_chain)})")
     print(f"Programs Executed: {len(batch_jobs)}")
     print(f"Successful Executions: {successful_jobs}")
     print(f"Failed Executions: {failed_jobs}")
+    print(f"Skipped Executions: {skipped_jobs}")
+    if cache_dir:
+        print(f"Cached Results: {cached_jobs}")
+    if resumed_jobs:
+        print(f"Resumed (already completed): {resumed_jobs}")
     print(f"Success Rate: {(successful_jobs/len(batch_jobs))*100:.1f}%")
+    print_resource_report(batch_jobs, results, top_n)
+    print_owner_report(results)
     
     # Generate detailed batch log
     with open('batch_processing_log.txt', 'w') as log_file:
@@ -172,20 +1351,119 @@ def sequential_batch_processing():
         log_file.write(f"Total Programs: {len(batch_jobs)}\n")
         log_file.write(f"Successful: {successful_jobs}\n")
         log_file.write(f"Failed: {failed_jobs}\n")
+        log_file.write(f"Skipped: {skipped_jobs}\n")
+        if cache_dir:
+            log_file.write(f"Cached: {cached_jobs}\n")
+        if resumed_jobs:
+            log_file.write(f"Resumed: {resumed_jobs}\n")
         log_file.write(f"Total Time: {total_time:.2f} seconds\n")
+        log_file.write(f"Critical Path: {path_length:.2f} seconds ({' -> '.join(path_chain)})\n")
         log_file.write(f"Success Rate: {(successful_jobs/len(batch_jobs))*100:.1f}%\n\n")
         
         log_file.write("PROGRAM EXECUTION SEQUENCE:\n")
-        for i, (filename, description) in enumerate(batch_jobs, 1):
-            status = "SUCCESS" if os.path.exists(filename) else "FAILED"
-            log_file.write(f"{i}. {filename} - {description} - {status}\n")
+        for i, (job, result) in enumerate(zip(batch_jobs, results), 1):
+            status = result['status']
+            log_file.write(f"{i}. {job['filename']} - {job['description']} - {status}\n")
+        
+        write_resource_log(log_file, batch_jobs, results, top_n)
+        write_attempt_log(log_file, batch_jobs, results)
+        write_owner_log(log_file, results)
     
     print(f"\nDetailed log saved to: batch_processing_log.txt")
     print(f"Batch processing simulation completed!")
 
 def main():
     """Main function for batch processing simulation"""
-    sequential_batch_processing()
+    parser = argparse.ArgumentParser(description="Batch processing simulation")
+    parser.add_argument('--parallel', action='store_true',
+                        help="run independent jobs concurrently instead of one at a time")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="maximum concurrent jobs in parallel mode (default: CPU count)")
+    parser.add_argument('--warm-pool', action='store_true',
+                        help="run jobs in pre-started worker interpreters instead of a new process each")
+    parser.add_argument('--recycle-after', type=int, default=100,
+                        help="jobs a warm worker runs before it is replaced (default: 100)")
+    parser.add_argument('--stream', action='store_true',
+                        help="forward job output line by line as it is produced")
+    parser.add_argument('--tail-lines', type=int, default=20,
+                        help="lines of each output stream kept for the summary in stream mode (default: 20)")
+    parser.add_argument('--spill-dir', default=None,
+                        help="directory to save each job's full output to in stream mode")
+    parser.add_argument('--top', type=int, default=3,
+                        help="number of top CPU consumers listed in the resource report (default: 3)")
+    parser.add_argument('--timeout', type=float, default=None,
+                        help="default per-job wall-clock limit in seconds before SIGTERM")
+    parser.add_argument('--kill-grace', type=float, default=DEFAULT_JOB_POLICY['kill_grace'],
+                        help="seconds between SIGTERM and SIGKILL for a timed out job (default: 5)")
+    parser.add_argument('--retries', type=int, default=DEFAULT_JOB_POLICY['max_retries'],
+                        help="default number of retries for a failed job (default: 0)")
+    parser.add_argument('--backoff', type=float, default=DEFAULT_JOB_POLICY['backoff_base'],
+                        help="delay before the first retry in seconds, doubled per retry (default: 1)")
+    parser.add_argument('--cache', action='store_true',
+                        help="reuse results of jobs whose script, arguments and inputs are unchanged")
+    parser.add_argument('--cache-dir', default='.batch_cache',
+                        help="directory holding cached job results (default: .batch_cache)")
+    parser.add_argument('--cache-size-mb', type=int, default=64,
+                        help="size cap for the result cache in MB (default: 64)")
+    parser.add_argument('--owner-weight', action='append', default=[], metavar='OWNER=WEIGHT',
+                        help="fair-share weight for a job owner, repeatable (default weight: 1)")
+    parser.add_argument('--aging-rate', type=float, default=0.1,
+                        help="priority levels a waiting job gains per second (default: 0.1)")
+    parser.add_argument('--journal', default='batch_journal.jsonl',
+                        help="file recording job start/finish events as they happen (default: batch_journal.jsonl)")
+    parser.add_argument('--resume', action='store_true',
+                        help="continue an interrupted batch, skipping jobs the journal shows as completed")
+    args = parser.parse_args()
+    
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.workers is not None and not args.parallel:
+        parser.error("--workers only applies with --parallel")
+    if args.recycle_after < 1:
+        parser.error("--recycle-after must be at least 1")
+    if args.tail_lines < 1:
+        parser.error("--tail-lines must be at least 1")
+    if args.stream and args.warm_pool:
+        parser.error("--stream cannot be combined with --warm-pool")
+    if args.spill_dir is not None and not args.stream:
+        parser.error("--spill-dir only applies with --stream")
+    if args.top < 1:
+        parser.error("--top must be at least 1")
+    if args.timeout is not None and args.timeout <= 0:
+        parser.error("--timeout must be positive")
+    if args.retries < 0:
+        parser.error("--retries cannot be negative")
+    if args.cache_size_mb < 1:
+        parser.error("--cache-size-mb must be at least 1")
+    if args.aging_rate < 0:
+        parser.error("--aging-rate cannot be negative")
+    
+    owner_weights = {}
+    for item in args.owner_weight:
+        owner, _, weight = item.partition('=')
+        try:
+            owner_weights[owner] = float(weight)
+        except ValueError:
+            parser.error(f"invalid --owner-weight '{item}', expected OWNER=WEIGHT")
+        if not owner or owner_weights[owner] <= 0:
+            parser.error(f"invalid --owner-weight '{item}', expected OWNER=WEIGHT with a positive weight")
+    
+    default_policy = dict(DEFAULT_JOB_POLICY)
+    default_policy.update({
+        'timeout': args.timeout,
+        'kill_grace': args.kill_grace,
+        'max_retries': args.retries,
+        'backoff_base': args.backoff
+    })
+    
+    sequential_batch_processing(parallel=args.parallel, max_workers=args.workers,
+                                warm_pool=args.warm_pool, recycle_after=args.recycle_after,
+                                stream=args.stream, tail_lines=args.tail_lines, spill_dir=args.spill_dir,
+                                top_n=args.top, default_policy=default_policy,
+                                cache_dir=args.cache_dir if args.cache else None,
+                                cache_max_bytes=args.cache_size_mb * 1024 * 1024,
+                                owner_weights=owner_weights, aging_rate=args.aging_rate,
+                                journal_path=args.journal, resume=args.resume)
 
 if __name__ == "__main__":
     main()
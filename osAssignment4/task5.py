@@ -1,8 +1,28 @@
 #!/usr/bin/env python3
 
+import heapq
+from array import array
+from collections import deque
+
+from gantt import GANTT_MAX_SEGMENTS, GanttChart, render_gantt, write_gantt
+from multicore import BALANCE_POLICIES, QUEUE_MODES, core_utilization, multicore_schedule
+from process_table import ProcessTable, ScheduleResult
+from scheduling_metrics import print_metrics, schedule_metrics
+from workload import BURST_DISTRIBUTIONS, generate_workload, iter_trace_chunks
+
+# Workloads larger than this skip the per-process result table
+SHOW_PROCESSES_LIMIT = 50
+
+# MLFQ defaults: level k gets MLFQ_BASE_QUANTUM * 2**k time units per turn
+MLFQ_LEVELS = 3
+MLFQ_BASE_QUANTUM = 2
+MLFQ_BOOST_INTERVAL = 100
+
 class CPUScheduler:
     def __init__(self):
-        self.processes = []
+        self.processes = ProcessTable()
+        # Per-process result tables are skipped when False, for large simulations
+        self.show_processes = True
     
     def input_processes(self):
         """Get process information from user"""
@@ -15,51 +35,117 @@ class CPUScheduler:
             burst_time = int(input("Enter burst time: "))
             priority = int(input("Enter priority (lower number = higher priority): "))
             
-            self.processes.append({
-                'pid': i + 1,
-                'arrival_time': arrival_time,
-                'burst_time': burst_time,
-                'priority': priority,
-                'remaining_time': burst_time
-            })
+            self.processes.append(i + 1, arrival_time, burst_time, priority)
         
         return self.processes
     
     def sample_processes(self):
         """Use sample processes for demonstration"""
-        self.processes = [
-            {'pid': 1, 'arrival_time': 0, 'burst_time': 8, 'priority': 3, 'remaining_time': 8},
-            {'pid': 2, 'arrival_time': 1, 'burst_time': 4, 'priority': 1, 'remaining_time': 4},
-            {'pid': 3, 'arrival_time': 2, 'burst_time': 9, 'priority': 4, 'remaining_time': 9},
-            {'pid': 4, 'arrival_time': 3, 'burst_time': 5, 'priority': 2, 'remaining_time': 5}
-        ]
+        self.processes = ProcessTable.from_rows([
+            (1, 0, 8, 3),
+            (2, 1, 4, 1),
+            (3, 2, 9, 4),
+            (4, 3, 5, 2)
+        ])
+        self.show_processes = True
         print("Using sample processes:")
-        for p in self.processes:
-            print(f"P{p['pid']}: AT={p['arrival_time']}, BT={p['burst_time']}, Priority={p['priority']}")
+        table = self.processes
+        for i in range(len(table)):
+            print(f"P{table.pid[i]}: AT={table.arrival[i]}, BT={table.burst[i]}, Priority={table.priority[i]}")
+        return self.processes
+
+    def use_workload(self, chunks):
+        """Replace the process table with a streamed workload and summarise it"""
+        table = ProcessTable()
+        for chunk in chunks:
+            table.extend(chunk)
+        self.processes = table
+        self.show_processes = len(table) <= SHOW_PROCESSES_LIMIT
+        
+        n = len(table)
+        print(f"Loaded {n} processes ({table.nbytes() / 1024:.1f} KiB)")
+        if n:
+            print(f"Arrivals: {min(table.arrival)}-{max(table.arrival)}, "
+                  f"Average burst: {sum(table.burst) / n:.2f}, Max burst: {max(table.burst)}")
         return self.processes
 
-    def calculate_metrics(self, processes):
-        """Calculate waiting time and turnaround time"""
-        total_wt = 0
-        total_tat = 0
-        n = len(processes)
+    def load_trace(self, path=None, chunk_size=100_000):
+        """Load processes from a CSV, JSONL or JSON trace file"""
+        if path is None:
+            path = input("Enter trace file path (.csv, .jsonl or .json): ").strip()
+        try:
+            return self.use_workload(iter_trace_chunks(path, chunk_size))
+        except (OSError, ValueError) as e:
+            print(f"Could not load trace: {e}")
+            return self.processes
+
+    def generate_processes(self, count=None, arrival_rate=None, burst_distribution=None,
+                           mean_burst=None, seed=None):
+        """Generate a synthetic workload with Poisson arrivals"""
+        if count is None:
+            count = int(input("Enter number of processes: "))
+            arrival_rate = float(input("Enter arrival rate (processes per time unit): "))
+            burst_distribution = input(f"Enter burst distribution ({'/'.join(BURST_DISTRIBUTIONS)}): ").strip().lower()
+            mean_burst = float(input("Enter mean burst time: "))
+            seed_text = input("Enter random seed (blank for random): ").strip()
+            seed = int(seed_text) if seed_text else None
+        
+        try:
+            return self.use_workload(generate_workload(count, arrival_rate or 0.2,
+                                                       burst_distribution or 'exponential',
+                                                       mean_burst or 5.0, seed=seed))
+        except ValueError as e:
+            print(f"Could not generate workload: {e}")
+            return self.processes
+
+    def calculate_metrics(self, result, cores=1):
+        """Calculate waiting time, turnaround time and the extended scheduling statistics"""
+        metrics = schedule_metrics(result, cores)
+        
+        if self.show_processes:
+            table = result.table
+            waiting = result.waiting()
+            turnaround = result.turnaround()
+            
+            print("\nPID\tArrival\tBurst\tPriority\tWaiting\tTurnaround")
+            print("-" * 60)
+            
+            for i in range(len(table)):
+                print(f"P{table.pid[i]}\t{table.arrival[i]}\t{table.burst[i]}\t{table.priority[i]}\t\t{waiting[i]}\t{turnaround[i]}")
+        else:
+            print()
         
-        print("\nPID\tArrival\tBurst\tPriority\tWaiting\tTurnaround")
         print("-" * 60)
+        print(f"Average Waiting Time: {metrics['avg_waiting']:.2f}")
+        print(f"Average Turnaround Time: {metrics['avg_turnaround']:.2f}")
+        print_metrics(metrics)
         
-        for p in processes:
-            wt = p['waiting_time']
-            tat = p['turnaround_time']
-            total_wt += wt
-            total_tat += tat
-            
-            print(f"P{p['pid']}\t{p['arrival_time']}\t{p['burst_time']}\t{p['priority']}\t\t{wt}\t{tat}")
+        return metrics['avg_waiting'], metrics['avg_turnaround']
+
+    def fcfs_schedule(self):
+        """Run First Come First Serve and return (result, gantt_chart) without printing"""
+        # Sort processes by arrival time
+        table = self.processes.take(self.processes.arrival_order())
+        result = ScheduleResult(table)
+        pid, arrival, burst = table.pid, table.arrival, table.burst
+        completion, start = result.completion, result.start
         
-        print("-" * 60)
-        print(f"Average Waiting Time: {total_wt / n:.2f}")
-        print(f"Average Turnaround Time: {total_tat / n:.2f}")
+        current_time = 0
+        gantt_chart = GanttChart()
+        
+        for i in range(len(table)):
+            if current_time < arrival[i]:
+                current_time = arrival[i]
+            
+            # Calculate times
+            start[i] = current_time
+            completion[i] = start[i] + burst[i]
+            
+            # Add to Gantt chart
+            gantt_chart.append(pid[i], start[i], completion[i])
+            current_time = completion[i]
         
-        return total_wt / n, total_tat / n
+        return result, gantt_chart
 
     def fcfs_scheduling(self):
         """First Come First Serve Scheduling"""
@@ -67,90 +153,135 @@ class CPUScheduler:
         print("FIRST COME FIRST SERVE (FCFS) SCHEDULING")
         print("=" * 60)
         
-        # Sort processes by arrival time
-        sorted_processes = sorted(self.processes, key=lambda x: x['arrival_time'])
+        result, gantt_chart = self.fcfs_schedule()
+        
+        # Display results
+        self.calculate_metrics(result)
+        self.display_gantt_chart(gantt_chart)
         
+        return result
+
+    def non_preemptive_schedule(self, key):
+        """Run a non-preemptive policy that always picks the ready process with the smallest key"""
+        table = self.processes
+        result = ScheduleResult(table)
+        pid, arrival, burst = table.pid, table.arrival, table.burst
+        completion, start = result.completion, result.start
+        n = len(table)
+        completed = 0
         current_time = 0
-        gantt_chart = []
+        gantt_chart = GanttChart()
+        
+        # Processes in arrival order (ties keep table order); the cursor marks the next arrival
+        arrival_order = table.arrival_order()
+        cursor = 0
         
-        for i, p in enumerate(sorted_processes):
-            if current_time < p['arrival_time']:
-                current_time = p['arrival_time']
+        # Ready queue as a min-heap on (key, table position), so ties go to the earlier process
+        ready = []
+        
+        while completed < n:
+            # Move processes that have arrived into the ready queue
+            while cursor < n and arrival[arrival_order[cursor]] <= current_time:
+                i = arrival_order[cursor]
+                heapq.heappush(ready, (key[i], i))
+                cursor += 1
             
-            # Calculate times
-            start_time = current_time
-            completion_time = start_time + p['burst_time']
-            turnaround_time = completion_time - p['arrival_time']
-            waiting_time = start_time - p['arrival_time']
+            if not ready:
+                # CPU idle: jump straight to the next arrival
+                current_time = arrival[arrival_order[cursor]]
+                continue
             
-            # Update process info
-            sorted_processes[i]['completion_time'] = completion_time
-            sorted_processes[i]['turnaround_time'] = turnaround_time
-            sorted_processes[i]['waiting_time'] = waiting_time
+            _, i = heapq.heappop(ready)
+            
+            # Calculate times
+            start[i] = current_time
+            completion[i] = start[i] + burst[i]
             
             # Add to Gantt chart
-            gantt_chart.append((f"P{p['pid']}", start_time, completion_time))
-            current_time = completion_time
-        
-        # Display results
-        self.calculate_metrics(sorted_processes)
-        self.display_gantt_chart(gantt_chart)
+            gantt_chart.append(pid[i], start[i], completion[i])
+            current_time = completion[i]
+            completed += 1
         
-        return sorted_processes
+        return result, gantt_chart
 
-    def sjf_scheduling(self):
-        """Shortest Job First Scheduling (Non-preemptive)"""
-        print("\n" + "=" * 60)
-        print("SHORTEST JOB FIRST (SJF) SCHEDULING")
-        print("=" * 60)
-        
-        processes = self.processes.copy()
-        n = len(processes)
+    def preemptive_schedule(self, key=None):
+        """Run a preemptive policy as a discrete-event simulation.
+
+        The ready process with the smallest key holds the CPU and is only
+        re-examined at arrival and completion events. With no key the remaining
+        burst time is used (SRTF). Ties go to the earlier arrival, so a running
+        process is never preempted by an equal newcomer.
+        """
+        table = self.processes
+        result = ScheduleResult(table)
+        pid, arrival, burst = table.pid, table.arrival, table.burst
+        completion, start = result.completion, result.start
+        remaining = array('q', burst)
+        if key is None:
+            key = remaining
+        n = len(table)
         completed = 0
         current_time = 0
-        gantt_chart = []
+        gantt_chart = GanttChart()
+        
+        # Processes in arrival order; the cursor marks the next arrival event
+        arrival_order = table.arrival_order()
+        cursor = 0
         
-        # Initialize process metrics
-        for p in processes:
-            p['completed'] = False
-            p['waiting_time'] = 0
-            p['turnaround_time'] = 0
-            p['completion_time'] = 0
+        # Ready queue as a min-heap on (key, arrival, table position)
+        ready = []
         
         while completed < n:
-            # Find processes that have arrived and not completed
-            available = [p for p in processes if p['arrival_time'] <= current_time and not p['completed']]
+            # Move processes that have arrived into the ready queue
+            while cursor < n and arrival[arrival_order[cursor]] <= current_time:
+                i = arrival_order[cursor]
+                heapq.heappush(ready, (key[i], arrival[i], i))
+                cursor += 1
             
-            if not available:
-                current_time += 1
+            if not ready:
+                # CPU idle: jump straight to the next arrival
+                current_time = arrival[arrival_order[cursor]]
                 continue
             
-            # Select process with shortest burst time
-            next_process = min(available, key=lambda x: x['burst_time'])
-            pid = next_process['pid'] - 1
+            _, _, i = heapq.heappop(ready)
+            if remaining[i] == burst[i]:
+                # First time on the CPU, which is what response time measures
+                start[i] = current_time
             
-            # Calculate times
-            start_time = current_time
-            completion_time = start_time + next_process['burst_time']
-            turnaround_time = completion_time - next_process['arrival_time']
-            waiting_time = start_time - next_process['arrival_time']
+            # Run until the process completes or the next arrival may preempt it
+            run_until = current_time + remaining[i]
+            if cursor < n:
+                run_until = min(run_until, arrival[arrival_order[cursor]])
             
-            # Update process info
-            processes[pid]['completion_time'] = completion_time
-            processes[pid]['turnaround_time'] = turnaround_time
-            processes[pid]['waiting_time'] = waiting_time
-            processes[pid]['completed'] = True
+            # Add to Gantt chart (a process that kept the CPU extends its last slice)
+            gantt_chart.append(pid[i], current_time, run_until)
             
-            # Add to Gantt chart
-            gantt_chart.append((f"P{next_process['pid']}", start_time, completion_time))
-            current_time = completion_time
-            completed += 1
+            remaining[i] -= run_until - current_time
+            current_time = run_until
+            
+            if remaining[i] > 0:
+                heapq.heappush(ready, (key[i], arrival[i], i))
+            else:
+                # Process completed
+                completion[i] = current_time
+                completed += 1
+        
+        return result, gantt_chart
+
+    def sjf_scheduling(self):
+        """Shortest Job First Scheduling (Non-preemptive)"""
+        print("\n" + "=" * 60)
+        print("SHORTEST JOB FIRST (SJF) SCHEDULING")
+        print("=" * 60)
+        
+        # Select process with shortest burst time
+        result, gantt_chart = self.non_preemptive_schedule(self.processes.burst)
         
         # Display results
-        self.calculate_metrics(processes)
+        self.calculate_metrics(result)
         self.display_gantt_chart(gantt_chart)
         
-        return processes
+        return result
 
     def priority_scheduling(self):
         """Priority Scheduling (Non-preemptive)"""
@@ -158,149 +289,302 @@ class CPUScheduler:
         print("PRIORITY SCHEDULING (Non-preemptive)")
         print("=" * 60)
         
-        processes = self.processes.copy()
-        n = len(processes)
-        completed = 0
-        current_time = 0
-        gantt_chart = []
+        # Select process with highest priority (lowest priority number)
+        result, gantt_chart = self.non_preemptive_schedule(self.processes.priority)
         
-        # Initialize process metrics
-        for p in processes:
-            p['completed'] = False
-            p['waiting_time'] = 0
-            p['turnaround_time'] = 0
-            p['completion_time'] = 0
+        # Display results
+        self.calculate_metrics(result)
+        self.display_gantt_chart(gantt_chart)
         
-        while completed < n:
-            # Find processes that have arrived and not completed
-            available = [p for p in processes if p['arrival_time'] <= current_time and not p['completed']]
-            
-            if not available:
-                current_time += 1
-                continue
-            
-            # Select process with highest priority (lowest priority number)
-            next_process = min(available, key=lambda x: x['priority'])
-            pid = next_process['pid'] - 1
-            
-            # Calculate times
-            start_time = current_time
-            completion_time = start_time + next_process['burst_time']
-            turnaround_time = completion_time - next_process['arrival_time']
-            waiting_time = start_time - next_process['arrival_time']
-            
-            # Update process info
-            processes[pid]['completion_time'] = completion_time
-            processes[pid]['turnaround_time'] = turnaround_time
-            processes[pid]['waiting_time'] = waiting_time
-            processes[pid]['completed'] = True
-            
-            # Add to Gantt chart
-            gantt_chart.append((f"P{next_process['pid']}", start_time, completion_time))
-            current_time = completion_time
-            completed += 1
+        return result
+
+    def srtf_scheduling(self):
+        """Shortest Remaining Time First Scheduling (Preemptive SJF)"""
+        print("\n" + "=" * 60)
+        print("SHORTEST REMAINING TIME FIRST (SRTF) SCHEDULING")
+        print("=" * 60)
+        
+        # Select process with shortest remaining time at every arrival and completion
+        result, gantt_chart = self.preemptive_schedule()
         
         # Display results
-        self.calculate_metrics(processes)
+        self.calculate_metrics(result)
         self.display_gantt_chart(gantt_chart)
         
-        return processes
+        return result
 
-    def round_robin_scheduling(self):
-        """Round Robin Scheduling"""
+    def preemptive_priority_scheduling(self):
+        """Priority Scheduling (Preemptive)"""
         print("\n" + "=" * 60)
-        print("ROUND ROBIN SCHEDULING")
+        print("PRIORITY SCHEDULING (Preemptive)")
         print("=" * 60)
         
-        time_quantum = int(input("Enter time quantum: "))
+        # A newly arrived process with higher priority (lower number) takes the CPU
+        result, gantt_chart = self.preemptive_schedule(self.processes.priority)
         
-        processes = self.processes.copy()
-        n = len(processes)
+        # Display results
+        self.calculate_metrics(result)
+        self.display_gantt_chart(gantt_chart)
+        
+        return result
+
+    def round_robin_schedule(self, time_quantum):
+        """Run Round Robin with the given quantum and return (result, gantt_chart) without printing"""
+        table = self.processes
+        result = ScheduleResult(table)
+        pid, arrival, burst = table.pid, table.arrival, table.burst
+        completion, start = result.completion, result.start
+        remaining = array('q', burst)
+        n = len(table)
         completed = 0
         current_time = 0
-        gantt_chart = []
-        
-        # Initialize process metrics
-        for p in processes:
-            p['remaining_time'] = p['burst_time']
-            p['waiting_time'] = 0
-            p['turnaround_time'] = 0
-            p['completion_time'] = 0
-            p['started'] = False
-        
-        queue = []
+        gantt_chart = GanttChart()
+        
+        # Processes in arrival order; the cursor marks the next one not yet queued
+        arrival_order = table.arrival_order()
+        cursor = 0
+        
+        def admit_arrivals():
+            """Queue every process that has arrived by current_time, in table order"""
+            nonlocal cursor
+            arrived = []
+            while cursor < n and arrival[arrival_order[cursor]] <= current_time:
+                arrived.append(arrival_order[cursor])
+                cursor += 1
+            queue.extend(sorted(arrived))
+        
+        queue = deque()
         while completed < n:
             # Add processes that have arrived to queue
-            for p in processes:
-                if (p['arrival_time'] <= current_time and 
-                    not p['started'] and 
-                    p['remaining_time'] > 0 and
-                    p not in queue):
-                    queue.append(p)
-                    p['started'] = True
+            admit_arrivals()
             
             if not queue:
-                current_time += 1
+                # CPU idle: jump straight to the next arrival
+                current_time = arrival[arrival_order[cursor]]
                 continue
             
             # Get next process from queue
-            current_process = queue.pop(0)
-            pid = current_process['pid'] - 1
+            i = queue.popleft()
             
             # Execute process for time quantum or remaining time
             start_time = current_time
-            execution_time = min(time_quantum, current_process['remaining_time'])
-            completion_time = start_time + execution_time
+            if remaining[i] == burst[i]:
+                # First time on the CPU, which is what response time measures
+                start[i] = start_time
+            execution_time = min(time_quantum, remaining[i])
+            current_time = start_time + execution_time
             
             # Add to Gantt chart
-            gantt_chart.append((f"P{current_process['pid']}", start_time, completion_time))
+            gantt_chart.append(pid[i], start_time, current_time)
             
             # Update remaining time
-            current_process['remaining_time'] -= execution_time
-            current_time = completion_time
+            remaining[i] -= execution_time
             
             # Add processes that arrived during execution
-            for p in processes:
-                if (p['arrival_time'] <= current_time and 
-                    not p['started'] and 
-                    p['remaining_time'] > 0 and
-                    p not in queue):
-                    queue.append(p)
-                    p['started'] = True
+            admit_arrivals()
             
             # If process not completed, add back to queue
-            if current_process['remaining_time'] > 0:
-                queue.append(current_process)
+            if remaining[i] > 0:
+                queue.append(i)
             else:
                 # Process completed
-                current_process['completion_time'] = current_time
-                current_process['turnaround_time'] = current_time - current_process['arrival_time']
-                current_process['waiting_time'] = current_process['turnaround_time'] - current_process['burst_time']
+                completion[i] = current_time
+                completed += 1
+        
+        return result, gantt_chart
+
+    def round_robin_scheduling(self, time_quantum=None):
+        """Round Robin Scheduling"""
+        print("\n" + "=" * 60)
+        print("ROUND ROBIN SCHEDULING")
+        print("=" * 60)
+        
+        if time_quantum is None:
+            time_quantum = int(input("Enter time quantum: "))
+        
+        result, gantt_chart = self.round_robin_schedule(time_quantum)
+        
+        # Display results
+        self.calculate_metrics(result)
+        self.display_gantt_chart(gantt_chart)
+        
+        return result
+
+    def mlfq_schedule(self, quanta, boost_interval=None):
+        """Run a multilevel feedback queue and return (result, gantt_chart, finished_per_level).
+
+        quanta[k] is the time allotment of level k (level 0 is the highest).
+        New processes enter level 0; a process that uses up its allotment is
+        demoted one level, and one preempted by a new arrival keeps its place and
+        the rest of its allotment. Every boost_interval time units all processes
+        move back to level 0, so long jobs cannot starve.
+        """
+        if not quanta or min(quanta) <= 0:
+            raise ValueError("MLFQ needs at least one level and every quantum must be at least 1")
+        table = self.processes
+        result = ScheduleResult(table)
+        pid, arrival, burst = table.pid, table.arrival, table.burst
+        completion, start = result.completion, result.start
+        remaining = array('q', burst)
+        levels = len(quanta)
+        level_of = array('q', bytes(8 * len(table)))
+        used = array('q', bytes(8 * len(table)))
+        finished_per_level = [0] * levels
+        n = len(table)
+        completed = 0
+        current_time = 0
+        gantt_chart = GanttChart()
+        next_boost = boost_interval if boost_interval else None
+        
+        # Processes in arrival order; the cursor marks the next one not yet queued
+        arrival_order = table.arrival_order()
+        cursor = 0
+        queues = [deque() for _ in range(levels)]
+        
+        def admit_arrivals():
+            """Queue every process that has arrived by current_time at the top level, in table order"""
+            nonlocal cursor
+            arrived = []
+            while cursor < n and arrival[arrival_order[cursor]] <= current_time:
+                arrived.append(arrival_order[cursor])
+                cursor += 1
+            queues[0].extend(sorted(arrived))
+        
+        while completed < n:
+            admit_arrivals()
+            
+            if next_boost is not None and current_time >= next_boost:
+                # Priority boost: every waiting process returns to the top level
+                for level in range(1, levels):
+                    for i in queues[level]:
+                        level_of[i] = 0
+                        used[i] = 0
+                    queues[0].extend(queues[level])
+                    queues[level].clear()
+                while next_boost <= current_time:
+                    next_boost += boost_interval
+            
+            level = next((k for k in range(levels) if queues[k]), None)
+            if level is None:
+                # CPU idle: jump straight to the next arrival
+                current_time = arrival[arrival_order[cursor]]
+                continue
+            
+            i = queues[level].popleft()
+            if remaining[i] == burst[i]:
+                # First time on the CPU, which is what response time measures
+                start[i] = current_time
+            
+            # Run for the rest of the allotment; below the top level a new arrival
+            # (or a boost) preempts, since it would sit in a higher queue
+            run_until = current_time + min(quanta[level] - used[i], remaining[i])
+            preemptible = level > 0
+            if preemptible and cursor < n:
+                run_until = min(run_until, arrival[arrival_order[cursor]])
+            if preemptible and next_boost is not None:
+                run_until = min(run_until, next_boost)
+            
+            # Add to Gantt chart (a process that kept the CPU extends its last slice)
+            gantt_chart.append(pid[i], current_time, run_until)
+            
+            remaining[i] -= run_until - current_time
+            used[i] += run_until - current_time
+            current_time = run_until
+            
+            # Add processes that arrived during execution
+            admit_arrivals()
+            
+            if remaining[i] == 0:
+                # Process completed
+                completion[i] = current_time
+                finished_per_level[level] += 1
                 completed += 1
+            elif used[i] >= quanta[level]:
+                # Allotment used up: demote (the bottom level is plain round robin)
+                level_of[i] = min(level + 1, levels - 1)
+                used[i] = 0
+                queues[level_of[i]].append(i)
+            else:
+                # Preempted by a higher level: resume first when this level runs again
+                queues[level].appendleft(i)
+        
+        return result, gantt_chart, finished_per_level
+
+    def mlfq_scheduling(self, quanta=None, boost_interval=None):
+        """Multilevel Feedback Queue Scheduling"""
+        print("\n" + "=" * 60)
+        print("MULTILEVEL FEEDBACK QUEUE (MLFQ) SCHEDULING")
+        print("=" * 60)
+        
+        if quanta is None:
+            levels = int(input(f"Enter number of levels (default {MLFQ_LEVELS}): ") or MLFQ_LEVELS)
+            quanta_text = input("Enter time quantum per level, top level first (blank to double each level): ").split()
+            quanta = [int(q) for q in quanta_text] or [MLFQ_BASE_QUANTUM * 2 ** k for k in range(levels)]
+            boost_interval = int(input(f"Enter priority boost interval, 0 for none (default {MLFQ_BOOST_INTERVAL}): ")
+                                 or MLFQ_BOOST_INTERVAL)
+        
+        try:
+            result, gantt_chart, finished_per_level = self.mlfq_schedule(quanta, boost_interval)
+        except ValueError as e:
+            print(f"Could not run MLFQ simulation: {e}")
+            return None
+        
+        print("Levels: " + ", ".join(f"Q{k} (quantum {q}): {finished} finished"
+                                     for k, (q, finished) in enumerate(zip(quanta, finished_per_level))))
+        print(f"Priority boost: {f'every {boost_interval} time units' if boost_interval else 'off'}")
         
         # Display results
-        self.calculate_metrics(processes)
+        self.calculate_metrics(result)
         self.display_gantt_chart(gantt_chart)
         
-        return processes
+        return result
 
-    def display_gantt_chart(self, gantt_chart):
-        """Display Gantt chart"""
-        print("\nGANTT CHART:")
-        print("-" * 50)
-        
-        # Print top line
-        for process, start, end in gantt_chart:
-            print(f" {process} ", end="")
-        print()
-        
-        # Print timeline
-        print("0", end="")
-        for process, start, end in gantt_chart:
-            print(f"---{end}", end="")
-        print()
+    def multicore_scheduling(self, cores=None, time_quantum=None, mode=None, balance=None,
+                             balance_interval=10, affinity=None):
+        """Round Robin Scheduling on several cores"""
+        print("\n" + "=" * 60)
+        print("MULTI-CORE ROUND ROBIN SCHEDULING")
+        print("=" * 60)
+        
+        if cores is None:
+            cores = int(input("Enter number of cores: "))
+            time_quantum = int(input("Enter time quantum: "))
+            mode = input(f"Enter run queue mode ({'/'.join(QUEUE_MODES)}): ").strip().lower() or 'per-core'
+            balance = 'none'
+            if mode == 'per-core':
+                balance = input(f"Enter load balancing ({'/'.join(BALANCE_POLICIES)}): ").strip().lower() or 'steal'
+                if balance == 'periodic':
+                    balance_interval = int(input("Enter balancing interval: "))
+            pins = input("Pin processes to cores as pid:core pairs (blank for none): ").split()
+            affinity = {int(process): int(core) for process, core in (pin.split(':') for pin in pins)}
+        
+        try:
+            result, gantt_charts, busy_time, migrations = multicore_schedule(
+                self.processes, cores, time_quantum, mode or 'per-core', balance or 'steal',
+                balance_interval, affinity)
+        except ValueError as e:
+            print(f"Could not run multi-core simulation: {e}")
+            return None
+        
+        print(f"Cores: {cores}, Quantum: {time_quantum}, Queues: {mode}, Balancing: {balance}, "
+              f"Migrations: {migrations}")
+        
+        # Display results
+        self.calculate_metrics(result, cores)
+        utilization = core_utilization(result, busy_time)
+        for core, gantt_chart in enumerate(gantt_charts):
+            print(f"\nCPU {core}: busy {busy_time[core]} time units, utilization {utilization[core]:.2f}%")
+            self.display_gantt_chart(gantt_chart)
+        
+        return result
+
+    def display_gantt_chart(self, gantt_chart, window_start=None, window_end=None):
+        """Display Gantt chart, optionally only the time window [window_start, window_end)"""
+        # Small workloads show every slice; large ones are downsampled to a readable width
+        max_segments = None if self.show_processes else GANTT_MAX_SEGMENTS
+        write_gantt(render_gantt(gantt_chart, window_start, window_end, max_segments))
 
-    def compare_algorithms(self):
+    def compare_algorithms(self, time_quantum=None):
         """Compare all scheduling algorithms"""
         print("\n" + "=" * 70)
         print("COMPARISON OF ALL SCHEDULING ALGORITHMS")
@@ -312,7 +596,11 @@ class CPUScheduler:
         results['FCFS'] = self.fcfs_scheduling()
         results['SJF'] = self.sjf_scheduling()
         results['Priority'] = self.priority_scheduling()
-        results['Round Robin'] = self.round_robin_scheduling()
+        results['Round Robin'] = self.round_robin_scheduling(time_quantum)
+        results['SRTF'] = self.srtf_scheduling()
+        results['Preemptive Priority'] = self.preemptive_priority_scheduling()
+        results['MLFQ'] = self.mlfq_scheduling([MLFQ_BASE_QUANTUM * 2 ** k for k in range(MLFQ_LEVELS)],
+                                               MLFQ_BOOST_INTERVAL)
         
         # Calculate averages for comparison
         print("\n" + "=" * 70)
@@ -322,12 +610,22 @@ class CPUScheduler:
         print("-" * 70)
         
         comparison_data = []
-        for algo_name, processes in results.items():
-            avg_wt = sum(p['waiting_time'] for p in processes) / len(processes)
-            avg_tat = sum(p['turnaround_time'] for p in processes) / len(processes)
+        all_metrics = {}
+        for algo_name, result in results.items():
+            metrics = all_metrics[algo_name] = schedule_metrics(result)
+            avg_wt = metrics['avg_waiting']
+            avg_tat = metrics['avg_turnaround']
             comparison_data.append((algo_name, avg_wt, avg_tat))
             print(f"{algo_name:<20}{avg_wt:<20.2f}{avg_tat:<20.2f}")
         
+        print("\n" + "-" * 70)
+        print(f"{'Algorithm':<20}{'Resp':>8}{'p95 WT':>8}{'Max WT':>8}{'Thruput':>9}{'CPU %':>8}{'Fairness':>9}")
+        print("-" * 70)
+        for algo_name, metrics in all_metrics.items():
+            print(f"{algo_name:<20}{metrics['avg_response']:>8.2f}{metrics['p95_waiting']:>8}"
+                  f"{metrics['max_waiting']:>8}{metrics['throughput']:>9.4f}"
+                  f"{metrics['cpu_utilization']:>8.2f}{metrics['fairness']:>9.4f}")
+        
         # Find best algorithm
         best_wt = min(comparison_data, key=lambda x: x[1])
         best_tat = min(comparison_data, key=lambda x: x[2])
@@ -349,9 +647,15 @@ class CPUScheduler:
             print("5. Priority Scheduling")
             print("6. Round Robin Scheduling")
             print("7. Compare All Algorithms")
-            print("8. Exit")
+            print("8. Shortest Remaining Time First (SRTF)")
+            print("9. Preemptive Priority Scheduling")
+            print("10. Multilevel Feedback Queue (MLFQ)")
+            print("11. Multi-Core Round Robin")
+            print("12. Load Workload Trace (CSV/JSONL/JSON)")
+            print("13. Generate Synthetic Workload")
+            print("14. Exit")
             
-            choice = input("\nEnter your choice (1-8): ").strip()
+            choice = input("\nEnter your choice (1-14): ").strip()
             
             if choice == '1':
                 self.input_processes()
@@ -383,10 +687,34 @@ class CPUScheduler:
                     self.sample_processes()
                 self.compare_algorithms()
             elif choice == '8':
+                if not self.processes:
+                    print("No processes loaded. Using sample processes.")
+                    self.sample_processes()
+                self.srtf_scheduling()
+            elif choice == '9':
+                if not self.processes:
+                    print("No processes loaded. Using sample processes.")
+                    self.sample_processes()
+                self.preemptive_priority_scheduling()
+            elif choice == '10':
+                if not self.processes:
+                    print("No processes loaded. Using sample processes.")
+                    self.sample_processes()
+                self.mlfq_scheduling()
+            elif choice == '11':
+                if not self.processes:
+                    print("No processes loaded. Using sample processes.")
+                    self.sample_processes()
+                self.multicore_scheduling()
+            elif choice == '12':
+                self.load_trace()
+            elif choice == '13':
+                self.generate_processes()
+            elif choice == '14':
                 print("Exiting CPU Scheduling Simulator.")
                 break
             else:
-                print("Invalid choice! Please enter 1-8.")
+                print("Invalid choice! Please enter 1-14.")
             
             input("\nPress Enter to continue...")
 
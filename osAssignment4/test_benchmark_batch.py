@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+
+import time
+
+import pytest
+
+import benchmark_batch
+import task1
+from benchmark_batch import EXECUTION_MODES, create_job_mix, percentile, run_mode
+
+def test_percentile_is_nearest_rank():
+    values = [5, 1, 4, 2, 3]
+    assert [percentile(values, pct) for pct in (1, 20, 21, 50, 95, 100)] == [1, 1, 2, 3, 5, 5]
+    assert percentile([], 50) == 0.0
+
+@pytest.mark.parametrize('mode', EXECUTION_MODES)
+def test_every_mode_runs_the_whole_mix(tmp_path, mode):
+    jobs = create_job_mix(str(tmp_path), 'startup', 3)
+    row = run_mode(mode, jobs, 2)
+    assert row['jobs'] == 3 and row['failed'] == 0
+    assert 0 < row['p50'] <= row['p95'] <= row['p99'] <= row['makespan']
+    assert row['throughput'] == pytest.approx(3 / row['makespan'])
+
+def test_makespan_stops_before_pool_shutdown(tmp_path, monkeypatch):
+    # Regression: the clock kept running while the warm pool shut down
+    close = task1.WarmPool.close
+    def slow_close(pool):
+        time.sleep(1.0)
+        close(pool)
+    monkeypatch.setattr(task1.WarmPool, 'close', slow_close)
+    start_time = time.time()
+    row = run_mode('warm-pool', create_job_mix(str(tmp_path), 'startup', 2), 2)
+    assert time.time() - start_time >= 1.0
+    assert row['makespan'] < 1.0
+
+def test_benchmark_runs_each_mix_in_each_mode(monkeypatch):
+    monkeypatch.setattr(benchmark_batch, 'run_mode', lambda mode, jobs, workers: {'jobs': len(jobs)})
+    rows = benchmark_batch.run_benchmark(['cpu', 'sleep'], ['sequential', 'warm-pool'], 2, 4)
+    assert [(row['mix'], row['mode'], row['workers'], row['jobs']) for row in rows] == [
+        ('cpu', 'sequential', 1, 2), ('cpu', 'warm-pool', 4, 2),
+        ('sleep', 'sequential', 1, 2), ('sleep', 'warm-pool', 4, 2)]
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+
+import random
+
+import pytest
+
+from gantt import IDLE, GanttChart, gantt_view
+
+def random_chart(seed, slices=200):
+    """A chart with repeated pids, idle gaps and slices that continue the previous one"""
+    rng = random.Random(seed)
+    chart = GanttChart()
+    time = rng.randint(0, 5)
+    for _ in range(slices):
+        time += rng.choice([0, 0, 0, 1, 7])
+        length = rng.randint(1, 9)
+        chart.append(rng.randint(1, 4), time, time + length)
+        time += length
+    return chart
+
+def timeline(chart):
+    """Pid at every time unit the chart covers"""
+    return {t: pid for pid, start, end in zip(chart.pid, chart.start, chart.end) for t in range(start, end)}
+
+def test_append_extends_a_continuing_slice():
+    chart = GanttChart()
+    chart.append(1, 0, 3)
+    chart.append(1, 3, 5)
+    chart.append(1, 6, 8)
+    chart.append(2, 8, 9)
+    assert list(chart) == [('P1', 0, 5), ('P1', 6, 8), ('P2', 8, 9)]
+    assert chart.last_end() == 9
+
+@pytest.mark.parametrize('seed', range(20))
+def test_pid_at_matches_the_timeline(seed):
+    chart = random_chart(seed)
+    units = timeline(chart)
+    for t in range(-2, chart.last_end() + 3):
+        assert chart.pid_at(t) == units.get(t, IDLE)
+
+@pytest.mark.parametrize('seed', range(20))
+def test_window_keeps_exactly_the_time_inside_it(seed):
+    chart = random_chart(seed)
+    units = timeline(chart)
+    rng = random.Random(seed)
+    for _ in range(20):
+        window_start = rng.randint(-5, chart.last_end())
+        window_end = rng.randint(window_start, chart.last_end() + 5)
+        window = chart.window(window_start, window_end)
+        assert timeline(window) == {t: pid for t, pid in units.items() if window_start <= t < window_end}
+        first, last = chart.slice_range(window_start, window_end)
+        assert len(window) <= last - first
+
+@pytest.mark.parametrize('seed', range(20))
+@pytest.mark.parametrize('max_segments', [1, 7, 50, 10_000])
+def test_downsample_tiles_the_window_with_midpoint_labels(seed, max_segments):
+    chart = random_chart(seed)
+    units = timeline(chart)
+    window_start, window_end = 3, chart.last_end() - 2
+    view, width = chart.downsample(window_start, window_end, max_segments)
+
+    assert -(-(window_end - window_start) // width) <= max_segments
+    assert view.start[0] == window_start and view.last_end() == window_end
+    assert all(end == start for end, start in zip(view.end, view.start[1:]))
+    # Every bucket of width time units shows the pid running at its midpoint
+    for bucket_start in range(window_start, window_end, width):
+        bucket_end = min(bucket_start + width, window_end)
+        middle = (bucket_start + bucket_end - 1) // 2
+        assert view.pid_at(bucket_start) == units.get(middle, IDLE)
+    if width == 1:
+        assert timeline(view) == {t: units.get(t, IDLE) for t in range(window_start, window_end)}
+
+def test_gantt_view_downsamples_only_long_charts():
+    chart = random_chart(4)
+    view, origin, note = gantt_view(chart, max_segments=len(chart))
+    assert view is chart and origin == 0 and note == ""
+
+    view, origin, note = gantt_view(chart, 10, 60, max_segments=len(chart))
+    assert timeline(view) == {t: pid for t, pid in timeline(chart).items() if 10 <= t < 60}
+    assert origin == 10 and note == "(time 10 to 60)"
+
+    view, origin, note = gantt_view(chart, max_segments=10)
+    assert len(view) <= 10 and view.start[0] == 0 and view.last_end() == chart.last_end()
+    assert "downsampled" in note
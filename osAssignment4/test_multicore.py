@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+
+import pytest
+
+from gantt import IDLE
+from multicore import BALANCE_POLICIES, QUEUE_MODES, multicore_schedule
+from test_task5 import random_rows, scheduler_for
+
+@pytest.mark.parametrize('seed', range(10))
+@pytest.mark.parametrize('mode', QUEUE_MODES)
+@pytest.mark.parametrize('balance', BALANCE_POLICIES)
+@pytest.mark.parametrize('time_quantum', [1, 3, 20])
+def test_one_core_is_round_robin(seed, mode, balance, time_quantum):
+    rows = random_rows(seed, 40)
+    scheduler = scheduler_for(rows)
+    expected, _ = scheduler.round_robin_schedule(time_quantum)
+    result, _, busy_time, migrations = multicore_schedule(scheduler.processes, 1, time_quantum, mode, balance, 5)
+    assert list(result.start) == list(expected.start)
+    assert list(result.completion) == list(expected.completion)
+    assert busy_time == [sum(row[2] for row in rows)]
+    assert migrations == 0
+
+@pytest.mark.parametrize('seed', range(10))
+@pytest.mark.parametrize('mode, balance', [('global', 'none'), ('per-core', 'steal'),
+                                           ('per-core', 'periodic'), ('per-core', 'none')])
+@pytest.mark.parametrize('cores', [2, 4, 7])
+def test_cores_share_work_without_overlap(seed, mode, balance, cores):
+    rows = random_rows(seed, 60)
+    affinity = {1: 0, 2: cores - 1}
+    result, gantt_charts, busy_time, _ = multicore_schedule(
+        scheduler_for(rows).processes, cores, 3, mode, balance, 4, affinity)
+
+    runs = {row[0]: [] for row in rows}
+    for core, chart in enumerate(gantt_charts):
+        ran = 0
+        for pid, begin, end in zip(chart.pid, chart.start, chart.end):
+            if pid != IDLE:
+                runs[pid].append((begin, end, core))
+                ran += end - begin
+        assert ran == busy_time[core]
+
+    for i, row in enumerate(rows):
+        spans = sorted(runs[row[0]])
+        # A process runs on one core at a time, only after it arrives, for exactly its burst
+        assert all(end <= next_begin for (_, end, _), (next_begin, _, _) in zip(spans, spans[1:]))
+        assert spans[0][0] == result.start[i] >= row[1]
+        assert spans[-1][1] == result.completion[i]
+        assert sum(end - begin for begin, end, _ in spans) == row[2]
+    assert {core for _, _, core in runs[1]} == {0}
+    assert {core for _, _, core in runs[2]} == {cores - 1}
+
+def test_bad_settings_are_rejected():
+    table = scheduler_for(random_rows(1, 5)).processes
+    for args in [(0, 2), (2, 0)]:
+        with pytest.raises(ValueError):
+            multicore_schedule(table, *args)
+    with pytest.raises(ValueError):
+        multicore_schedule(table, 2, 2, mode='shared')
+    with pytest.raises(ValueError):
+        multicore_schedule(table, 2, 2, affinity={1: 2})
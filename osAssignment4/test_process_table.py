@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+
+import random
+
+import pytest
+
+from process_table import ProcessTable, ScheduleResult
+
+def random_table(seed, count):
+    rng = random.Random(seed)
+    return ProcessTable.from_rows((pid, rng.randint(0, 20), rng.randint(1, 9), rng.randint(1, 5))
+                                  for pid in range(1, count + 1))
+
+@pytest.mark.parametrize('seed', range(10))
+@pytest.mark.parametrize('count', [0, 1, 50])
+def test_arrival_order_is_a_stable_sort(seed, count):
+    table = random_table(seed, count)
+    order = table.arrival_order()
+    assert order.typecode == 'q'
+    assert list(order) == sorted(range(count), key=lambda i: table.arrival[i])
+
+def test_arrival_order_of_sorted_table_is_identity():
+    table = ProcessTable.from_rows([(1, 0, 3, 1), (2, 0, 2, 1), (3, 4, 1, 1)])
+    assert list(table.arrival_order()) == [0, 1, 2]
+
+@pytest.mark.parametrize('seed', range(10))
+def test_take_and_extend_keep_rows_together(seed):
+    table = random_table(seed, 30)
+    indices = random.Random(seed).sample(range(30), 12)
+    taken = table.take(indices)
+    assert [taken.row(k) for k in range(len(taken))] == [table.row(i) for i in indices]
+    
+    combined = ProcessTable()
+    combined.extend(table)
+    combined.extend(taken)
+    assert len(combined) == 42
+    assert combined.row(30) == table.row(indices[0])
+    assert combined.nbytes() == 42 * 4 * 8
+
+def test_mismatched_columns_are_rejected():
+    with pytest.raises(ValueError):
+        ProcessTable([1, 2], [0], [1, 1], [0, 0])
+
+@pytest.mark.parametrize('seed', range(10))
+def test_waiting_and_turnaround_match_per_process_formulas(seed):
+    table = random_table(seed, 25)
+    rng = random.Random(seed)
+    result = ScheduleResult(table)
+    for i in range(len(table)):
+        result.completion[i] = table.arrival[i] + table.burst[i] + rng.randint(0, 15)
+    assert list(result.turnaround()) == [result.completion[i] - table.arrival[i] for i in range(25)]
+    assert list(result.waiting()) == [result.completion[i] - table.arrival[i] - table.burst[i]
+                                      for i in range(25)]
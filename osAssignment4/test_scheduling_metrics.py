@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+import math
+import random
+
+import pytest
+
+import scheduling_metrics
+from process_table import ProcessTable, ScheduleResult
+from scheduling_metrics import schedule_metrics
+
+@pytest.fixture(params=['python', 'numpy'])
+def backend(request, monkeypatch):
+    """Run a test once with plain Python and once with NumPy, where installed"""
+    if request.param == 'numpy':
+        if scheduling_metrics.np is None:
+            pytest.skip("NumPy is not installed")
+    else:
+        monkeypatch.setattr(scheduling_metrics, 'np', None)
+    return request.param
+
+def random_result(seed, count):
+    """A random but consistent schedule: completion comes after arrival plus burst"""
+    rng = random.Random(seed)
+    table = ProcessTable.from_rows((pid, rng.randint(0, 40), rng.randint(1, 12), 1)
+                                   for pid in range(1, count + 1))
+    result = ScheduleResult(table)
+    for i in range(count):
+        result.start[i] = table.arrival[i] + rng.randint(0, 10)
+        result.completion[i] = result.start[i] + table.burst[i] + rng.randint(0, 10)
+    return result
+
+def reference_metrics(result, cores=1):
+    """Per-process formulas computed one process at a time"""
+    table = result.table
+    n = len(table)
+    waiting = [result.completion[i] - table.arrival[i] - table.burst[i] for i in range(n)]
+    turnaround = [result.completion[i] - table.arrival[i] for i in range(n)]
+    response = [result.start[i] - table.arrival[i] for i in range(n)]
+    slowdown = [turnaround[i] / table.burst[i] for i in range(n)]
+    makespan = max(result.completion) - min(table.arrival)
+    ranked = sorted(waiting)
+    return {
+        'avg_waiting': sum(waiting) / n,
+        'avg_turnaround': sum(turnaround) / n,
+        'avg_response': sum(response) / n,
+        'max_waiting': max(waiting),
+        'makespan': makespan,
+        'throughput': n / makespan,
+        'cpu_utilization': sum(table.burst) / (makespan * cores) * 100,
+        'fairness': sum(slowdown) ** 2 / (n * sum(s * s for s in slowdown)),
+        'p50_waiting': ranked[math.ceil(0.50 * n) - 1],
+        'p95_waiting': ranked[math.ceil(0.95 * n) - 1],
+        'p99_waiting': ranked[math.ceil(0.99 * n) - 1]
+    }
+
+@pytest.mark.parametrize('seed', range(10))
+@pytest.mark.parametrize('count', [1, 7, 200])
+@pytest.mark.parametrize('cores', [1, 4])
+def test_metrics_match_per_process_reference(backend, seed, count, cores):
+    result = random_result(seed, count)
+    metrics = schedule_metrics(result, cores)
+    assert metrics['processes'] == count
+    for key, expected in reference_metrics(result, cores).items():
+        assert metrics[key] == pytest.approx(expected), key
+
+def test_empty_schedule_has_every_metric(backend):
+    metrics = schedule_metrics(ScheduleResult(ProcessTable()))
+    assert set(metrics) == set(schedule_metrics(random_result(0, 5)))
+    assert metrics['processes'] == 0
+    assert metrics['avg_waiting'] == metrics['p99_waiting'] == metrics['cpu_utilization'] == 0
@@ -0,0 +1,509 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import random
+import signal
+import sys
+import threading
+import time
+
+import pytest
+
+import task1
+
+def write_script(directory, name, text):
+    """Create a small job script and return its path as a string"""
+    path = directory / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return str(path)
+
+def make_job(name, filename=None, **fields):
+    job = {'name': name, 'filename': filename or f"{name}.py", 'description': f"Job {name}"}
+    job.update(fields)
+    return job
+
+def fake_result(job, returncode=0, execution_time=0.0):
+    """A result record as the runners return it, without running anything"""
+    return {
+        'filename': job['filename'],
+        'returncode': returncode,
+        'stdout': f"{job['name']} done\n",
+        'stderr': '',
+        'execution_time': execution_time,
+        'error': None,
+        'usage': None,
+        'timed_out': False
+    }
+
+class RecordingRunner:
+    """run_job stand-in that records start order, start/finish events and the most jobs running at once"""
+
+    def __init__(self, duration=0.0, failing=()):
+        self.duration = duration
+        self.failing = set(failing)
+        self.started = []
+        self.events = []
+        self.running = 0
+        self.most_running = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, job):
+        with self.lock:
+            self.started.append(job['name'])
+            self.events.append(('start', job['name']))
+            self.running += 1
+            self.most_running = max(self.most_running, self.running)
+        time.sleep(self.duration)
+        with self.lock:
+            self.events.append(('finish', job['name']))
+            self.running -= 1
+        return fake_result(job, 1 if job['name'] in self.failing else 0, self.duration)
+
+@pytest.mark.parametrize('max_workers', [1, 2, 3])
+def test_parallel_execution_stays_within_the_worker_limit(max_workers):
+    jobs = [make_job(f"j{k}") for k in range(8)]
+    runner = RecordingRunner(duration=0.05)
+    results = task1.parallel_batch_execution(jobs, max_workers, runner)
+    assert runner.most_running == max_workers
+    assert sorted(runner.started) == sorted(job['name'] for job in jobs)
+    # Results come back in batch order whatever order the jobs finished in
+    assert [result['stdout'] for result in results] == [f"{job['name']} done\n" for job in jobs]
+    assert all(result['status'] == 'SUCCESS' for result in results)
+
+def test_parallel_execution_overlaps_jobs():
+    jobs = [make_job(f"j{k}") for k in range(4)]
+    start_time = time.time()
+    task1.parallel_batch_execution(jobs, 4, RecordingRunner(duration=0.2))
+    assert time.time() - start_time < 0.6
+
+def test_execute_python_file_captures_output_and_exit_code(tmp_path):
+    script = write_script(tmp_path, 'job.py', "import sys\nprint('out', sys.argv[1:])\n"
+                                              "print('err', file=sys.stderr)\nsys.exit(3)\n")
+    result = task1.execute_python_file(script, args=['a', 'b'])
+    assert result['returncode'] == 3
+    assert result['stdout'] == "out ['a', 'b']\n"
+    assert result['stderr'] == "err\n"
+    assert result['error'] is None
+
+def test_missing_file_is_an_error_not_an_exception(tmp_path):
+    result = task1.execute_python_file(str(tmp_path / 'missing.py'))
+    assert result['error'] == f"File '{tmp_path / 'missing.py'}' not found!"
+
+@pytest.mark.parametrize('argv', [['--workers', '2'], ['--parallel', '--workers', '0']])
+def test_bad_worker_options_are_rejected(monkeypatch, argv):
+    monkeypatch.setattr(sys, 'argv', ['task1.py', *argv])
+    with pytest.raises(SystemExit) as exit_info:
+        task1.main()
+    assert exit_info.value.code == 2
+
+def random_dag(seed, count=25):
+    """Jobs where each may depend on a few earlier ones, listed in shuffled order"""
+    rng = random.Random(seed)
+    jobs = [make_job(f"j{k}", depends_on=[f"j{d}" for d in rng.sample(range(k), min(k, rng.randint(0, 3)))])
+            for k in range(count)]
+    rng.shuffle(jobs)
+    return jobs
+
+@pytest.mark.parametrize('seed', range(5))
+@pytest.mark.parametrize('max_workers', [1, 4])
+def test_jobs_start_only_after_their_dependencies_finish(seed, max_workers):
+    jobs = random_dag(seed)
+    runner = RecordingRunner(duration=0.002)
+    results = task1.parallel_batch_execution(jobs, max_workers, runner)
+    position = {event: k for k, event in enumerate(runner.events)}
+    for job in jobs:
+        for dep in job['depends_on']:
+            assert position[('finish', dep)] < position[('start', job['name'])]
+    assert all(result['status'] == 'SUCCESS' for result in results)
+
+def test_topological_order_keeps_batch_order_among_ready_jobs():
+    jobs = [make_job('c', depends_on=['a']), make_job('a'), make_job('b'), make_job('d', depends_on=['c', 'b'])]
+    order, _, _ = task1.build_job_graph(jobs)
+    assert [jobs[index]['name'] for index in order] == ['a', 'c', 'b', 'd']
+
+@pytest.mark.parametrize('jobs, message', [
+    ([make_job('a', depends_on=['c']), make_job('b', depends_on=['a']), make_job('c', depends_on=['b']),
+      make_job('d')], "cycle detected among jobs: a, b, c"),
+    ([make_job('a', depends_on=['a'])], "cycle detected among jobs: a"),
+    ([make_job('a', depends_on=['x'])], "depends on unknown job 'x'"),
+    ([make_job('a'), make_job('a')], "Duplicate job name: a"),
+])
+def test_bad_dependency_graphs_are_rejected(jobs, message):
+    with pytest.raises(ValueError, match=message):
+        task1.build_job_graph(jobs)
+
+def test_dependents_of_a_failed_job_are_skipped():
+    jobs = [make_job('a'), make_job('b', depends_on=['a']), make_job('c', depends_on=['b']),
+            make_job('d'), make_job('e', depends_on=['d', 'c'])]
+    runner = RecordingRunner(failing={'a'})
+    results = task1.parallel_batch_execution(jobs, 2, runner)
+    assert [result['status'] for result in results] == ['FAILED', 'SKIPPED', 'SKIPPED', 'SUCCESS', 'SKIPPED']
+    assert results[1]['skip_reason'] == "dependency 'a' did not succeed"
+    assert results[2]['skip_reason'] == "dependency 'b' did not succeed"
+    assert sorted(runner.started) == ['a', 'd']
+
+def test_critical_path_follows_the_longest_chain():
+    jobs = [make_job('a'), make_job('b', depends_on=['a']), make_job('c'), make_job('d', depends_on=['b', 'c'])]
+    results = [fake_result(job, execution_time=time_) for job, time_ in zip(jobs, [1.0, 2.0, 2.5, 0.5])]
+    assert task1.critical_path(jobs, results) == (3.5, ['a', 'b', 'd'])
+
+@pytest.fixture
+def warm_pool():
+    """One warm worker, so consecutive jobs share an interpreter"""
+    pool = task1.create_warm_pool(1, 100)
+    pool.warm_up()
+    yield pool
+    pool.close()
+
+def test_warm_worker_runs_a_script_with_its_arguments(tmp_path, warm_pool):
+    script = write_script(tmp_path, 'job.py', "import sys\nprint(__name__, sys.argv[1:])\nsys.exit(4)\n")
+    result = warm_pool.run(script, args=['x'])
+    assert result['stdout'] == "__main__ ['x']\n"
+    assert result['returncode'] == 4
+
+def test_warm_worker_imports_modules_next_to_the_script(tmp_path, warm_pool):
+    # Regression: the script's directory was missing from sys.path, unlike 'python sub/job.py'
+    write_script(tmp_path, 'sub/helper.py', "VALUE = 42\n")
+    script = write_script(tmp_path, 'sub/job.py', "import helper\nprint(helper.VALUE)\n")
+    assert task1.execute_python_file(script)['stdout'] == "42\n"
+    result = warm_pool.run(script)
+    assert result['stderr'] == ''
+    assert result['stdout'] == "42\n"
+
+def test_warm_worker_state_does_not_leak_between_jobs(tmp_path, warm_pool):
+    write_script(tmp_path, 'first/helper.py', "VALUE = 'first'\n")
+    write_script(tmp_path, 'second/helper.py', "VALUE = 'second'\n")
+    first = write_script(tmp_path, 'first/job.py', (
+        "import os, signal, sys, helper\n"
+        "signal.signal(signal.SIGTERM, signal.SIG_IGN)\n"
+        "os.environ['LEAKED'] = '1'\n"
+        "sys.path.append('/nowhere')\n"
+        "os.chdir(os.path.dirname(__file__))\n"
+        "print(helper.VALUE)\n"))
+    second = write_script(tmp_path, 'second/job.py', (
+        "import os, signal, sys, helper\n"
+        "print(helper.VALUE, signal.getsignal(signal.SIGTERM) == signal.SIG_DFL,\n"
+        "      'LEAKED' in os.environ, '/nowhere' in sys.path, os.getcwd())\n"))
+    assert warm_pool.run(first)['stdout'] == "first\n"
+    assert warm_pool.run(second)['stdout'] == f"second True False False {os.getcwd()}\n"
+
+def test_warm_worker_timeout_interrupts_the_job(tmp_path, warm_pool):
+    spin = write_script(tmp_path, 'spin.py', "while True:\n    pass\n")
+    start_time = time.time()
+    result = warm_pool.run(spin, timeout=0.3)
+    assert result['timed_out'] and result['returncode'] != 0
+    assert time.time() - start_time < 5
+    ok = write_script(tmp_path, 'ok.py', "print('still here')\n")
+    assert warm_pool.run(ok)['stdout'] == "still here\n"
+
+def test_a_job_that_kills_its_worker_fails_without_hanging_the_pool(tmp_path, warm_pool):
+    die = write_script(tmp_path, 'die.py', "import os\nos._exit(3)\n")
+    result = warm_pool.run(die)
+    assert result['error'].startswith("EXCEPTION: a warm worker exited abruptly")
+    ok = write_script(tmp_path, 'ok.py', "print('replaced')\n")
+    assert warm_pool.run(ok)['stdout'] == "replaced\n"
+
+def test_streaming_keeps_a_bounded_tail_and_spills_everything(tmp_path, capsys):
+    script = write_script(tmp_path, 'many.py', "import sys\nfor i in range(100):\n    print(i)\n"
+                                               "print('oops', file=sys.stderr)\n")
+    job = make_job('many', script)
+    result = task1.execute_python_file_streaming(job, tail_lines=5, spill_dir=str(tmp_path / 'spill'))
+    assert result['returncode'] == 0 and result['streamed']
+    assert result['stdout'] == "".join(f"{i}\n" for i in range(95, 100))
+    assert result['stderr'] == "oops\n"
+    assert result['dropped_lines'] == 95
+    # Lines are forwarded live with the job name, and the spill files hold the full output
+    assert "[many] 0\n" in capsys.readouterr().out
+    stdout_path, stderr_path = result['spill_files']
+    with open(stdout_path) as f:
+        assert f.read() == "".join(f"{i}\n" for i in range(100))
+    with open(stderr_path) as f:
+        assert f.read() == "oops\n"
+
+def test_streaming_reads_a_huge_line_in_chunks(tmp_path):
+    script = write_script(tmp_path, 'wide.py', f"print('x' * {3 * task1.STREAM_READ_LIMIT})\n")
+    result = task1.execute_python_file_streaming(make_job('wide', script), tail_lines=2)
+    assert result['stdout'] == 'x' * task1.STREAM_READ_LIMIT + "\n"
+    assert result['dropped_lines'] == 2
+
+def test_each_retry_gets_its_own_spill_files(tmp_path):
+    # Regression: every attempt reopened the same spill file and truncated the earlier attempt's output
+    counter = tmp_path / 'count'
+    script = write_script(tmp_path, 'flaky.py', (
+        f"import os, sys\npath = {str(counter)!r}\n"
+        "count = int(open(path).read()) + 1 if os.path.exists(path) else 1\n"
+        "open(path, 'w').write(str(count))\n"
+        "print('attempt', count)\nsys.exit(0 if count == 3 else 1)\n"))
+    spill_dir = str(tmp_path / 'spill')
+    job = make_job('flaky', script, policy={'max_retries': 2, 'backoff_base': 0.01})
+    run_attempt = lambda job, policy, attempt: task1.execute_python_file_streaming(
+        job, 5, spill_dir, policy['timeout'], policy['kill_grace'], attempt)
+    result = task1.run_with_policy(job, run_attempt)
+    assert [entry['ok'] for entry in result['attempts']] == [False, False, True]
+    for attempt in (1, 2, 3):
+        with open(task1.spill_path(spill_dir, 'flaky', 'stdout', attempt)) as f:
+            assert f.read() == f"attempt {attempt}\n"
+    assert result['spill_files'][0] == task1.spill_path(spill_dir, 'flaky', 'stdout', 3)
+
+@pytest.mark.skipif(task1.resource is None, reason="resource accounting needs the resource module")
+def test_usage_is_measured_per_job(tmp_path):
+    busy = write_script(tmp_path, 'busy.py', "import time\nend = time.process_time() + 0.2\n"
+                                             "while time.process_time() < end:\n    pass\n")
+    usage = task1.execute_python_file(busy)['usage']
+    assert set(usage) == set(task1.USAGE_FIELDS)
+    assert usage['user_cpu'] + usage['system_cpu'] >= 0.15
+
+@pytest.mark.skipif(not os.path.exists('/proc/self/status'), reason="peak RSS is sampled from /proc")
+def test_peak_rss_is_the_jobs_own(tmp_path):
+    # Regression: ru_maxrss of a child includes the runner's RSS before exec
+    big = write_script(tmp_path, 'big.py', "import time\ndata = b'x' * (200 * 1024 * 1024)\ntime.sleep(0.2)\n")
+    tiny = write_script(tmp_path, 'tiny.py', "import time\ntime.sleep(0.1)\n")
+    # Make the runner itself big, so a job reporting the runner's size stands out
+    ballast = b'x' * (200 * 1024 * 1024)
+    big_rss = task1.execute_python_file(big)['usage']['max_rss_kb']
+    tiny_rss = task1.execute_python_file(tiny)['usage']['max_rss_kb']
+    del ballast
+    assert big_rss >= 200 * 1024
+    assert tiny_rss < 100 * 1024
+
+def test_usage_totals_sum_counters_and_take_the_largest_rss():
+    jobs = [make_job(name) for name in 'abc']
+    usages = [dict(zip(task1.USAGE_FIELDS, values)) for values in
+              [(1.0, 0.5, 300, 1, 2, 3, 4), (0.2, 0.1, 900, 1, 1, 1, 1), (3.0, 0.0, 100, 0, 0, 0, 0)]]
+    results = [dict(fake_result(job), usage=usage) for job, usage in zip(jobs, usages)]
+    results.append(fake_result(make_job('d')))
+    totals = task1.usage_totals(results)
+    assert totals['max_rss_kb'] == 900
+    assert totals['user_cpu'] == pytest.approx(4.2)
+    assert totals['block_out'] == 5
+    assert [job['name'] for job, _ in task1.top_consumers(jobs + [make_job('d')], results, 2)] == ['c', 'a']
+
+def test_timeout_terminates_the_job(tmp_path):
+    script = write_script(tmp_path, 'slow.py', "import time\nprint('started', flush=True)\ntime.sleep(30)\n")
+    start_time = time.time()
+    result = task1.execute_python_file(script, timeout=0.3)
+    assert result['timed_out']
+    assert result['returncode'] == -signal.SIGTERM
+    assert result['stdout'] == "started\n"
+    assert time.time() - start_time < 5
+
+def test_timeout_escalates_to_sigkill_after_the_grace_period(tmp_path):
+    script = write_script(tmp_path, 'stubborn.py', "import signal, time\n"
+                                                   "signal.signal(signal.SIGTERM, signal.SIG_IGN)\n"
+                                                   "time.sleep(30)\n")
+    start_time = time.time()
+    result = task1.execute_python_file(script, timeout=0.3, kill_grace=0.3)
+    assert result['timed_out']
+    assert result['returncode'] == -signal.SIGKILL
+    assert time.time() - start_time < 5
+
+@pytest.mark.skipif(not hasattr(os, 'killpg'), reason="process groups are POSIX only")
+def test_timeout_kills_processes_the_job_started(tmp_path):
+    # Without signalling the whole group the grandchild keeps the pipes open for its full sleep
+    script = write_script(tmp_path, 'spawner.py', "import subprocess, sys, time\n"
+                                                  "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])\n"
+                                                  "time.sleep(30)\n")
+    start_time = time.time()
+    result = task1.execute_python_file(script, timeout=0.3)
+    assert result['timed_out']
+    assert time.time() - start_time < 5
+
+def test_failed_attempts_are_retried_until_one_succeeds():
+    outcomes = iter([1, 1, 0])
+    job = make_job('flaky', policy={'max_retries': 3, 'backoff_base': 0.01})
+    result = task1.run_with_policy(job, lambda job, policy, attempt: fake_result(job, next(outcomes)))
+    assert [(entry['attempt'], entry['ok']) for entry in result['attempts']] == [(1, False), (2, False), (3, True)]
+    assert result['returncode'] == 0
+
+def test_retries_stop_at_the_policy_limit():
+    calls = []
+    job = make_job('broken', policy={'max_retries': 2, 'backoff_base': 0.01})
+    result = task1.run_with_policy(job, lambda job, policy, attempt: calls.append(attempt) or fake_result(job, 1))
+    assert calls == [1, 2, 3]
+    assert not any(entry['ok'] for entry in result['attempts'])
+
+def test_backoff_doubles_up_to_the_cap_within_the_jitter():
+    policy = dict(task1.DEFAULT_JOB_POLICY, backoff_base=1.0, backoff_max=5.0, jitter=0.5)
+    for retry, delay in [(1, 1.0), (2, 2.0), (3, 4.0), (4, 5.0), (10, 5.0)]:
+        for _ in range(50):
+            assert 0.5 * delay <= task1.backoff_delay(policy, retry) <= 1.5 * delay
+    exact = dict(policy, jitter=0.0)
+    assert [task1.backoff_delay(exact, retry) for retry in (1, 2, 3, 4)] == [1.0, 2.0, 4.0, 5.0]
+
+def test_job_policy_overrides_the_batch_default():
+    default_policy = dict(task1.DEFAULT_JOB_POLICY, timeout=10.0, max_retries=1)
+    policy = task1.job_policy(make_job('a', policy={'timeout': 2.0}), default_policy)
+    assert policy['timeout'] == 2.0 and policy['max_retries'] == 1
+
+class CountingRunner:
+    """run_job stand-in that counts how often each job really ran"""
+
+    def __init__(self, returncode=0):
+        self.returncode = returncode
+        self.calls = 0
+
+    def __call__(self, job):
+        self.calls += 1
+        return fake_result(job, self.returncode, execution_time=0.5)
+
+def test_unchanged_job_is_served_from_the_cache(tmp_path):
+    script = write_script(tmp_path, 'job.py', "print('hi')\n")
+    job = make_job('job', script, args=['1'])
+    runner = CountingRunner()
+    cache_dir = str(tmp_path / 'cache')
+    first = task1.run_cached(job, runner, cache_dir, 10 ** 6)
+    second = task1.run_cached(job, runner, cache_dir, 10 ** 6)
+    assert runner.calls == 1
+    assert not first.get('cached') and second['cached']
+    assert second['stdout'] == first['stdout'] and second['original_time'] == 0.5
+
+def test_changing_the_script_arguments_or_inputs_misses_the_cache(tmp_path):
+    script = write_script(tmp_path, 'job.py', "print('hi')\n")
+    data = tmp_path / 'data.txt'
+    data.write_text("1")
+    job = make_job('job', script, inputs=[str(data)])
+    key = task1.cache_key(job)
+    assert task1.cache_key(dict(job, args=['x'])) != key
+    data.write_text("2")
+    assert task1.cache_key(job) != key
+    key = task1.cache_key(job)
+    write_script(tmp_path, 'job.py', "print('changed')\n")
+    assert task1.cache_key(job) != key
+    data.unlink()
+    assert task1.cache_key(job) != task1.cache_key(dict(job, inputs=[]))
+
+def test_failures_are_not_cached(tmp_path):
+    job = make_job('job', write_script(tmp_path, 'job.py', "pass\n"))
+    runner = CountingRunner(returncode=1)
+    for _ in range(2):
+        task1.run_cached(job, runner, str(tmp_path / 'cache'), 10 ** 6)
+    assert runner.calls == 2
+
+def test_streamed_results_that_dropped_lines_are_not_cached(tmp_path, capsys):
+    # Regression: the --tail-lines buffer was cached and later replayed as the job's whole output
+    script = write_script(tmp_path, 'many.py', "for i in range(50):\n    print(i)\n")
+    job = make_job('many', script)
+    cache_dir = str(tmp_path / 'cache')
+    task1.run_cached(job, lambda job: task1.execute_python_file_streaming(job, tail_lines=5), cache_dir, 10 ** 6)
+    result = task1.run_cached(job, task1.run_job_in_subprocess, cache_dir, 10 ** 6)
+    assert not result.get('cached')
+    assert result['stdout'] == "".join(f"{i}\n" for i in range(50))
+    # A streamed result that kept every line is complete, so it can be cached
+    short = make_job('short', write_script(tmp_path, 'short.py', "print('all of it')\n"))
+    task1.run_cached(short, lambda job: task1.execute_python_file_streaming(job, tail_lines=5), cache_dir, 10 ** 6)
+    assert task1.run_cached(short, CountingRunner(), cache_dir, 10 ** 6)['stdout'] == "all of it\n"
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    jobs = [make_job(name, write_script(tmp_path, f"{name}.py", f"print({name!r})\n")) for name in 'abcd']
+    runner = CountingRunner()
+    task1.run_cached(jobs[0], runner, cache_dir, 10 ** 6)
+    entry_size = os.path.getsize(os.path.join(cache_dir, f"{task1.cache_key(jobs[0])}.json"))
+    max_bytes = 3 * entry_size + entry_size // 2
+    for job in jobs[1:3]:
+        time.sleep(0.01)
+        task1.run_cached(job, runner, cache_dir, max_bytes)
+    # Using a's entry makes b the oldest, so storing d evicts b
+    time.sleep(0.01)
+    assert task1.run_cached(jobs[0], runner, cache_dir, max_bytes)['cached']
+    time.sleep(0.01)
+    task1.run_cached(jobs[3], runner, cache_dir, max_bytes)
+    cached = sorted(name[:-len('.json')] for name in os.listdir(cache_dir))
+    assert cached == sorted(task1.cache_key(job) for job in (jobs[0], jobs[2], jobs[3]))
+
+def test_one_owners_jobs_leave_in_priority_then_arrival_order():
+    queue = task1.FairShareQueue(aging_rate=0.0)
+    for index, priority in enumerate([3, 1, 2, 1]):
+        queue.push(index, make_job(f"j{index}", priority=priority), now=0.0)
+    assert [queue.pop()[0] for _ in range(4)] == [1, 3, 2, 0]
+    assert len(queue) == 0
+
+def test_waiting_jobs_age_ahead_of_newer_urgent_ones():
+    for aging_rate, expected in [(0.1, 0), (0.0, 1)]:
+        queue = task1.FairShareQueue(aging_rate=aging_rate)
+        queue.push(0, make_job('old', priority=5), now=0.0)
+        queue.push(1, make_job('new', priority=0), now=100.0)
+        assert queue.pop()[0] == expected
+
+def test_owners_are_served_in_proportion_to_their_weights():
+    queue = task1.FairShareQueue({'heavy': 2.0, 'light': 1.0}, aging_rate=0.0)
+    for index in range(60):
+        owner = 'heavy' if index % 2 else 'light'
+        queue.push(index, make_job(f"j{index}", owner=owner), now=0.0)
+    served = {'heavy': 0, 'light': 0}
+    for _ in range(30):
+        _, owner = queue.pop()
+        queue.charge(owner, 1.0)
+        served[owner] += 1
+    assert served == {'heavy': 20, 'light': 10}
+
+def test_a_new_owner_starts_level_with_the_least_served_owner():
+    queue = task1.FairShareQueue(aging_rate=0.0)
+    queue.push(0, make_job('a0', owner='a'), now=0.0)
+    queue.push(1, make_job('a1', owner='a'), now=0.0)
+    _, owner = queue.pop()
+    queue.charge(owner, 50.0)
+    # b arrives late; it must not get 50 seconds of catching up before a runs again
+    for index in range(2, 5):
+        queue.push(index, make_job(f"b{index}", owner='b'), now=0.0)
+    assert queue.virtual_time['b'] == queue.virtual_time['a'] == 50.0
+
+def test_batch_dispatches_from_the_fair_share_queue():
+    jobs = [make_job('low', priority=5), make_job('high', priority=0), make_job('mid', priority=2)]
+    runner = RecordingRunner()
+    results = task1.parallel_batch_execution(jobs, 1, runner, task1.FairShareQueue(aging_rate=0.0))
+    assert runner.started == ['high', 'mid', 'low']
+    assert all(result['owner'] == 'default' and result['queue_delay'] >= 0 for result in results)
+
+def journal_lines(path, *entries):
+    with open(path, 'w') as f:
+        for entry in entries:
+            f.write(entry if isinstance(entry, str) else json.dumps(entry) + "\n")
+
+def finish_entry(job, status='SUCCESS'):
+    return {'event': 'job_finish', 'job': job, 'status': status, 'returncode': 0, 'execution_time': 1.5}
+
+def test_interrupted_batch_resumes_without_rerunning_completed_jobs(tmp_path):
+    path = str(tmp_path / 'journal.jsonl')
+    jobs = [make_job('a'), make_job('b', depends_on=['a']), make_job('c'), make_job('d', depends_on=['c'])]
+
+    # First run: c fails and the batch never records batch_complete, as if it had been killed
+    journal = task1.JobJournal(path)
+    journal.record('batch_start', jobs=[job['name'] for job in jobs])
+    task1.parallel_batch_execution(jobs, 2, RecordingRunner(failing={'c'}), journal=journal)
+    journal.close()
+
+    completed = task1.load_journal(path)
+    assert sorted(completed) == ['a', 'b']
+
+    journal = task1.JobJournal(path, resume=True)
+    runner = RecordingRunner()
+    results = task1.parallel_batch_execution(jobs, 2, runner, journal=journal, completed=completed)
+    journal.record('batch_complete')
+    journal.close()
+    assert sorted(runner.started) == ['c', 'd']
+    assert [bool(result.get('resumed')) for result in results] == [True, True, False, False]
+    assert all(result['status'] == 'SUCCESS' for result in results)
+    assert task1.load_journal(path) is None
+
+def test_journal_keeps_only_the_last_unfinished_batch(tmp_path):
+    path = str(tmp_path / 'journal.jsonl')
+    journal_lines(path, {'event': 'batch_start'}, finish_entry('old'), {'event': 'batch_complete'},
+                  {'event': 'batch_start'}, finish_entry('a'), finish_entry('b'), finish_entry('b', 'FAILED'),
+                  {'event': 'batch_resume'}, finish_entry('c'))
+    assert sorted(task1.load_journal(path)) == ['a', 'c']
+
+def test_a_torn_last_line_is_ignored(tmp_path):
+    path = str(tmp_path / 'journal.jsonl')
+    journal_lines(path, {'event': 'batch_start'}, finish_entry('a'), '{"event": "job_fin')
+    completed = task1.load_journal(path)
+    assert list(completed) == ['a']
+    assert task1.resumed_result(make_job('a'), completed['a'])['execution_time'] == 1.5
+
+def test_no_journal_means_nothing_to_resume(tmp_path):
+    assert task1.load_journal(str(tmp_path / 'missing.jsonl')) is None
+    path = str(tmp_path / 'journal.jsonl')
+    journal_lines(path, {'event': 'batch_start'}, finish_entry('a'), {'event': 'batch_complete'})
+    assert task1.load_journal(path) is None
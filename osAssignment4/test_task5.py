@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+
+import random
+
+import pytest
+
+from process_table import ProcessTable
+from task5 import CPUScheduler
+
+def random_rows(seed, count, max_arrival=30, max_burst=10, max_priority=5):
+    """(pid, arrival, burst, priority) rows with plenty of ties and idle gaps"""
+    rng = random.Random(seed)
+    return [(pid, rng.randint(0, max_arrival), rng.randint(1, max_burst), rng.randint(1, max_priority))
+            for pid in range(1, count + 1)]
+
+def scheduler_for(rows):
+    scheduler = CPUScheduler()
+    scheduler.processes = ProcessTable.from_rows(rows)
+    return scheduler
+
+def reference_non_preemptive(rows, key):
+    """The original linear-scan loop: at each step run the arrived process with the smallest key,
+    earliest in the table on ties; returns (start, completion) lists in table order"""
+    n = len(rows)
+    done = [False] * n
+    start = [0] * n
+    completion = [0] * n
+    current_time = 0
+    completed = 0
+    while completed < n:
+        available = [i for i in range(n) if rows[i][1] <= current_time and not done[i]]
+        if not available:
+            current_time += 1
+            continue
+        i = min(available, key=lambda i: key(rows[i]))
+        start[i] = current_time
+        completion[i] = current_time + rows[i][2]
+        current_time = completion[i]
+        done[i] = True
+        completed += 1
+    return start, completion
+
+@pytest.mark.parametrize('seed', range(20))
+@pytest.mark.parametrize('count', [1, 8, 60])
+def test_sjf_matches_linear_scan(seed, count):
+    rows = random_rows(seed, count)
+    scheduler = scheduler_for(rows)
+    result, _ = scheduler.non_preemptive_schedule(scheduler.processes.burst)
+    start, completion = reference_non_preemptive(rows, key=lambda row: row[2])
+    assert list(result.start) == start
+    assert list(result.completion) == completion
+
+@pytest.mark.parametrize('seed', range(20))
+@pytest.mark.parametrize('count', [1, 8, 60])
+def test_priority_matches_linear_scan(seed, count):
+    rows = random_rows(seed, count)
+    scheduler = scheduler_for(rows)
+    result, _ = scheduler.non_preemptive_schedule(scheduler.processes.priority)
+    start, completion = reference_non_preemptive(rows, key=lambda row: row[3])
+    assert list(result.start) == start
+    assert list(result.completion) == completion
+
+def test_non_preemptive_gantt_covers_every_process_once():
+    rows = random_rows(7, 40)
+    scheduler = scheduler_for(rows)
+    _, gantt_chart = scheduler.non_preemptive_schedule(scheduler.processes.burst)
+    slices = list(gantt_chart)
+    assert sorted(int(label[1:]) for label, _, _ in slices) == sorted(row[0] for row in rows)
+    assert all(end - begin == rows[int(label[1:]) - 1][2] for label, begin, end in slices)
+
+def reference_round_robin(rows, time_quantum):
+    """The original list-based Round Robin loop; returns (start, completion) lists in table order"""
+    n = len(rows)
+    remaining = [row[2] for row in rows]
+    queued = [False] * n
+    start = [None] * n
+    completion = [0] * n
+    queue = []
+    current_time = 0
+    completed = 0
+    
+    def admit():
+        for i in range(n):
+            if rows[i][1] <= current_time and not queued[i] and remaining[i] > 0 and i not in queue:
+                queue.append(i)
+                queued[i] = True
+    
+    while completed < n:
+        admit()
+        if not queue:
+            current_time += 1
+            continue
+        i = queue.pop(0)
+        if start[i] is None:
+            start[i] = current_time
+        execution_time = min(time_quantum, remaining[i])
+        remaining[i] -= execution_time
+        current_time += execution_time
+        admit()
+        if remaining[i] > 0:
+            queue.append(i)
+        else:
+            completion[i] = current_time
+            completed += 1
+    return start, completion
+
+@pytest.mark.parametrize('seed', range(20))
+@pytest.mark.parametrize('count', [1, 8, 60])
+@pytest.mark.parametrize('time_quantum', [1, 3, 20])
+def test_round_robin_matches_list_queue(seed, count, time_quantum):
+    rows = random_rows(seed, count)
+    result, _ = scheduler_for(rows).round_robin_schedule(time_quantum)
+    start, completion = reference_round_robin(rows, time_quantum)
+    assert list(result.start) == start
+    assert list(result.completion) == completion
+
+def assert_valid_schedule(rows, result, gantt_chart):
+    """Every process completes, runs exactly its burst, never before arrival, and the CPU runs one at a time"""
+    slices = sorted(gantt_chart, key=lambda slice_: slice_[1])
+    for (_, _, end), (_, begin, _) in zip(slices, slices[1:]):
+        assert end <= begin
+    ran = {row[0]: 0 for row in rows}
+    for label, begin, end in slices:
+        pid = int(label[1:])
+        assert begin >= rows[pid - 1][1]
+        ran[pid] += end - begin
+    assert ran == {row[0]: row[2] for row in rows}
+    for i, row in enumerate(rows):
+        assert result.completion[i] >= row[1] + row[2]
+        assert row[1] <= result.start[i] < result.completion[i]
+
+@pytest.mark.parametrize('seed', range(20))
+@pytest.mark.parametrize('quanta, boost_interval', [([1], None), ([2, 4, 8], None), ([2, 4, 8], 25), ([1, 3], 1)])
+def test_mlfq_completes_every_process_and_conserves_burst(seed, quanta, boost_interval):
+    rows = random_rows(seed, 40)
+    result, gantt_chart, finished_per_level = scheduler_for(rows).mlfq_schedule(quanta, boost_interval)
+    assert_valid_schedule(rows, result, gantt_chart)
+    assert sum(finished_per_level) == len(rows)
+
+def test_mlfq_with_one_level_is_round_robin():
+    rows = random_rows(3, 30)
+    result, _, _ = scheduler_for(rows).mlfq_schedule([4])
+    start, completion = reference_round_robin(rows, 4)
+    assert list(result.start) == start
+    assert list(result.completion) == completion
+
+def test_mlfq_boost_returns_a_demoted_process_to_the_top_level():
+    rows = [(1, 0, 10, 1)]
+    _, _, without_boost = scheduler_for(rows).mlfq_schedule([1, 100])
+    _, _, with_boost = scheduler_for(rows).mlfq_schedule([1, 100], boost_interval=1)
+    assert without_boost == [0, 1]
+    assert with_boost == [1, 0]
+
+def test_mlfq_boost_stops_short_arrivals_starving_a_long_job():
+    # One long job, then a one-unit job arriving every time unit for a while
+    rows = [(1, 0, 20, 1)] + [(pid, pid - 2, 1, 1) for pid in range(2, 80)]
+    _, starved, _ = scheduler_for(rows).mlfq_schedule([1, 4])
+    _, boosted, _ = scheduler_for(rows).mlfq_schedule([1, 4], boost_interval=10)
+    long_job_runs = lambda gantt_chart: [begin for label, begin, _ in gantt_chart if label == 'P1' and 1 <= begin < 70]
+    assert long_job_runs(starved) == []
+    assert len(long_job_runs(boosted)) >= 6
+
+@pytest.mark.parametrize('quanta', [[], [0], [2, -1]])
+def test_mlfq_rejects_levels_without_a_positive_quantum(quanta):
+    with pytest.raises(ValueError):
+        scheduler_for(random_rows(1, 5)).mlfq_schedule(quanta)
+
+def test_mlfq_menu_reports_bad_quanta(capsys):
+    assert scheduler_for(random_rows(1, 5)).mlfq_scheduling([4, 0], None) is None
+    assert "Could not run MLFQ simulation" in capsys.readouterr().out
+
+def reference_preemptive(rows, key):
+    """One time unit at a time: run the arrived process with the smallest (key, arrival, table position);
+    key(row, remaining) sees the remaining burst, so SRTF is key=lambda row, left: left"""
+    n = len(rows)
+    remaining = [row[2] for row in rows]
+    start = [None] * n
+    completion = [0] * n
+    current_time = 0
+    completed = 0
+    while completed < n:
+        available = [i for i in range(n) if rows[i][1] <= current_time and remaining[i] > 0]
+        if not available:
+            current_time += 1
+            continue
+        i = min(available, key=lambda i: (key(rows[i], remaining[i]), rows[i][1], i))
+        if start[i] is None:
+            start[i] = current_time
+        remaining[i] -= 1
+        current_time += 1
+        if remaining[i] == 0:
+            completion[i] = current_time
+            completed += 1
+    return start, completion
+
+@pytest.mark.parametrize('seed', range(20))
+@pytest.mark.parametrize('count', [1, 8, 60])
+def test_srtf_matches_tick_by_tick_reference(seed, count):
+    rows = random_rows(seed, count)
+    result, gantt_chart = scheduler_for(rows).preemptive_schedule()
+    start, completion = reference_preemptive(rows, key=lambda row, left: left)
+    assert list(result.start) == start
+    assert list(result.completion) == completion
+    assert_valid_schedule(rows, result, gantt_chart)
+
+@pytest.mark.parametrize('seed', range(20))
+@pytest.mark.parametrize('count', [1, 8, 60])
+def test_preemptive_priority_matches_tick_by_tick_reference(seed, count):
+    rows = random_rows(seed, count)
+    scheduler = scheduler_for(rows)
+    result, gantt_chart = scheduler.preemptive_schedule(scheduler.processes.priority)
+    start, completion = reference_preemptive(rows, key=lambda row, left: row[3])
+    assert list(result.start) == start
+    assert list(result.completion) == completion
+    assert_valid_schedule(rows, result, gantt_chart)
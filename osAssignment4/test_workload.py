@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+
+import pytest
+
+from workload import load_trace, record_field
+
+@pytest.mark.parametrize('value, expected', [
+    ('1792352607021502001', 1792352607021502001),
+    (1792352607021502001, 1792352607021502001),
+    ('9223372036854775807', 2 ** 63 - 1),
+    (' 12 ', 12),
+    ('3.7', 3),
+    ('1e3', 1000),
+    (2.9, 2),
+])
+def test_record_field_parses_integers_exactly(value, expected):
+    assert record_field({'pid': value}, 'pid', 'line 2') == expected
+
+@pytest.mark.parametrize('value', ['inf', '-inf', 'nan', float('inf'), float('nan'),
+                                   '9223372036854775808', -2 ** 63 - 1, '1e30', 'x', [1]])
+def test_record_field_rejects_values_a_process_table_cannot_hold(value):
+    with pytest.raises(ValueError, match="line 2: 'pid'"):
+        record_field({'pid': value}, 'pid', 'line 2')
+
+def test_load_trace_reports_the_line_of_a_bad_value(tmp_path):
+    path = tmp_path / 'trace.csv'
+    path.write_text("pid,arrival_time,burst_time\n1,0,5\n2,nan,3\n")
+    with pytest.raises(ValueError, match="line 3: 'arrival_time' is not finite"):
+        load_trace(str(path))
+
+def test_load_trace_keeps_large_pids(tmp_path):
+    path = tmp_path / 'trace.jsonl'
+    path.write_text('{"pid": "1792352607021502001", "arrival": 0, "burst": 4}\n')
+    assert list(load_trace(str(path)).pid) == [1792352607021502001]
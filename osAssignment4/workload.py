@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+
+import csv
+import json
+import math
+import os
+import random
+
+from process_table import ProcessTable
+
+BURST_DISTRIBUTIONS = ['exponential', 'pareto', 'bimodal']
+
+# Accepted column names in trace files, first match wins
+TRACE_COLUMNS = {
+    'pid': ('pid', 'id'),
+    'arrival': ('arrival_time', 'arrival'),
+    'burst': ('burst_time', 'burst'),
+    'priority': ('priority',)
+}
+
+def trace_format(path):
+    """Work out whether a trace file is CSV, JSON lines or a JSON document from its extension"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        return 'csv'
+    if extension in ('.jsonl', '.ndjson'):
+        return 'jsonl'
+    if extension == '.json':
+        return 'json'
+    raise ValueError(f"Unsupported trace file type '{extension}' (use .csv, .jsonl or .json)")
+
+# Process table columns are int64 arrays
+INT64_MIN, INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+def record_field(record, field, location, default=None):
+    """Read one process attribute from a trace record under any of its accepted names"""
+    for name in TRACE_COLUMNS[field]:
+        value = record.get(name)
+        if value not in (None, ''):
+            try:
+                # Parse integers exactly; going through float would round large values
+                number = int(value)
+            except (TypeError, ValueError, OverflowError):
+                try:
+                    number = float(value)
+                except (TypeError, ValueError):
+                    raise ValueError(f"{location}: '{name}' is not a number: {value!r}")
+                if not math.isfinite(number):
+                    raise ValueError(f"{location}: '{name}' is not finite: {value!r}")
+                number = int(number)
+            if not INT64_MIN <= number <= INT64_MAX:
+                raise ValueError(f"{location}: '{name}' does not fit in 64 bits: {value!r}")
+            return number
+    if default is None:
+        raise ValueError(f"{location}: missing '{TRACE_COLUMNS[field][0]}'")
+    return default
+
+def iter_json_lines(f):
+    """(location, record) pairs of a JSON lines file, skipping blank lines"""
+    for line_number, line in enumerate(f, 1):
+        if line.strip():
+            try:
+                yield f"line {line_number}", json.loads(line)
+            except ValueError as e:
+                raise ValueError(f"line {line_number}: invalid JSON ({e})")
+
+def iter_trace_records(f, path):
+    """(location, record) pairs of a trace file, where location names the line or array entry"""
+    file_format = trace_format(path)
+    if file_format == 'csv':
+        # Header is line 1, so data starts on line 2
+        return ((f"line {n}", record) for n, record in enumerate(csv.DictReader(f), 2))
+    
+    if file_format == 'json':
+        # A .json file is either one array of records or JSON lines
+        first = f.read(1)
+        while first.isspace():
+            first = f.read(1)
+        f.seek(0)
+        if first == '[':
+            try:
+                records = json.load(f)
+            except ValueError as e:
+                raise ValueError(f"invalid JSON ({e})")
+            return ((f"record {n}", record) for n, record in enumerate(records, 1))
+    return iter_json_lines(f)
+
+def iter_trace_chunks(path, chunk_size=100_000):
+    """Stream a trace file as ProcessTable chunks of at most chunk_size processes.
+    
+    CSV and JSON lines files are read a record at a time; a .json file
+    holding one array is parsed whole.
+    """
+    chunk = ProcessTable()
+    next_pid = 1
+    with open(path, newline='') as f:
+        for location, record in iter_trace_records(f, path):
+            if not isinstance(record, dict):
+                raise ValueError(f"{location}: expected an object of process fields, "
+                                 f"got {type(record).__name__}")
+            pid = record_field(record, 'pid', location, default=next_pid)
+            arrival = record_field(record, 'arrival', location)
+            burst = record_field(record, 'burst', location)
+            priority = record_field(record, 'priority', location, default=0)
+            if arrival < 0 or burst <= 0:
+                raise ValueError(f"{location}: arrival must be >= 0 and burst > 0")
+            chunk.append(pid, arrival, burst, priority)
+            next_pid = pid + 1
+
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = ProcessTable()
+
+    if len(chunk):
+        yield chunk
+
+def load_trace(path, chunk_size=100_000):
+    """Load a whole CSV, JSONL or JSON trace file into one ProcessTable"""
+    table = ProcessTable()
+    for chunk in iter_trace_chunks(path, chunk_size):
+        table.extend(chunk)
+    return table
+
+def generate_workload(count, arrival_rate=0.2, burst_distribution='exponential', mean_burst=5.0,
+                      pareto_alpha=1.5, bimodal_short=2.0, bimodal_long=20.0, short_fraction=0.8,
+                      max_priority=5, seed=None, chunk_size=100_000):
+    """Stream a synthetic workload as ProcessTable chunks.
+
+    Arrivals are a Poisson process with arrival_rate processes per time unit,
+    rounded down to whole time units. Bursts are at least 1 and drawn from:
+      exponential - exponential with mean mean_burst
+      pareto      - heavy-tailed Pareto with shape pareto_alpha, scaled to mean mean_burst
+      bimodal     - exponential around bimodal_short (short_fraction of processes) or bimodal_long
+    The same seed always produces the same workload.
+    """
+    if burst_distribution not in BURST_DISTRIBUTIONS:
+        raise ValueError(f"Unknown burst distribution '{burst_distribution}'")
+    if arrival_rate <= 0 or mean_burst <= 0:
+        raise ValueError("arrival_rate and mean_burst must be positive")
+    if burst_distribution == 'pareto' and pareto_alpha <= 1:
+        raise ValueError("pareto_alpha must be greater than 1 for the mean to exist")
+
+    rng = random.Random(seed)
+    pareto_scale = mean_burst * (pareto_alpha - 1) / pareto_alpha
+
+    def next_burst():
+        if burst_distribution == 'exponential':
+            value = rng.expovariate(1 / mean_burst)
+        elif burst_distribution == 'pareto':
+            value = pareto_scale * rng.paretovariate(pareto_alpha)
+        elif rng.random() < short_fraction:
+            value = rng.expovariate(1 / bimodal_short)
+        else:
+            value = rng.expovariate(1 / bimodal_long)
+        return max(1, round(value))
+
+    clock = 0.0
+    chunk = ProcessTable()
+    for pid in range(1, count + 1):
+        clock += rng.expovariate(arrival_rate)
+        chunk.append(pid, int(clock), next_burst(), rng.randint(1, max_priority))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = ProcessTable()
+
+    if len(chunk):
+        yield chunk
+
+def write_trace(path, chunks):
+    """Write ProcessTable chunks to a CSV or JSONL trace file, returning the process count"""
+    fmt = trace_format(path)
+    written = 0
+    with open(path, 'w', newline='') as f:
+        if fmt == 'csv':
+            writer = csv.writer(f)
+            writer.writerow(['pid', 'arrival_time', 'burst_time', 'priority'])
+        for chunk in chunks:
+            rows = zip(chunk.pid, chunk.arrival, chunk.burst, chunk.priority)
+            if fmt == 'csv':
+                writer.writerows(rows)
+            else:
+                f.writelines(json.dumps({'pid': pid, 'arrival_time': arrival, 'burst_time': burst,
+                                         'priority': priority}) + "\n"
+                             for pid, arrival, burst, priority in rows)
+            written += len(chunk)
+    return written